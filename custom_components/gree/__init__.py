@@ -3,10 +3,11 @@ import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.const import Platform, CONF_HOST, CONF_PORT
+from homeassistant.const import Platform, CONF_HOST, CONF_MAC, CONF_PORT
 
 from .const import DOMAIN
 from .coordinator import GreeClimateUpdateCoordinator
+from .store import async_get_key_store
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -15,6 +16,7 @@ PLATFORMS: list[Platform] = [
     Platform.CLIMATE,
     # Platform.SELECT, # REMOVED: This was causing the error as select.py was deleted
     Platform.SWITCH,
+    Platform.SENSOR, # Diagnostic telemetry, disabled by default
 ]
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -27,15 +29,40 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     coordinator = GreeClimateUpdateCoordinator(hass, entry)
 
+    if coordinator.async_adopt_handshake():
+        # Just added by the config flow: it already bound and polled the unit
+        hass.data[DOMAIN][entry.entry_id] = coordinator
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        entry.async_on_unload(entry.add_update_listener(options_update_listener))
+        return True
+
+    if coordinator.fast_start and coordinator.device is not None:
+        # Don't hold up startup on units that are off the network: come up from
+        # the last known state and poll in the background.
+        await coordinator.async_restore_last_state()
+        hass.data[DOMAIN][entry.entry_id] = coordinator
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        entry.async_on_unload(entry.add_update_listener(options_update_listener))
+        entry.async_create_background_task(
+            hass, coordinator.async_background_first_refresh(), f"{DOMAIN} first refresh {entry.title}"
+        )
+        return True
+
     # Perform the first refresh to populate data and check connectivity.
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        await coordinator.async_shutdown() # Don't leak our share of the transport pool
+        raise
 
     # Check if the coordinator's device object was initialized and if the first update succeeded
     if coordinator.device is None: # Check if greeclimate library failed to load in coordinator
         _LOGGER.error("Greeclimate library failed to load for %s. Setup aborted.", coordinator.device_name if hasattr(coordinator, 'device_name') else entry.title)
+        await coordinator.async_shutdown()
         return False
     if not coordinator.last_update_success:
         _LOGGER.error("Initial update failed for %s. Setup aborted.", coordinator.device_name)
+        await coordinator.async_shutdown()
         return False
 
     hass.data[DOMAIN][entry.entry_id] = coordinator # Store only coordinator
@@ -48,9 +75,15 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.info("Unloading Gree device %s", entry.title)
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: GreeClimateUpdateCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown() # Releases the shared transport pool
     return unload_ok
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the stored device key of a removed entry."""
+    mac = entry.data[CONF_MAC].replace(":", "").replace("-", "").lower()
+    await async_get_key_store(hass).async_remove(mac)
+
 async def options_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     _LOGGER.info("Configuration options updated for %s, reloading entry.", entry.title)
     await hass.config_entries.async_reload(entry.entry_id)
@@ -0,0 +1,74 @@
+"""Per-device circuit breaker for unreachable Gree units.
+
+A unit that is unplugged costs a full request timeout on every poll, and
+commands queued behind that poll wait as well. After a few consecutive
+failures the breaker opens: polls and commands are refused without touching
+the network until a backoff has passed, which doubles each time the device
+stays silent. A single cheap probe then decides whether to close it again.
+"""
+from typing import Optional
+
+from .const import BREAKER_BASE_BACKOFF, BREAKER_FAILURE_THRESHOLD, BREAKER_MAX_BACKOFF
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class GreeCircuitBreaker:
+    """Tracks consecutive failures of one device on the event loop clock."""
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        base_backoff: float = BREAKER_BASE_BACKOFF,
+        max_backoff: float = BREAKER_MAX_BACKOFF,
+    ) -> None:
+        self._failure_threshold = max(1, failure_threshold)
+        self._base_backoff = base_backoff
+        self._max_backoff = max_backoff
+        self.state = STATE_CLOSED
+        self.failures = 0 # Consecutive failures
+        self.trips = 0 # Times opened since the device last answered
+        self._retry_at: Optional[float] = None
+
+    @property
+    def backoff(self) -> float:
+        """Backoff used the last time the breaker opened."""
+        if not self.trips:
+            return 0.0
+        return min(self._base_backoff * 2 ** (self.trips - 1), self._max_backoff)
+
+    def retry_in(self, now: float) -> float:
+        """Seconds until the next probe is allowed."""
+        if self.state != STATE_OPEN or self._retry_at is None:
+            return 0.0
+        return max(0.0, self._retry_at - now)
+
+    def is_open(self, now: float) -> bool:
+        """True while requests should be refused, without changing state."""
+        return self.state == STATE_OPEN and now < self._retry_at
+
+    def allow_request(self, now: float) -> bool:
+        """Return True if a request may go out; moves to half-open once the backoff has passed."""
+        if self.state == STATE_OPEN:
+            if now < self._retry_at:
+                return False
+            self.state = STATE_HALF_OPEN
+        return True
+
+    def record_success(self) -> None:
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.trips = 0
+        self._retry_at = None
+
+    def record_failure(self, now: float) -> bool:
+        """Count a failure, returns True if this opened the breaker."""
+        self.failures += 1
+        if self.state == STATE_HALF_OPEN or self.failures >= self._failure_threshold:
+            self.state = STATE_OPEN
+            self.trips += 1
+            self._retry_at = now + self.backoff
+            return True
+        return False
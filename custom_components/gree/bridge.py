@@ -1,19 +1,25 @@
 """Helper and wrapper classes for Gree module."""
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 import logging
+import weakref
 
 from greeclimate.device import Device, DeviceInfo
 from greeclimate.discovery import Discovery, Listener
 from greeclimate.exceptions import DeviceNotBoundError, DeviceTimeoutError
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
     COORDINATORS,
+    DISCOVERY_BIND_CONCURRENCY,
+    DISCOVERY_BIND_MAX_RETRY,
+    DISCOVERY_BIND_RETRY,
     DISCOVERY_TIMEOUT,
     DISPATCH_DEVICE_DISCOVERED,
     DOMAIN,
@@ -68,8 +74,21 @@ class DeviceDataUpdateCoordinator(DataUpdateCoordinator):  # pylint: disable=has
             )
 
 
+def _cancel_retries(retries: dict[str, CALLBACK_TYPE]) -> None:
+    """Cancel scheduled bind retries; also run when their service is collected."""
+    for cancel in list(retries.values()):
+        cancel()
+    retries.clear()
+
+
 class DiscoveryService(Listener):
-    """Discovery event handler for gree devices."""
+    """Discovery event handler for gree devices.
+
+    Library code: the integration's own setup does not create it. Whoever
+    does owns its bind retries and should call async_stop() when done;
+    retries still pending when the service is garbage collected are
+    cancelled then.
+    """
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize discovery service."""
@@ -79,34 +98,122 @@ class DiscoveryService(Listener):
         self.discovery = Discovery(DISCOVERY_TIMEOUT)
         self.discovery.add_listener(self)
 
-        hass.data[DOMAIN].setdefault(COORDINATORS, [])
+        coordinators = hass.data[DOMAIN].setdefault(COORDINATORS, [])
+        # Lookups by MAC on every scan result, rather than walking the list
+        self._coordinators: dict[str, DeviceDataUpdateCoordinator] = {
+            coordinator.device.device_info.mac: coordinator for coordinator in coordinators
+        }
+        self._updated: dict[str, DeviceDataUpdateCoordinator] = {}
+        self._refresh_task: asyncio.Task | None = None
+
+        # Found devices are bound and refreshed a few at a time; those that
+        # fail to bind wait here, by MAC, for their next attempt.
+        self._bind_slots = asyncio.Semaphore(DISCOVERY_BIND_CONCURRENCY)
+        self._pending: dict[str, DeviceInfo] = {}
+        self._retries: dict[str, CALLBACK_TYPE] = {}
+        self._stopped = False
+        weakref.finalize(self, _cancel_retries, self._retries)
 
     async def device_found(self, device_info: DeviceInfo) -> None:
-        """Handle new device found on the network."""
-
-        device = Device(device_info)
-        try:
-            await device.bind()
-        except DeviceNotBoundError:
-            _LOGGER.error("Unable to bind to gree device: %s", device_info)
-        except DeviceTimeoutError:
-            _LOGGER.error("Timeout trying to bind to gree device: %s", device_info)
-
-        _LOGGER.info(
-            "Adding Gree device %s at %s:%i",
-            device.device_info.name,
-            device.device_info.ip,
-            device.device_info.port,
-        )
-        coordo = DeviceDataUpdateCoordinator(self.hass, device)
-        self.hass.data[DOMAIN][COORDINATORS].append(coordo)
-        await coordo.async_refresh()
+        """Handle new device found on the network.
+
+        Returns at once; the device is bound, refreshed and dispatched in the
+        background, so a slow unit doesn't hold up the others from the scan.
+        """
+        if device_info.mac in self._coordinators:
+            # Already tracked, e.g. found again by a new discovery object
+            await self.device_update(device_info)
+            return
+        if self._stopped:
+            return
+        if device_info.mac in self._pending:
+            self._pending[device_info.mac] = device_info # Latest address for the next attempt
+            return
+        self._pending[device_info.mac] = device_info
+        self.hass.async_create_task(self._async_add_device(device_info.mac))
+
+    async def _async_add_device(self, mac: str, attempt: int = 0) -> None:
+        """Bind a pending device, then register, refresh and dispatch it.
+
+        A device that fails to bind is not registered; it is tried again
+        later with a growing delay.
+        """
+        async with self._bind_slots:
+            device_info = self._pending.get(mac)
+            if device_info is None:
+                return # Stopped meanwhile
+            device = Device(device_info)
+            try:
+                await device.bind()
+            except Exception as error: # pylint: disable=broad-except
+                delay = min(DISCOVERY_BIND_RETRY * 2**attempt, DISCOVERY_BIND_MAX_RETRY)
+                if isinstance(error, DeviceNotBoundError):
+                    _LOGGER.error("Unable to bind to gree device: %s, retrying in %ss", device_info, delay)
+                elif isinstance(error, DeviceTimeoutError):
+                    _LOGGER.error("Timeout trying to bind to gree device: %s, retrying in %ss", device_info, delay)
+                else:
+                    _LOGGER.exception("Unexpected error binding gree device: %s, retrying in %ss", device_info, delay)
+                self._schedule_retry(mac, attempt + 1, delay)
+                return
+
+            # async_stop() may have run during the bind
+            if self._stopped or self._pending.pop(mac, None) is None:
+                return
+            _LOGGER.info(
+                "Adding Gree device %s at %s:%i",
+                device.device_info.name,
+                device.device_info.ip,
+                device.device_info.port,
+            )
+            coordo = DeviceDataUpdateCoordinator(self.hass, device)
+            self._coordinators[mac] = coordo
+            self.hass.data[DOMAIN][COORDINATORS].append(coordo)
+            await coordo.async_refresh()
 
         async_dispatcher_send(self.hass, DISPATCH_DEVICE_DISCOVERED, coordo)
 
+    @callback
+    def _schedule_retry(self, mac: str, attempt: int, delay: float) -> None:
+        """Try binding mac again after delay seconds, unless the service was stopped."""
+        if self._stopped:
+            self._pending.pop(mac, None)
+            return
+        service = weakref.ref(self) # The timer must not keep the service alive
+
+        @callback
+        def retry(_now) -> None:
+            discovery_service = service()
+            if discovery_service is None:
+                return
+            del discovery_service._retries[mac]
+            discovery_service.hass.async_create_task(discovery_service._async_add_device(mac, attempt))
+
+        self._retries[mac] = async_call_later(self.hass, delay, retry)
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel pending bind retries; devices found from now on are ignored."""
+        self._stopped = True
+        _cancel_retries(self._retries)
+        self._pending.clear()
+
     async def device_update(self, device_info: DeviceInfo) -> None:
         """Handle updates in device information, update if ip has changed."""
-        for coordinator in self.hass.data[DOMAIN][COORDINATORS]:
-            if coordinator.device.device_info.mac == device_info.mac:
-                coordinator.device.device_info.ip = device_info.ip
-                await coordinator.async_refresh()
+        coordinator = self._coordinators.get(device_info.mac)
+        if coordinator is None:
+            if device_info.mac in self._pending:
+                self._pending[device_info.mac] = device_info # Not bound yet, use the new address
+            return
+        coordinator.device.device_info.ip = device_info.ip
+        # Devices updated by the same scan are refreshed together
+        self._updated[device_info.mac] = coordinator
+        if self._refresh_task is None:
+            self._refresh_task = self.hass.async_create_task(self._async_refresh_updated())
+
+    async def _async_refresh_updated(self) -> None:
+        """Refresh updated devices concurrently, including those updated meanwhile."""
+        while self._updated:
+            coordinators = list(self._updated.values())
+            self._updated.clear()
+            await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+        self._refresh_task = None
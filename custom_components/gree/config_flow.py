@@ -2,13 +2,14 @@
 import asyncio
 import logging
 import voluptuous as vol
-from ipaddress import ip_address, AddressValueError
+from ipaddress import ip_address, ip_network, AddressValueError
 from typing import Any, Dict
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_MAC, CONF_PORT, CONF_NAME
 from homeassistant.core import callback
 from homeassistant.helpers.device_registry import format_mac
+from homeassistant.helpers.selector import TextSelector, TextSelectorConfig
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,7 +33,21 @@ except ImportError as e:
     DeviceNotBoundError = type("DeviceNotBoundError", (Exception,), {})
 
 
-from .const import DOMAIN, DEFAULT_PORT
+from .onboarding import (
+    async_hand_over, async_validate_device, async_validate_devices, clean_mac, dedupe_candidates,
+    parse_device_list, scan_candidates,
+)
+from .scan import GreeScanResult, async_scan_network
+from .store import async_get_key_store
+from .transport import async_acquire_transport_pool, async_release_transport_pool
+from .const import (
+    DOMAIN, DEFAULT_PORT, CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL,
+    CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW,
+    CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL,
+    CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL,
+    CONF_FAST_START, DEFAULT_FAST_START,
+    CONF_SUBNET, CONF_DEVICES, SCAN_MAX_HOSTS, CIPHER_ECB,
+)
 
 IP_SCHEMA = vol.Schema(
     {
@@ -40,6 +55,21 @@ IP_SCHEMA = vol.Schema(
     }
 )
 
+SUBNET_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_SUBNET): str,
+    }
+)
+
+BULK_IMPORT_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_DEVICES): TextSelector(TextSelectorConfig(multiline=True)),
+    }
+)
+
+# pick_device choice that adds every unit the sweep found
+PICK_ALL = "all"
+
 MANUAL_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_NAME): str,
@@ -77,25 +107,32 @@ class GreeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._host: str | None = None
         self._discovered_info: DeviceInfo | None = None
+        self._discovered_cipher: str = CIPHER_ECB
+        self._scan_results: Dict[str, GreeScanResult] = {}
 
     async def async_step_user(self, user_input: Dict[str, Any] = None) -> config_entries.FlowResult:
-        """Handle the initial user step: ask for IP."""
+        """Handle the initial user step: one unit by IP, a subnet sweep or a device list."""
         if not Discovery or not Listener:
             _LOGGER.error("Greeclimate Discovery or Listener class not loaded. Falling back to full manual entry.")
             return await self.async_step_manual()
-        
+        return self.async_show_menu(step_id="user", menu_options=["host", "scan_subnet", "bulk_import"])
+
+    async def async_step_host(self, user_input: Dict[str, Any] = None) -> config_entries.FlowResult:
+        """Ask for the IP of one unit."""
         if user_input is not None:
-            self._host = user_input[CONF_HOST]
+            self._host = user_input[CONF_HOST].strip()
+            if "/" in self._host: # A CIDR range to sweep rather than one unit
+                return await self.async_step_scan_subnet({CONF_SUBNET: self._host})
             return await self.async_step_discover_mac()
 
-        return self.async_show_form(step_id="user", data_schema=IP_SCHEMA)
+        return self.async_show_form(step_id="host", data_schema=IP_SCHEMA)
 
     async def async_step_discover_mac(self, user_input=None) -> config_entries.FlowResult:
         """Attempt to discover the MAC for the user-provided IP."""
         try:
             target_ip_obj = ip_address(self._host)
         except (AddressValueError, TypeError):
-            return self.async_show_form(step_id="user", data_schema=IP_SCHEMA, errors={"base": "invalid_ip"})
+            return self.async_show_form(step_id="host", data_schema=IP_SCHEMA, errors={"base": "invalid_ip"})
 
         _LOGGER.debug("Attempting unicast discovery for MAC address at %s", self._host)
         discovery = Discovery(timeout=3)
@@ -118,6 +155,133 @@ class GreeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         
         return await self.async_step_manual(user_input={CONF_HOST: self._host})
 
+    async def async_step_scan_subnet(self, user_input: Dict[str, Any] = None) -> config_entries.FlowResult:
+        """Sweep a CIDR range for units on other LAN segments."""
+        errors: Dict[str, str] = {}
+        if user_input is not None:
+            try:
+                network = ip_network(user_input[CONF_SUBNET].strip(), strict=False)
+            except ValueError:
+                network = None
+            if network is None or network.version != 4:
+                errors["base"] = "invalid_subnet"
+            elif network.num_addresses > SCAN_MAX_HOSTS:
+                errors["base"] = "subnet_too_large"
+            else:
+                try:
+                    results = await async_scan_network(network)
+                except OSError as e:
+                    _LOGGER.error("Error while scanning %s: %s", network, e)
+                    errors["base"] = "discovery_error"
+                else:
+                    configured = self._async_current_ids()
+                    self._scan_results = {
+                        result.device_info.mac: result for result in results
+                        if format_mac(result.device_info.mac) not in configured
+                    }
+                    if not self._scan_results:
+                        return self.async_abort(reason="no_devices_found_or_already_configured")
+                    return await self.async_step_pick_device()
+
+        return self.async_show_form(step_id="scan_subnet", data_schema=SUBNET_SCHEMA, errors=errors)
+
+    async def async_step_pick_device(self, user_input: Dict[str, Any] = None) -> config_entries.FlowResult:
+        """Choose one of the units found by the subnet sweep."""
+        if user_input is not None:
+            if user_input[CONF_MAC] == PICK_ALL:
+                return await self._async_bulk_add(scan_candidates(self._scan_results.values()))
+            result = self._scan_results[user_input[CONF_MAC]]
+            self._discovered_info = result.device_info
+            self._discovered_cipher = result.cipher
+            self._host = result.device_info.ip
+            return await self.async_step_link()
+
+        choices = {
+            mac: f"{result.device_info.name} ({result.device_info.ip}, firmware {result.device_info.version or 'unknown'})"
+            for mac, result in self._scan_results.items()
+        }
+        if len(choices) > 1:
+            choices[PICK_ALL] = f"All {len(choices)} devices"
+        return self.async_show_form(
+            step_id="pick_device",
+            data_schema=vol.Schema({vol.Required(CONF_MAC): vol.In(choices)}),
+            description_placeholders={"count": str(len(choices))},
+        )
+
+    async def async_step_bulk_import(self, user_input: Dict[str, Any] = None) -> config_entries.FlowResult:
+        """Add every unit of a pasted YAML or CSV device list."""
+        errors: Dict[str, str] = {}
+        if user_input is not None:
+            try:
+                candidates = parse_device_list(user_input[CONF_DEVICES])
+            except ValueError as e:
+                _LOGGER.debug("Rejecting device list: %s", e)
+                candidates = []
+            if candidates:
+                return await self._async_bulk_add(candidates)
+            errors["base"] = "invalid_device_list"
+
+        return self.async_show_form(step_id="bulk_import", data_schema=BULK_IMPORT_SCHEMA, errors=errors)
+
+    async def _async_bulk_add(self, candidates) -> config_entries.FlowResult:
+        """Validate all candidates concurrently and start an import flow for each that passed.
+
+        A flow creates at most one entry, so the units are handed to import
+        flows and this one ends with the per-device report.
+        """
+        candidates = dedupe_candidates(candidates)
+        configured = self._async_current_ids()
+        report = []
+        pending = []
+        for candidate in candidates:
+            if candidate[CONF_MAC] and format_mac(candidate[CONF_MAC]) in configured:
+                report.append(f"- {candidate[CONF_HOST]}: already configured")
+            else:
+                pending.append(candidate)
+
+        pool = async_acquire_transport_pool(self.hass)
+        try:
+            results = await async_validate_devices(pool, pending)
+        finally:
+            async_release_transport_pool(self.hass)
+
+        key_store = async_get_key_store(self.hass)
+        added = 0
+        for result in results:
+            if result.error:
+                report.append(f"- {result.host}: {result.error}")
+                continue
+            device_info = result.device_info
+            if format_mac(device_info.mac) in configured:
+                report.append(f"- {result.host}: already configured")
+                continue
+            configured.add(format_mac(device_info.mac))
+            await key_store.async_set_key(clean_mac(device_info.mac), result.device.device_key, result.device.cipher)
+            async_hand_over(self.hass, result.device)
+            self.hass.async_create_task(
+                self.hass.config_entries.flow.async_init(
+                    DOMAIN, context={"source": config_entries.SOURCE_IMPORT},
+                    data={
+                        CONF_NAME: device_info.name, CONF_HOST: device_info.ip,
+                        CONF_PORT: device_info.port, CONF_MAC: device_info.mac,
+                    },
+                )
+            )
+            report.append(f"- {device_info.name} ({result.host}): added")
+            added += 1
+
+        _LOGGER.info("Bulk import added %d of %d Gree device(s)", added, len(candidates))
+        return self.async_abort(
+            reason="bulk_import_done",
+            description_placeholders={"added": str(added), "total": str(len(candidates)), "report": "\n".join(report)},
+        )
+
+    async def async_step_import(self, import_data: Dict[str, Any]) -> config_entries.FlowResult:
+        """Create the entry of a unit a bulk import has already validated."""
+        await self.async_set_unique_id(format_mac(import_data[CONF_MAC]))
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(title=import_data[CONF_NAME], data=import_data)
+
     async def async_step_link(self, user_input: Dict[str, Any] = None) -> config_entries.FlowResult:
         """Confirm the discovered device and set a name."""
         if user_input is not None:
@@ -169,7 +333,7 @@ class GreeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 mac=mac_cleaned_for_lib,
                 name=user_input[CONF_NAME]
             )
-            return await self._async_test_and_create_entry(user_input, user_input)
+            return await self._async_test_and_create_entry(device_info, user_input)
         
         # Show the manual form, pre-populating with info from previous steps if available
         return self.async_show_form(
@@ -184,17 +348,26 @@ class GreeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
     
     async def _async_test_and_create_entry(self, device_info: DeviceInfo, entry_data: Dict[str, Any]):
-        """Shared logic to test connection and create config entry."""
+        """Shared logic to test connection and create config entry.
+
+        The key negotiated here is stored, and the bound device handed over,
+        so the entry's first setup neither binds nor polls the device again.
+        """
+        pool = async_acquire_transport_pool(self.hass)
         try:
-            test_device = GreeClimateLibDevice(device_info)
-            await test_device.bind()
-            await test_device.update_state()
-            if test_device._properties is not None and test_device.get_property(GreePropsEnum.POWER) is not None:
+            test_device = await async_validate_device(pool, device_info, self._discovered_cipher)
+            if test_device is not None:
+                await async_get_key_store(self.hass).async_set_key(
+                    clean_mac(device_info.mac), test_device.device_key, test_device.cipher
+                )
+                async_hand_over(self.hass, test_device)
                 return self.async_create_entry(title=device_info.name, data=entry_data)
             else: return self.async_abort(reason="cannot_query_device")
         except DeviceTimeoutError: return self.async_abort(reason="cannot_connect")
         except DeviceNotBoundError: return self.async_abort(reason="device_not_bound")
         except Exception: return self.async_abort(reason="unknown")
+        finally:
+            async_release_transport_pool(self.hass)
 
     @staticmethod
     @callback
@@ -212,8 +385,24 @@ class GreeOptionsFlowHandler(config_entries.OptionsFlow):
             CONF_UPDATE_INTERVAL,
             self.config_entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
         )
+        current_coalesce_window = self.config_entry.options.get(CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW)
+        current_min_interval = self.config_entry.options.get(CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL)
+        current_max_interval = self.config_entry.options.get(CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL)
+        current_fast_start = self.config_entry.options.get(CONF_FAST_START, DEFAULT_FAST_START)
         options_schema = vol.Schema(
-            {vol.Optional(CONF_UPDATE_INTERVAL, default=current_update_interval): vol.Coerce(int)}
+            {
+                vol.Optional(CONF_UPDATE_INTERVAL, default=current_update_interval): vol.Coerce(int),
+                vol.Optional(CONF_MIN_UPDATE_INTERVAL, default=current_min_interval): vol.All(
+                    vol.Coerce(int), vol.Range(min=1)
+                ),
+                vol.Optional(CONF_MAX_UPDATE_INTERVAL, default=current_max_interval): vol.All(
+                    vol.Coerce(int), vol.Range(min=1)
+                ),
+                vol.Optional(CONF_COALESCE_WINDOW, default=current_coalesce_window): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=2000)
+                ),
+                vol.Optional(CONF_FAST_START, default=current_fast_start): bool,
+            }
         )
         return self.async_show_form(step_id="init", data_schema=options_schema)
 
@@ -18,13 +18,78 @@ CONF_PORT = "port"
 CONF_MAC = "mac"
 CONF_NAME = "name"
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_COALESCE_WINDOW = "coalesce_window"
+CONF_MIN_UPDATE_INTERVAL = "min_update_interval"
+CONF_MAX_UPDATE_INTERVAL = "max_update_interval"
+CONF_FAST_START = "fast_start"
+CONF_SUBNET = "subnet"
+CONF_DEVICES = "devices"
 
 # Defaults
 DEFAULT_PORT = 7000
 DEFAULT_UPDATE_INTERVAL = 30
+DEFAULT_COALESCE_WINDOW = 100 # ms; set_* calls within this window share one push
+DEFAULT_MIN_UPDATE_INTERVAL = 10 # Adaptive polling bounds, seconds
+DEFAULT_MAX_UPDATE_INTERVAL = 120
+FAST_POLL_AFTER_COMMAND = 60 # Seconds of fast polling after a command
+STABLE_POLLS_BEFORE_BACKOFF = 3 # Unchanged polls while off before slowing down
+CONVERGE_STALL_TIME = 120 # Seconds without the setpoint gap shrinking before polling slows down
+CONVERGE_MAX_TIME = 900 # Seconds of fast polling while converging on a setpoint, at most
+DEFAULT_FAST_START = False
+FAST_START_DEADLINE = 5 # Seconds the background first poll may take
 DEFAULT_MIN_TEMP = 16.0
 DEFAULT_MAX_TEMP = 30.0
 
+# Shared UDP transport (one pool per HA instance, see transport.py)
+DATA_TRANSPORT_POOL = "transport_pool"
+TRANSPORT_POOL_SIZE = 1 # Number of UDP sockets shared by all devices
+REQUEST_TIMEOUT = 10 # Seconds to wait for a device reply, same as greeclimate
+
+# Subnet sweep in the config flow (see scan.py)
+SCAN_CONCURRENCY = 256 # Hosts probed at once
+SCAN_HOST_TIMEOUT = 1.0 # Seconds to wait for each host's scan reply
+SCAN_MAX_HOSTS = 4096 # Largest range accepted, a /20
+
+# Bulk onboarding in the config flow (see onboarding.py)
+BULK_IMPORT_CONCURRENCY = 16 # Units validated at once
+BULK_IMPORT_TIMEOUT = 30 # Seconds to discover, bind and poll one unit
+# Handshakes of units just added, adopted by their coordinator's first setup
+DATA_HANDOFF = "handoff"
+HANDOFF_MAX_AGE = 120 # Seconds after which the first poll is too old to show
+
+# Packet encryption: older firmware uses AES-ECB, newer units AES-GCM
+CIPHER_ECB = "ecb"
+CIPHER_GCM = "gcm"
+
+# Negotiated device keys and last known states, kept across restarts (see store.py)
+DATA_KEY_STORE = "key_store"
+DATA_STATE_STORE = "state_store"
+
+# Circuit breaker for unreachable units (see breaker.py)
+BREAKER_FAILURE_THRESHOLD = 3 # Consecutive timeouts before backing off
+BREAKER_BASE_BACKOFF = 30 # Seconds, doubled on every failed probe
+BREAKER_MAX_BACKOFF = 600
+BREAKER_PROBE_TIMEOUT = 2 # Seconds to wait for the probe reply
+
+# Broadcast discovery service (see bridge.py)
+COORDINATORS = "coordinators"
+DISCOVERY_TIMEOUT = 8 # Seconds to collect scan replies
+DISCOVERY_BIND_CONCURRENCY = 8 # Found devices bound and refreshed at once
+DISCOVERY_BIND_RETRY = 30 # Seconds before binding a device again, doubled per attempt
+DISCOVERY_BIND_MAX_RETRY = 600
+DISPATCH_DEVICE_DISCOVERED = "gree_device_discovered"
+MAX_ERRORS = 2 # Timeouts in a row before a device is reported unavailable
+
+# Fleet-wide poll scheduling (one scheduler per HA instance, see scheduler.py)
+DATA_POLL_SCHEDULER = "poll_scheduler"
+MAX_CONCURRENT_POLLS = 4 # Polls in flight at once across all devices
+POLL_DEADLINE = 5 # Seconds a status request may hold one of those slots
+
+# Per-device telemetry (see telemetry.py)
+TELEMETRY_EWMA_ALPHA = 0.2 # Weight of the newest sample in the moving averages
+TELEMETRY_LATENCY_BUCKETS = (10, 20, 50, 100, 200, 300, 500, 750, 1000, 2000, 5000) # Histogram bounds, ms
+TELEMETRY_RECENT_REQUESTS = 50 # Requests kept for the diagnostics download
+
 # Gree Property String Names
 GREE_PROPERTY_POWER = "Pow"
 GREE_PROPERTY_MODE = "Mod"
@@ -35,6 +100,25 @@ GREE_PROPERTY_LIGHT = "Lig"
 GREE_PROPERTY_QUIET = "Quiet"
 GREE_PROPERTY_HORIZONTAL_SWING = "SwingLfRig" 
 GREE_PROPERTY_VERTICAL_SWING = "SwUpDn"       
+GREE_PROPERTY_TEMPERATURE_UNIT = "TemUn"
+GREE_PROPERTY_TEMPERATURE_BIT = "TemRec"
+
+# Properties read by the climate and switch entities; polls that change none
+# of these do not wake the entities.
+GREE_EXPOSED_PROPERTIES = (
+    GREE_PROPERTY_POWER, GREE_PROPERTY_MODE, GREE_PROPERTY_TARGET_TEMPERATURE,
+    GREE_PROPERTY_CURRENT_TEMPERATURE, GREE_PROPERTY_FAN_SPEED,
+    GREE_PROPERTY_HORIZONTAL_SWING, GREE_PROPERTY_VERTICAL_SWING,
+    GREE_PROPERTY_LIGHT, GREE_PROPERTY_QUIET,
+)
+
+# Always part of the status request: the coordinator's own logic (adaptive
+# polling, temperature conversion, setpoint pushes) reads these whatever
+# entities are enabled.
+GREE_REQUIRED_PROPERTIES = (
+    GREE_PROPERTY_POWER, GREE_PROPERTY_TARGET_TEMPERATURE, GREE_PROPERTY_CURRENT_TEMPERATURE,
+    GREE_PROPERTY_TEMPERATURE_UNIT, GREE_PROPERTY_TEMPERATURE_BIT,
+)
 
 # --- Horizontal Swing (for ClimateEntity) ---
 # Mapping from standard HA horizontal swing mode strings to our Gree values
@@ -2,11 +2,12 @@
 import asyncio
 import logging
 from datetime import timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.const import CONF_HOST, CONF_MAC, CONF_PORT
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 _LOGGER = logging.getLogger(__name__)
@@ -33,18 +34,36 @@ except ImportError as e:
 
 from .const import (
     DOMAIN, CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL,
+    CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW,
+    CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL,
+    CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL,
+    CONF_FAST_START, DEFAULT_FAST_START, FAST_START_DEADLINE,
+    FAST_POLL_AFTER_COMMAND, STABLE_POLLS_BEFORE_BACKOFF, BREAKER_PROBE_TIMEOUT,
+    CONVERGE_STALL_TIME, CONVERGE_MAX_TIME, POLL_DEADLINE,
     GREE_PROPERTY_POWER, GREE_PROPERTY_MODE, GREE_PROPERTY_TARGET_TEMPERATURE,
     GREE_PROPERTY_CURRENT_TEMPERATURE, GREE_PROPERTY_FAN_SPEED,
     GREE_PROPERTY_HORIZONTAL_SWING, GREE_PROPERTY_VERTICAL_SWING,
-    GREE_PROPERTY_LIGHT, GREE_PROPERTY_QUIET,
+    GREE_PROPERTY_LIGHT, GREE_PROPERTY_QUIET, GREE_EXPOSED_PROPERTIES, GREE_REQUIRED_PROPERTIES,
     # Import the new horizontal swing map
     HA_H_SWING_TO_GREE_MAP, 
     HA_TO_GREE_VERTICAL_SWING_MAP,
     HA_HVACMODE_TO_GREE_MODE_INT, HA_FANMODE_STR_TO_GREE_FANSPEED_INT,
     HVACMode, GREE_POWER_ON, GREE_POWER_OFF,
 )
+from .breaker import STATE_HALF_OPEN, GreeCircuitBreaker
+from .onboarding import async_take_handoff
+from .state import GreeState
+from .scheduler import (
+    PRIORITY_COMMAND, PRIORITY_POLL, DeviceRequestQueue,
+    async_acquire_poll_scheduler, async_release_poll_scheduler,
+)
+from .store import async_get_key_store, async_get_state_store
+from .telemetry import RESULT_ERROR, RESULT_TIMEOUT, GreeDeviceTelemetry
+from .transport import (
+    DeviceKeyRejectedError, PooledGreeDevice, async_acquire_transport_pool, async_release_transport_pool,
+)
 
-class GreeClimateUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
+class GreeClimateUpdateCoordinator(DataUpdateCoordinator[GreeState]):
     """Manages fetching data and sending commands to the Gree device."""
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -57,158 +76,703 @@ class GreeClimateUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         self.device_name: str = entry.title
         self.device_mac_display: str = entry.data[CONF_MAC].upper()
 
+        self._transport_pool = None
         if not all([GreeClimateLibDevice, DeviceInfo, GreePropsEnum, GreeModeEnum, GreeFanSpeedEnum]):
             _LOGGER.error("Greeclimate library components not fully loaded for %s. Device control will not be available.", self.device_name)
             self.device: Optional[GreeClimateLibDevice] = None
         else:
+            # All coordinators share the integration's UDP sockets instead of the
+            # library opening a new one per request.
+            self._transport_pool = async_acquire_transport_pool(hass)
             device_info_obj = DeviceInfo(ip=self._host, port=self._port, mac=self._mac_cleaned, name=self.device_name)
-            self.device: Optional[GreeClimateLibDevice] = GreeClimateLibDevice(device_info_obj)
+            self.device: Optional[GreeClimateLibDevice] = PooledGreeDevice(device_info_obj, self._transport_pool)
 
-        self._lock = asyncio.Lock()
+        # One request at a time per device; commands go first and cancel polls
+        self._requests = DeviceRequestQueue()
         self._is_bound = False
+        self.circuit_breaker = GreeCircuitBreaker() # Stops polling/commanding dead units
+        self.telemetry = GreeDeviceTelemetry() # Read by the diagnostic sensors
+        self._key_store = async_get_key_store(hass)
+        self._try_cached_key = True # Until the stored key has been rejected once
+        self._key_from_cache = False
+
+        # Fast start: entities come up from the last known state and the first
+        # poll runs in the background with a deadline
+        self.fast_start: bool = entry.options.get(CONF_FAST_START, DEFAULT_FAST_START)
+        self._state_store = async_get_state_store(hass) if self.fast_start else None
+        self._poll_deadline: Optional[float] = None
+        # Spreads this device's polls across the interval relative to the fleet
+        self._poll_scheduler = async_acquire_poll_scheduler(hass, self._mac_cleaned)
+        self._first_refresh_task: Optional[asyncio.Task] = None
+
+        # Command coalescing: writes queued within the window share one push
+        self._coalesce_window: float = entry.options.get(
+            CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW
+        ) / 1000
+        self._pending_commands: Dict[str, Callable[[], Awaitable[None]]] = {}
+        self._pending_push: Optional[asyncio.Future] = None
+        self._push_handle: Optional[asyncio.TimerHandle] = None
+
+        # Read-your-writes: optimistic values are shown as soon as a write is
+        # queued and carry the write's sequence number. Polls that read the
+        # device before that write reached it cannot overwrite them.
+        self._write_seq = 0 # Last sequence number handed to a write
+        self._pushed_seq = 0 # Highest sequence number that reached the device
+        self._unconfirmed: Dict[str, Tuple[int, Any, Any]] = {} # key: (seq, optimistic, value before)
 
         update_interval_seconds = entry.options.get(
             CONF_UPDATE_INTERVAL,
             entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
         )
+        # Adaptive polling: fast after commands and while converging on the
+        # setpoint, slow while off and stable, the configured interval otherwise
+        self._base_interval: float = update_interval_seconds
+        self._min_interval: float = min(
+            entry.options.get(CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL), update_interval_seconds
+        )
+        self._max_interval: float = max(
+            entry.options.get(CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL), update_interval_seconds
+        )
+        self._fast_poll_until: float = 0.0
+        self._stable_polls = 0
+        # Convergence on the setpoint: smallest gap seen, when it was last
+        # reached and when fast polling for it started
+        self._best_gap: Optional[float] = None
+        self._gap_shrunk_at: float = 0.0
+        self._converging_since: Optional[float] = None
+        self.poll_interval: float = update_interval_seconds # Before phase alignment
+
+        self.suppressed_updates = 0 # Polls that changed nothing entities expose
+        self._changed_properties: Optional[FrozenSet[str]] = None # For the next listener update
         super().__init__(
             hass, _LOGGER, name=f"{DOMAIN} ({self.device_name})",
             update_interval=timedelta(seconds=update_interval_seconds),
+            always_update=False,
         )
         _LOGGER.info("Gree Coordinator for %s initialized (interval: %ss)", self.device_name, update_interval_seconds)
 
+    async def async_shutdown(self) -> None:
+        """Cancel polling and give back our share of the transport pool."""
+        await super().async_shutdown()
+        task, self._first_refresh_task = self._first_refresh_task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        if self._push_handle is not None:
+            self._push_handle.cancel()
+            self._push_handle = None
+        if self._pending_push is not None and not self._pending_push.done():
+            self._pending_push.set_result(None)
+        self._pending_push = None
+        if self._transport_pool is not None:
+            self._transport_pool = None
+            async_release_transport_pool(self.hass)
+        if self._poll_scheduler is not None:
+            self._poll_scheduler = None
+            async_release_poll_scheduler(self.hass, self._mac_cleaned)
+
     async def _ensure_bound(self):
-        """Ensure device is bound. Call before operations that require a device key."""
+        """Ensure device is bound. Call before operations that require a device key.
+
+        A key stored by an earlier bind is used as is; the device is only bound
+        again once that key turns out to be rejected.
+        """
         if self.device and not self.device.device_key and not self._is_bound: 
+            if self._try_cached_key:
+                cached = await self._key_store.async_get(self._mac_cleaned)
+                if cached:
+                    _LOGGER.debug("%s: Using stored %s device key", self.device_name, cached["cipher"])
+                    await self.device.bind(key=cached["key"], cipher=cached["cipher"])
+                    self._is_bound = True
+                    self._key_from_cache = True
+                    return
+            started = self.hass.loop.time()
             try:
                 _LOGGER.debug("%s: Attempting to bind.", self.device_name)
                 await self.device.bind()
                 self._is_bound = True
+                self.telemetry.record_bind(self.hass.loop.time() - started)
                 _LOGGER.info("%s: Successfully bound.", self.device_name)
             except (DeviceTimeoutError, DeviceNotBoundError) as e:
                 _LOGGER.warning("%s: Binding failed: %s", self.device_name, e)
                 self._is_bound = False 
+                self.telemetry.record_bind(self.hass.loop.time() - started, RESULT_TIMEOUT)
                 raise 
             except Exception as e:
                 _LOGGER.error("%s: Unexpected error during bind: %s", self.device_name, e, exc_info=True)
                 self._is_bound = False
+                self.telemetry.record_bind(self.hass.loop.time() - started, RESULT_ERROR)
+                raise
+            await self._key_store.async_set_key(self._mac_cleaned, self.device.device_key, self.device.cipher)
+
+    def _status_properties(self) -> List[str]:
+        """Keys to poll: those the listening entities read, plus the required ones.
+
+        Disabled entities are never added to HA and so never listen; the set
+        follows entities being enabled or disabled without further bookkeeping.
+        Every exposed property is polled while nobody listens yet (the first
+        refresh, which entities are created from) and for listeners without
+        property keys.
+        """
+        if not self._listeners:
+            return sorted(set(GREE_REQUIRED_PROPERTIES) | set(GREE_EXPOSED_PROPERTIES))
+        wanted = set(GREE_REQUIRED_PROPERTIES)
+        for _, context in self._listeners.values():
+            if not isinstance(context, frozenset):
+                wanted.update(GREE_EXPOSED_PROPERTIES)
+                break
+            wanted.update(context)
+        return sorted(wanted)
+
+    async def _async_poll_device(self) -> None:
+        """Bind if needed and fetch the state."""
+        properties = self._status_properties()
+        await self._async_keyed_request(lambda: self._async_request_state(properties))
+
+    async def _async_keyed_request(self, request: Callable[[], Awaitable[None]]) -> None:
+        """Bind if needed and run request, rebinding once if the device rejects a stored key."""
+        await self._ensure_bound()
+        try:
+            await request()
+        except DeviceKeyRejectedError:
+            if not self._key_from_cache:
                 raise
+            # A plain timeout keeps the stored key: the unit may just be offline.
+            # Only an answer that the key cannot decrypt means it was replaced.
+            _LOGGER.info("%s: Stored device key not accepted, binding again", self.device_name)
+            self._try_cached_key = False
+            self._key_from_cache = False
+            self._is_bound = False
+            self.device.device_key = None
+            await self._ensure_bound()
+            await request()
+
+    def _poll_slot(self) -> asyncio.Semaphore:
+        """The fleet-wide poll slot; requests after shutdown fail instead."""
+        if self._poll_scheduler is None:
+            raise UpdateFailed(f"{self.device_name} has been shut down")
+        return self._poll_scheduler.semaphore
+
+    async def _async_request_state(self, properties: List[str]) -> None:
+        """Status request holding a fleet-wide poll slot, for at most POLL_DEADLINE.
+
+        A unit that does not answer gives its slot back after the deadline
+        rather than the full request timeout, so a few dead units cannot
+        stall the polls of the rest of the fleet.
+        """
+        async with self._poll_slot():
+            try:
+                await asyncio.wait_for(self.device.update_state(properties), POLL_DEADLINE)
+            except asyncio.TimeoutError as e:
+                raise DeviceTimeoutError(f"No answer within {POLL_DEADLINE}s") from e
+
+    def _unchanged_or_new_data(self, ha_state_dict: Dict[str, Any]) -> GreeState:
+        """Return the previous snapshot when no exposed property changed.
+
+        The coordinator is created with always_update=False, so handing back the
+        same snapshot makes HA skip the listener callbacks and with them the
+        state writes of every entity of this device. Otherwise the poll is
+        decoded once into a new snapshot.
+        """
+        if self.data is None:
+            self._save_last_state(ha_state_dict)
+            return GreeState(ha_state_dict)
+        changed = frozenset(
+            key for key in GREE_EXPOSED_PROPERTIES if ha_state_dict.get(key) != self.data.get(key)
+        )
+        if changed:
+            self._save_last_state(ha_state_dict)
+            self._stable_polls = 0
+            # Only meaningful if the previous poll succeeded; otherwise HA notifies
+            # everyone anyway because availability flips.
+            if self.last_update_success:
+                self._changed_properties = changed
+            return GreeState(ha_state_dict)
+        self._stable_polls += 1
+        self.suppressed_updates += 1
+        _LOGGER.debug("%s: No exposed property changed, suppressing listener update (%d so far)", self.device_name, self.suppressed_updates)
+        return self.data
+
+    def _save_last_state(self, ha_state_dict: Dict[str, Any]) -> None:
+        """Remember the state for the next fast start."""
+        if self._state_store is not None:
+            self.hass.async_create_task(
+                self._state_store.async_set(self._mac_cleaned, {
+                    key: ha_state_dict[key] for key in GREE_EXPOSED_PROPERTIES if key in ha_state_dict
+                })
+            )
+
+    async def async_restore_last_state(self) -> None:
+        """Seed data with the state stored before the restart.
+
+        The entities show it but stay unavailable until the device answers.
+        """
+        last_state = await self._state_store.async_get(self._mac_cleaned) if self._state_store else None
+        self.data = GreeState(last_state) if last_state else None
+        self.last_update_success = False
+        _LOGGER.debug("%s: Fast start from %s", self.device_name, "stored state" if last_state else "no state")
+
+    @callback
+    def async_adopt_handshake(self) -> bool:
+        """Take over the bind and first poll of the config flow that just added the device.
+
+        Returns False if there is nothing fresh to adopt; the first refresh
+        then binds and polls as usual.
+        """
+        handoff = async_take_handoff(self.hass, self._mac_cleaned) if self.device else None
+        if handoff is None:
+            return False
+        self.device.device_key = handoff["key"]
+        self.device.cipher = handoff["cipher"]
+        self.device.cipher_known = True
+        self.device._properties = dict(handoff["properties"])
+        self.device.hid = handoff["hid"]
+        self.device.version = handoff["version"]
+        self._is_bound = True
+        data = self._unchanged_or_new_data(self._device_state_dict())
+        self._adapt_update_interval(data)
+        self.async_set_updated_data(data)
+        _LOGGER.debug("%s: Adopted the config flow's bind and first poll", self.device_name)
+        return True
+
+    async def async_background_first_refresh(self) -> None:
+        """First poll for fast start, bounded by FAST_START_DEADLINE.
+
+        Failing it only leaves the entities unavailable; polling carries on
+        at the regular interval.
+        """
+        self._first_refresh_task = asyncio.current_task() # Cancelled by async_shutdown()
+        self._poll_deadline = FAST_START_DEADLINE
+        try:
+            await self.async_refresh()
+        finally:
+            self._first_refresh_task = None
+        if not self.last_update_success:
+            _LOGGER.warning("%s: Device did not answer at startup, will keep polling", self.device_name)
+
+    def _converging(self, data: GreeState) -> bool:
+        """True while a heating or cooling unit is still closing in on its setpoint.
+
+        The gap has to keep shrinking: units that settle a degree or two off
+        the setpoint, or cannot reach it, drop back to the regular interval
+        after CONVERGE_STALL_TIME without progress, and after CONVERGE_MAX_TIME
+        in any case. Fan and dry modes have no setpoint to converge on.
+        """
+        now = self.hass.loop.time()
+        current = data.current_temperature
+        target = data.target_temperature
+        if (
+            data.hvac_mode not in (HVACMode.HEAT, HVACMode.COOL, HVACMode.AUTO)
+            or current is None or target is None or abs(current - target) < 1
+        ):
+            self._best_gap = None
+            self._converging_since = None
+            return False
+        gap = abs(current - target)
+        if self._best_gap is None or gap < self._best_gap:
+            self._best_gap = gap
+            self._gap_shrunk_at = now
+        if self._converging_since is None:
+            self._converging_since = now
+        return (
+            now - self._gap_shrunk_at < CONVERGE_STALL_TIME
+            and now - self._converging_since < CONVERGE_MAX_TIME
+        )
+
+    def _adapt_update_interval(self, data: GreeState) -> None:
+        """Pick the next poll interval from recent activity and device state.
+
+        HA schedules the next poll with update_interval after every refresh,
+        so setting it here takes effect for the poll that follows. The delay
+        is then stretched or shortened onto this device's slot in the fleet.
+        """
+        interval = self._base_interval
+        converging = self._converging(data) # Keeps its tracking current during fast polls too
+        if self.hass.loop.time() < self._fast_poll_until or converging:
+            interval = self._min_interval
+        elif not data.power and self._stable_polls >= STABLE_POLLS_BEFORE_BACKOFF:
+            interval = self._max_interval # Off and nothing is moving
+        if interval != self.poll_interval:
+            _LOGGER.debug("%s: Poll interval now %ss", self.device_name, interval)
+            self.poll_interval = interval
+        if self._poll_scheduler is None:
+            self.update_interval = timedelta(seconds=interval)
+            return
+        # HA counts the interval from the current whole second of the loop clock
+        delay = self._poll_scheduler.next_delay(self._mac_cleaned, interval, int(self.hass.loop.time()))
+        self.update_interval = timedelta(seconds=delay)
+
+    @callback
+    def async_add_property_listener(self, update_callback: CALLBACK_TYPE, properties: Iterable[str]) -> CALLBACK_TYPE:
+        """Listen for updates that touch any of the given Gree property keys.
+
+        CoordinatorEntity subclasses get the same behaviour by passing the keys
+        as their coordinator context.
+        """
+        return self.async_add_listener(update_callback, frozenset(properties))
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners, skipping property listeners whose keys did not change.
+
+        Without change information (first data, availability changes, refresh
+        errors) every listener is notified; with an empty change set none is.
+        """
+        changed, self._changed_properties = self._changed_properties, None
+        if changed is None:
+            super().async_update_listeners()
+            return
+        if not changed:
+            return
+        for update_callback, context in list(self._listeners.values()):
+            if not isinstance(context, frozenset) or not changed.isdisjoint(context):
+                update_callback()
+
+    @property
+    def command_queue_wait(self) -> float:
+        """Seconds the last command push waited for the device."""
+        return self._requests.last_wait[PRIORITY_COMMAND]
 
-    async def _async_update_data(self) -> Dict[str, Any]:
+    @property
+    def preempted_polls(self) -> int:
+        """Polls cancelled so far to let a command through."""
+        return self._requests.preempted_polls
+
+    async def _async_probe_and_poll(self, deadline: Optional[float]) -> None:
+        """Network part of a poll, run so that a command can cancel it."""
+        if self.circuit_breaker.state == STATE_HALF_OPEN:
+            # One short request decides whether the unit is back
+            _LOGGER.debug("%s: Probing unreachable device", self.device_name)
+            await self._async_keyed_request(self._async_probe)
+        _LOGGER.debug("%s: Calling library's update_state()", self.device_name)
+        if deadline is None:
+            await self._async_poll_device()
+        else:
+            await asyncio.wait_for(self._async_poll_device(), deadline)
+
+    async def _async_probe(self) -> None:
+        """Breaker probe holding a fleet-wide poll slot."""
+        async with self._poll_slot():
+            await self.device.probe(BREAKER_PROBE_TIMEOUT)
+
+    @callback
+    def _record_device_failure(self) -> None:
+        """Count a timeout towards the circuit breaker; back off polling if it opens."""
+        breaker = self.circuit_breaker
+        # HA schedules the next poll from the whole second of the loop clock
+        # (plus a fraction), so the backoff is counted from there too; else
+        # that poll can land just before it ends and be refused.
+        if breaker.record_failure(int(self.hass.loop.time())):
+            _LOGGER.warning(
+                "%s: Unreachable after %d failed attempt(s), backing off for %ss",
+                self.device_name, breaker.failures, breaker.backoff,
+            )
+            # Nothing to do before the backoff ends, so don't wake up earlier
+            self.update_interval = timedelta(seconds=breaker.backoff)
+
+    def _device_state_dict(self) -> Dict[str, Any]:
+        """Exposed properties of the library's last reply, temperature converted by the library."""
+        # Only the exposed properties make it into the snapshot
+        ha_state_dict = {
+            key: self.device._properties[key]
+            for key in GREE_EXPOSED_PROPERTIES if key in self.device._properties
+        }
+
+        # Explicitly get the processed current_temperature from the library's property
+        # This allows the library to apply its offset logic.
+        # The library's device.current_temperature property returns an int.
+        library_current_temp = self.device.current_temperature 
+        if library_current_temp is not None:
+            _LOGGER.debug(
+                "%s: Library processed current_temperature: %s (Raw TemSen from _properties was: %s)",
+                self.device_name,
+                library_current_temp,
+                self.device._properties.get(GreePropsEnum.TEMP_SENSOR.value) # Get raw for logging
+            )
+            ha_state_dict[GREE_PROPERTY_CURRENT_TEMPERATURE] = float(library_current_temp)
+        else:
+            # If library_current_temp is None, keep the raw TemSen or let it be absent
+            _LOGGER.warning("%s: Library device.current_temperature returned None. Using raw TemSen if available.", self.device_name)
+            # Ensure GREE_PROPERTY_CURRENT_TEMPERATURE key exists if raw value was there
+            if GreePropsEnum.TEMP_SENSOR.value in ha_state_dict:
+                 ha_state_dict[GREE_PROPERTY_CURRENT_TEMPERATURE] = ha_state_dict[GreePropsEnum.TEMP_SENSOR.value]
+        return ha_state_dict
+
+    async def _async_update_data(self) -> GreeState:
         """Fetch the latest data from the Gree device."""
+        self._changed_properties = None
         if not self.device:
             _LOGGER.debug("%s: Device object not initialized in coordinator, skipping update.", self.device_name)
             raise UpdateFailed(f"Device object not initialized for {self.device_name}")
 
-        async with self._lock:
+        now = self.hass.loop.time()
+        if not self.circuit_breaker.allow_request(now):
+            raise UpdateFailed(
+                f"Device {self.device_name} unreachable, next attempt in {self.circuit_breaker.retry_in(now):.0f}s"
+            )
+
+        # The fleet-wide slot is only taken around the status request itself
+        # (see _async_request_state), not while queueing for this device or binding.
+        async with self._requests.slot(PRIORITY_POLL) as waited:
+            self.telemetry.record_wait(waited)
             try:
-                await self._ensure_bound()
-                _LOGGER.debug("%s: Calling library's update_state()", self.device_name)
-                await self.device.update_state()
+                poll_seq = self._pushed_seq
+                deadline, self._poll_deadline = self._poll_deadline, None
+                started = self.hass.loop.time()
+                if not await self._requests.run_preemptible(self._async_probe_and_poll(deadline)):
+                    # A command took over; it refreshes the data itself
+                    _LOGGER.debug("%s: Poll preempted by a command", self.device_name)
+                    self.telemetry.record_preempted(self.hass.loop.time() - started, self._status_properties())
+                    if self.data is None:
+                        raise UpdateFailed(f"Poll of {self.device_name} was preempted")
+                    return self.data
+                if self.circuit_breaker.failures:
+                    _LOGGER.info("%s: Device is reachable again", self.device_name)
+                self.circuit_breaker.record_success()
+                rtt = self.hass.loop.time() - started
                 
                 if self.device._properties is not None and isinstance(self.device._properties, dict):
-                    # Start with a copy of the raw properties from the library
-                    ha_state_dict = self.device._properties.copy()
-                    
-                    # Explicitly get the processed current_temperature from the library's property
-                    # This allows the library to apply its offset logic.
-                    # The library's device.current_temperature property returns an int.
-                    library_current_temp = self.device.current_temperature 
-                    if library_current_temp is not None:
-                        _LOGGER.debug(
-                            "%s: Library processed current_temperature: %s (Raw TemSen from _properties was: %s)",
-                            self.device_name,
-                            library_current_temp,
-                            self.device._properties.get(GreePropsEnum.TEMP_SENSOR.value) # Get raw for logging
-                        )
-                        ha_state_dict[GREE_PROPERTY_CURRENT_TEMPERATURE] = float(library_current_temp)
-                    else:
-                        # If library_current_temp is None, keep the raw TemSen or let it be absent
-                        _LOGGER.warning("%s: Library device.current_temperature returned None. Using raw TemSen if available.", self.device_name)
-                        # Ensure GREE_PROPERTY_CURRENT_TEMPERATURE key exists if raw value was there
-                        if GreePropsEnum.TEMP_SENSOR.value in ha_state_dict:
-                             ha_state_dict[GREE_PROPERTY_CURRENT_TEMPERATURE] = ha_state_dict[GreePropsEnum.TEMP_SENSOR.value]
-
-
+                    ha_state_dict = self._device_state_dict()
+                    self._overlay_unconfirmed(ha_state_dict, poll_seq)
                     _LOGGER.debug("%s: State after update (processed): %s", self.device_name, ha_state_dict)
                     
                     if not ha_state_dict and len(self.device._properties) > 0:
-                         _LOGGER.warning("%s: ha_state_dict became empty unexpectedly. Library _properties: %s", self.device_name, self.device._properties)
+                         _LOGGER.warning("%s: Device reported none of the exposed properties. Library _properties: %s", self.device_name, self.device._properties)
                     elif not ha_state_dict: 
                          _LOGGER.info("%s: Library _properties was an empty dictionary. Device might be off or in a minimal reporting state.", self.device_name)
-                    return ha_state_dict
+                    data = self._unchanged_or_new_data(ha_state_dict)
+                    self._adapt_update_interval(data)
+                    self.telemetry.record_poll(rtt, self._status_properties())
+                    return data
                 else:
                     _LOGGER.warning("%s: Library self.device._properties is None or not a dict after update_state(). Type: %s", 
                                     self.device_name, type(self.device._properties))
-                    return {} 
+                    self.telemetry.record_poll(rtt, self._status_properties())
+                    return GreeState({})
             except (DeviceTimeoutError, DeviceNotBoundError) as e:
                 self._is_bound = False 
+                self._record_device_failure()
+                self.telemetry.record_timeout(self.hass.loop.time() - started, self._status_properties())
                 _LOGGER.warning("%s: Update failed (timeout/not bound): %s", self.device_name, e)
                 raise UpdateFailed(f"Device {self.device_name} communication error: {e}") from e
+            except asyncio.TimeoutError as e:
+                self._is_bound = False
+                self._record_device_failure()
+                self.telemetry.record_timeout(self.hass.loop.time() - started, self._status_properties())
+                _LOGGER.warning("%s: No answer within the %ss startup deadline", self.device_name, FAST_START_DEADLINE)
+                raise UpdateFailed(f"Device {self.device_name} did not answer in time") from e
+            except UpdateFailed:
+                raise
             except Exception as e:
                 _LOGGER.error("%s: Unexpected error during state update: %s", self.device_name, e, exc_info=True)
                 raise UpdateFailed(f"Unexpected error updating {self.device_name}: {e}") from e
 
-    async def _execute_command_and_refresh(self, command_coro_func, optimistic_props: Optional[Dict[str, Any]] = None):
-        """Helper to execute a device command, push, optimistically update, and refresh."""
+    async def _execute_command_and_refresh(self, property_key: str, command_coro_func, optimistic_props: Optional[Dict[str, Any]] = None):
+        """Queue a single property write, see _async_queue_commands."""
+        await self._async_queue_commands({property_key: command_coro_func}, optimistic_props)
+
+    async def _async_queue_commands(self, commands: Dict[str, Callable[[], Awaitable[None]]], optimistic_props: Optional[Dict[str, Any]] = None):
+        """Queue property writes and wait until they have been pushed.
+
+        Writes arriving within the coalescing window are merged, last write wins
+        per property, and sent to the device in a single push.
+        """
         if not self.device:
             _LOGGER.error("%s: Device not initialized, cannot execute command.", self.device_name)
             return
+        now = self.hass.loop.time()
+        if self.circuit_breaker.is_open(now):
+            raise HomeAssistantError(
+                f"{self.device_name} is unreachable, next attempt in {self.circuit_breaker.retry_in(now):.0f}s"
+            )
 
-        async with self._lock:
+        self._pending_commands.update(commands)
+        if optimistic_props:
+            self._apply_optimistic(optimistic_props)
+        if self._pending_push is None:
+            self._pending_push = self.hass.loop.create_future()
+            self._push_handle = self.hass.loop.call_later(self._coalesce_window, self._start_push)
+        # Shielded so a cancelled service call does not drop the other writes of the batch
+        await asyncio.shield(self._pending_push)
+
+    @callback
+    def _apply_optimistic(self, optimistic_props: Dict[str, Any]) -> None:
+        """Show queued values right away, versioned with a new write sequence number."""
+        self._write_seq += 1
+        for name, value in optimistic_props.items():
+            if name in self._unconfirmed:
+                before = self._unconfirmed[name][2] # Keep the last value the device confirmed
+            else:
+                before = self.data.get(name) if self.data is not None else None
+            self._unconfirmed[name] = (self._write_seq, value, before)
+        if self.data is None:
+            return
+        changed = frozenset(name for name, value in optimistic_props.items() if self.data.get(name) != value)
+        if changed:
+            self.data = self.data.merge(optimistic_props)
+            self._changed_properties = changed
+            self.async_update_listeners()
+
+    @callback
+    def _settle_writes(self, up_to_seq: int, applied: bool) -> None:
+        """End the versions of the writes up to up_to_seq.
+
+        Applied writes were confirmed by the device and keep their values;
+        writes that never reached it go back to the values before them.
+        """
+        reverted = {}
+        for name, (seq, _, before) in list(self._unconfirmed.items()):
+            if seq <= up_to_seq:
+                del self._unconfirmed[name]
+                if not applied:
+                    reverted[name] = before
+        if reverted and self.data is not None:
+            _LOGGER.debug("%s: Reverting unsent optimistic values: %s", self.device_name, reverted)
+            self.data = self.data.merge(reverted)
+            self._changed_properties = frozenset(reverted)
+            self.async_update_listeners()
+
+    def _overlay_unconfirmed(self, ha_state_dict: Dict[str, Any], poll_seq: int) -> None:
+        """Keep optimistic values a poll read too early to see.
+
+        poll_seq is the highest pushed write when the poll went out; a poll made
+        after a write was pushed is what the device really did, and ends it.
+        """
+        for name, (seq, value, _) in list(self._unconfirmed.items()):
+            if seq > poll_seq:
+                if ha_state_dict.get(name) != value:
+                    _LOGGER.debug("%s: Ignoring stale %s=%s from poll, write %d pending", self.device_name, name, ha_state_dict.get(name), seq)
+                ha_state_dict[name] = value
+                continue
+            del self._unconfirmed[name]
+            if ha_state_dict.get(name) != value:
+                _LOGGER.debug("%s: Device reports %s=%s after write of %s", self.device_name, name, ha_state_dict.get(name), value)
+
+    @staticmethod
+    def _ack_confirms(sent_props: Dict[str, Any], ack: Optional[Dict[str, Any]]) -> bool:
+        """Return True if the cmd reply echoes every value that was sent."""
+        return bool(ack) and all(ack.get(name) == value for name, value in sent_props.items())
+
+    @callback
+    def _start_push(self) -> None:
+        self._push_handle = None
+        self.hass.async_create_task(self._async_push_pending_commands(), f"{self.name} push")
+
+    async def _async_push_pending_commands(self) -> None:
+        """Apply all queued writes to the device and send them in one packet.
+
+        The cmd reply echoes the values the unit applied. When it confirms every
+        value sent, self.data is reconciled from it and no follow-up poll is
+        made; a mismatch, a missing ack or an error falls back to a refresh.
+        """
+        commands, self._pending_commands = self._pending_commands, {}
+        push_done, self._pending_push = self._pending_push, None
+        batch_seq = self._write_seq
+        confirmed = False
+        pushed = False
+
+        async with self._requests.slot(PRIORITY_COMMAND) as waited:
+            self.telemetry.record_wait(waited)
+            if waited:
+                _LOGGER.debug("%s: Command waited %.3fs for the device", self.device_name, waited)
+            if self.circuit_breaker.is_open(self.hass.loop.time()):
+                # Opened by a poll while these writes waited for the device
+                _LOGGER.warning("%s: Dropping %d command(s), device unreachable", self.device_name, len(commands))
+                self._settle_writes(batch_seq, applied=False)
+                if push_done is not None and not push_done.done():
+                    push_done.set_result(None)
+                return
+            started = self.hass.loop.time()
             try:
                 await self._ensure_bound()
-                await command_coro_func() 
-                await self.device.push_state_update() 
-                _LOGGER.debug("%s: Command executed and pushed successfully.", self.device_name)
-                
-                if optimistic_props and self.data is not None:
-                    self.data.update(optimistic_props)
-                    _LOGGER.debug("%s: Optimistically updated self.data: %s", self.device_name, optimistic_props)
-                    self.async_update_listeners() 
+                for command_coro_func in commands.values():
+                    await command_coro_func()
+                sent_props = {name: self.device._properties.get(name) for name in self.device._dirty}
+                sent_at = self.hass.loop.time()
+                ack = await self.device.push_state_update()
+                self.telemetry.record_command(self.hass.loop.time() - sent_at, sent_props)
+                pushed = True
+                self._pushed_seq = batch_seq
+                self.circuit_breaker.record_success()
+                _LOGGER.debug("%s: Pushed %d coalesced command(s): %s", self.device_name, len(commands), sent_props)
+                # Nothing sent means the device already holds these values
+                confirmed = not sent_props or self._ack_confirms(sent_props, ack)
+                if not confirmed:
+                    _LOGGER.debug("%s: Device acknowledged %s, expected %s; refreshing", self.device_name, ack, sent_props)
+
+                if confirmed:
+                    self._settle_writes(batch_seq, applied=True)
+
+                if self.data is not None:
+                    # Watch the unit closely for a while after it was commanded
+                    self._fast_poll_until = self.hass.loop.time() + FAST_POLL_AFTER_COMMAND
+                    self._stable_polls = 0
+                    self._best_gap = None # New setpoint or mode, converge afresh
+                    self._converging_since = None
+                    self._adapt_update_interval(self.data)
+                    if confirmed:
+                        # Usually the ack matches the optimistic values already
+                        # shown; then no listener needs to write its state again
+                        changed = frozenset(
+                            name for name, value in (ack or {}).items() if self.data.get(name) != value
+                        )
+                        # Entities coming back from unavailable need a write regardless
+                        self._changed_properties = changed if self.last_update_success else None
+                        _LOGGER.debug("%s: Updated self.data from the command ack, changed: %s", self.device_name, sorted(changed))
+                        # What the unit says it applied wins; also reschedules the next poll
+                        self.async_set_updated_data(self.data.merge(ack) if changed else self.data)
 
             except (DeviceTimeoutError, DeviceNotBoundError) as e:
                 self._is_bound = False
+                self._record_device_failure()
+                self.telemetry.record_command_failure(self.hass.loop.time() - started, RESULT_TIMEOUT, commands)
                 _LOGGER.error("%s: Command failed (timeout/not bound): %s", self.device_name, e)
             except Exception as e:
                 _LOGGER.error("%s: Unexpected error during command: %s", self.device_name, e, exc_info=True)
-        
-        await self.async_request_refresh()
+                if not pushed:
+                    self.telemetry.record_command_failure(self.hass.loop.time() - started, RESULT_ERROR, commands)
+            finally:
+                if not pushed:
+                    self._settle_writes(batch_seq, applied=False)
+                if push_done is not None and not push_done.done():
+                    push_done.set_result(None)
+
+        if not confirmed:
+            await self.async_request_refresh()
 
 
     async def async_set_power(self, turn_on: bool) -> None:
         async def command(): 
             if self.device: self.device.power = turn_on
         await self._execute_command_and_refresh(
-            command, 
+            GREE_PROPERTY_POWER, command,
             optimistic_props={GREE_PROPERTY_POWER: GREE_POWER_ON if turn_on else GREE_POWER_OFF}
         )
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         if hvac_mode == HVACMode.OFF:
             await self.async_set_power(False)
-        else:
-            is_currently_on = self.data.get(GREE_PROPERTY_POWER, GREE_POWER_OFF) == GREE_POWER_ON if self.data else False
-            if not is_currently_on:
-                await self.async_set_power(True) 
-                await asyncio.sleep(0.5) 
-            
-            if hvac_mode in HA_HVACMODE_TO_GREE_MODE_INT:
-                gree_mode_val = HA_HVACMODE_TO_GREE_MODE_INT[hvac_mode]
-                async def command(): 
-                    if self.device : self.device.mode = gree_mode_val
-                await self._execute_command_and_refresh(
-                    command,
-                    optimistic_props={GREE_PROPERTY_MODE: gree_mode_val, GREE_PROPERTY_POWER: GREE_POWER_ON}
-                )
-            else: _LOGGER.warning("%s: Unsupported HVACMode: %s", self.device_name, hvac_mode)
+            return
+        if hvac_mode not in HA_HVACMODE_TO_GREE_MODE_INT:
+            _LOGGER.warning("%s: Unsupported HVACMode: %s", self.device_name, hvac_mode)
+            return
+
+        gree_mode_val = HA_HVACMODE_TO_GREE_MODE_INT[hvac_mode]
+        async def power_on():
+            if self.device: self.device.power = True # No-op (not sent) if already on
+        async def command():
+            if self.device: self.device.mode = gree_mode_val
+        # Pow and Mod go out in the same packet, so the unit needs no settle time between them
+        await self._async_queue_commands(
+            {GREE_PROPERTY_POWER: power_on, GREE_PROPERTY_MODE: command},
+            optimistic_props={GREE_PROPERTY_MODE: gree_mode_val, GREE_PROPERTY_POWER: GREE_POWER_ON}
+        )
 
     async def async_set_target_temperature(self, temperature: float) -> None:
         temp_int = int(temperature)
         async def command(): 
             if self.device: self.device.target_temperature = temp_int
         await self._execute_command_and_refresh(
-            command,
+            GREE_PROPERTY_TARGET_TEMPERATURE, command,
             optimistic_props={GREE_PROPERTY_TARGET_TEMPERATURE: temp_int}
         )
 
@@ -218,7 +782,7 @@ class GreeClimateUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
             async def command(): 
                 if self.device: self.device.fan_speed = gree_fan_speed_val
             await self._execute_command_and_refresh(
-                command,
+                GREE_PROPERTY_FAN_SPEED, command,
                 optimistic_props={GREE_PROPERTY_FAN_SPEED: gree_fan_speed_val}
             )
         else: _LOGGER.warning("%s: Unsupported fan mode string: %s", self.device_name, fan_mode_str)
@@ -229,7 +793,7 @@ class GreeClimateUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
             async def command(): 
                 if self.device: self.device.set_property(GreePropsEnum.SWING_HORIZ, gree_val)
             await self._execute_command_and_refresh(
-                command,
+                GREE_PROPERTY_HORIZONTAL_SWING, command,
                 optimistic_props={GREE_PROPERTY_HORIZONTAL_SWING: gree_val}
             )
         else: _LOGGER.warning("%s: Unsupported horizontal swing mode: %s", self.device_name, swing_mode_str)
@@ -241,7 +805,7 @@ class GreeClimateUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
             async def command(): 
                 if self.device: self.device.set_property(GreePropsEnum.SWING_VERT, gree_val)
             await self._execute_command_and_refresh(
-                command,
+                GREE_PROPERTY_VERTICAL_SWING, command,
                 optimistic_props={GREE_PROPERTY_VERTICAL_SWING: gree_val}
             )
         else: _LOGGER.warning("%s: Unsupp. vert. swing mode: %s", self.device_name, swing_mode_str)
@@ -250,7 +814,7 @@ class GreeClimateUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         async def command(): 
             if self.device: self.device.light = turn_on
         await self._execute_command_and_refresh(
-            command,
+            GREE_PROPERTY_LIGHT, command,
             optimistic_props={GREE_PROPERTY_LIGHT: GREE_POWER_ON if turn_on else GREE_POWER_OFF}
         )
 
@@ -258,6 +822,6 @@ class GreeClimateUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         async def command(): 
             if self.device: self.device.quiet = turn_on
         await self._execute_command_and_refresh(
-            command,
+            GREE_PROPERTY_QUIET, command,
             optimistic_props={GREE_PROPERTY_QUIET: GREE_POWER_ON if turn_on else GREE_POWER_OFF}
         )
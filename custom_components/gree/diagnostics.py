@@ -0,0 +1,42 @@
+"""Diagnostics support for Gree Climate integration."""
+from typing import Any, Dict
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_MAC
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import GreeClimateUpdateCoordinator
+
+TO_REDACT = {CONF_HOST, CONF_MAC, "device_key", "unique_id"}
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> Dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Request timings come from the coordinator's telemetry, which is collected
+    anyway, so there's no need to turn on debug logging to look at a slow unit.
+    """
+    diagnostics: Dict[str, Any] = {
+        "entry": {"title": entry.title, "data": dict(entry.data), "options": dict(entry.options)},
+    }
+    coordinator: GreeClimateUpdateCoordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if coordinator is None:
+        return async_redact_data(diagnostics, TO_REDACT)
+
+    device = coordinator.device
+    breaker = coordinator.circuit_breaker
+    diagnostics["device"] = {
+        "bound": coordinator._is_bound,
+        "device_key": getattr(device, "device_key", None),
+        "cipher": getattr(device, "cipher", None),
+        "key_from_cache": coordinator._key_from_cache,
+        "circuit_breaker": {"state": breaker.state, "failures": breaker.failures, "trips": breaker.trips},
+        "poll_interval": coordinator.poll_interval,
+        "last_update_success": coordinator.last_update_success,
+        "suppressed_updates": coordinator.suppressed_updates,
+        "preempted_polls": coordinator.preempted_polls,
+        "state": coordinator.data.as_dict() if coordinator.data is not None else None,
+    }
+    diagnostics["telemetry"] = coordinator.telemetry.as_dict()
+    return async_redact_data(diagnostics, TO_REDACT)
@@ -0,0 +1,198 @@
+"""Validation of new units for the config flow, one at a time or in bulk.
+
+Adding units one by one means a bind and a full status poll per pass through
+the flow. For bulk onboarding, a pasted YAML or CSV device list (or the result
+of a subnet sweep) is validated concurrently, a bounded number of units at a
+time and each under its own deadline, so one dead unit doesn't hold up the rest.
+"""
+import asyncio
+import csv
+from ipaddress import ip_address, ip_network
+import io
+import logging
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+import yaml
+
+from homeassistant.const import CONF_HOST, CONF_MAC, CONF_NAME, CONF_PORT
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+try:
+    from greeclimate.device import DeviceInfo, Props as GreePropsEnum
+    from greeclimate.exceptions import DeviceTimeoutError, DeviceNotBoundError
+except ImportError as e:
+    _LOGGER.critical("Onboarding: Failed to import from greeclimate: %s. Check library installation.", e)
+    DeviceInfo = None
+    GreePropsEnum = None
+    DeviceTimeoutError = type("DeviceTimeoutError", (Exception,), {})
+    DeviceNotBoundError = type("DeviceNotBoundError", (Exception,), {})
+
+from .const import (
+    BULK_IMPORT_CONCURRENCY, BULK_IMPORT_TIMEOUT, CIPHER_ECB, DATA_HANDOFF, DEFAULT_PORT, DOMAIN,
+    HANDOFF_MAX_AGE, SCAN_HOST_TIMEOUT,
+)
+from .scan import GreeScanResult, async_scan_network
+from .transport import GreeTransportPool, PooledGreeDevice
+
+CSV_FIELDS = (CONF_HOST, CONF_NAME, CONF_PORT, CONF_MAC)
+
+
+class ValidationResult(NamedTuple):
+    """Outcome for one unit; error is a config flow error key or None."""
+    host: str
+    device_info: Optional["DeviceInfo"]
+    device: Optional[PooledGreeDevice] # Bound, with the first poll's properties
+    error: Optional[str]
+
+
+def clean_mac(mac: str) -> str:
+    """MAC the way greeclimate and the coordinator use it: lower case, no separators."""
+    return mac.replace(":", "").replace("-", "").lower()
+
+
+def parse_device_list(text: str) -> List[Dict[str, Any]]:
+    """Parse a YAML list or CSV of units into host/name/port/mac dicts.
+
+    YAML items are either a host or a mapping with those keys. CSV rows are
+    host[,name[,port[,mac]]], with an optional header row naming the columns.
+    Raises ValueError if a row has no usable host.
+    """
+    try:
+        loaded = yaml.safe_load(text)
+    except yaml.YAMLError:
+        loaded = None
+    if isinstance(loaded, list):
+        rows = [item if isinstance(item, dict) else {CONF_HOST: item} for item in loaded]
+    else:
+        lines = [line for line in text.splitlines() if line.strip() and not line.lstrip().startswith("#")]
+        reader = csv.reader(io.StringIO("\n".join(lines)), skipinitialspace=True)
+        records = [row for row in reader if row]
+        fields = CSV_FIELDS
+        if records and CONF_HOST in (cell.strip().lower() for cell in records[0]):
+            fields = tuple(cell.strip().lower() for cell in records.pop(0))
+        rows = [dict(zip(fields, row)) for row in records]
+
+    devices = []
+    for row in rows:
+        host = str(row.get(CONF_HOST) or "").strip()
+        if not host:
+            raise ValueError(f"No host in {row}")
+        ip_address(host) # Raises ValueError if it isn't one
+        mac = str(row.get(CONF_MAC) or "").strip()
+        devices.append({
+            CONF_HOST: host,
+            CONF_NAME: str(row.get(CONF_NAME) or "").strip() or None,
+            CONF_PORT: int(row.get(CONF_PORT) or DEFAULT_PORT),
+            CONF_MAC: clean_mac(mac) if mac else None,
+        })
+    return devices
+
+
+async def async_validate_device(pool: GreeTransportPool, device_info, cipher: str = CIPHER_ECB) -> Optional[PooledGreeDevice]:
+    """Bind and poll a unit; returns it bound, or None if it reported no power state.
+
+    Raises DeviceTimeoutError or DeviceNotBoundError like the library does.
+    """
+    device = PooledGreeDevice(device_info, pool)
+    device.cipher = cipher # Known from a scan reply, else tried first
+    await device.bind()
+    await device.update_state()
+    if device._properties is None or device.get_property(GreePropsEnum.POWER) is None:
+        return None
+    return device
+
+
+@callback
+def async_hand_over(hass: HomeAssistant, device: PooledGreeDevice) -> None:
+    """Keep a validated unit's handshake for the coordinator of the entry about to be created.
+
+    The coordinator adopts the key, cipher and first poll instead of binding
+    and polling the unit a second time (see async_take_handoff).
+    """
+    handoffs = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_HANDOFF, {})
+    now = hass.loop.time()
+    # Imports that aborted or failed never take theirs, drop them once stale
+    for mac in [mac for mac, handoff in handoffs.items() if now - handoff["at"] > HANDOFF_MAX_AGE]:
+        del handoffs[mac]
+    handoffs[clean_mac(device.device_info.mac)] = {
+        "key": device.device_key,
+        "cipher": device.cipher,
+        "properties": dict(device._properties),
+        "hid": device.hid,
+        "version": device.version,
+        "at": now,
+    }
+
+
+@callback
+def async_take_handoff(hass: HomeAssistant, mac: str) -> Optional[Dict[str, Any]]:
+    """The handshake handed over for mac, or None if there is none or it is stale.
+
+    Each handoff is used once; later setups of the entry bind and poll as usual.
+    """
+    handoff = hass.data.get(DOMAIN, {}).get(DATA_HANDOFF, {}).pop(clean_mac(mac), None)
+    if handoff is None or hass.loop.time() - handoff["at"] > HANDOFF_MAX_AGE:
+        return None
+    return handoff
+
+
+async def _async_validate_one(pool: GreeTransportPool, candidate: Dict[str, Any], semaphore: asyncio.Semaphore) -> ValidationResult:
+    host = candidate[CONF_HOST]
+    async with semaphore:
+        try:
+            async with asyncio.timeout(BULK_IMPORT_TIMEOUT):
+                cipher = candidate.get("cipher", CIPHER_ECB)
+                device_info = candidate.get("device_info")
+                if device_info is None and candidate[CONF_MAC]:
+                    device_info = DeviceInfo(host, candidate[CONF_PORT], candidate[CONF_MAC], candidate[CONF_NAME] or host)
+                elif device_info is None:
+                    # Without a MAC, ask the unit itself
+                    found = await async_scan_network(ip_network(host), candidate[CONF_PORT], SCAN_HOST_TIMEOUT * 2)
+                    if not found:
+                        return ValidationResult(host, None, None, "cannot_connect")
+                    device_info, cipher = found[0]
+                    if candidate[CONF_NAME]:
+                        device_info.name = candidate[CONF_NAME]
+                device = await async_validate_device(pool, device_info, cipher)
+        except (DeviceTimeoutError, asyncio.TimeoutError):
+            return ValidationResult(host, None, None, "cannot_connect")
+        except DeviceNotBoundError:
+            return ValidationResult(host, None, None, "device_not_bound")
+        except Exception as e:
+            _LOGGER.error("Unexpected error validating %s: %s", host, e, exc_info=True)
+            return ValidationResult(host, None, None, "unknown")
+    if device is None:
+        return ValidationResult(host, device_info, None, "cannot_query_device")
+    return ValidationResult(host, device_info, device, None)
+
+
+async def async_validate_devices(pool: GreeTransportPool, candidates: Iterable[Dict[str, Any]]) -> List[ValidationResult]:
+    """Validate many units concurrently, at most BULK_IMPORT_CONCURRENCY at a time."""
+    semaphore = asyncio.Semaphore(BULK_IMPORT_CONCURRENCY)
+    return list(await asyncio.gather(*(_async_validate_one(pool, candidate, semaphore) for candidate in candidates)))
+
+
+def dedupe_candidates(candidates: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop repeated units, the last mention wins.
+
+    Units are told apart by MAC where known, else by host and port, so
+    several units behind one address on different ports all stay.
+    """
+    return list({
+        clean_mac(candidate[CONF_MAC]) if candidate[CONF_MAC] else (candidate[CONF_HOST], candidate[CONF_PORT]): candidate
+        for candidate in candidates
+    }.values())
+
+
+def scan_candidates(results: Iterable[GreeScanResult]) -> List[Dict[str, Any]]:
+    """Candidates for async_validate_devices from subnet sweep results."""
+    return [
+        {
+            CONF_HOST: result.device_info.ip, CONF_NAME: result.device_info.name,
+            CONF_PORT: result.device_info.port, CONF_MAC: result.device_info.mac,
+            "device_info": result.device_info, "cipher": result.cipher,
+        }
+        for result in results
+    ]
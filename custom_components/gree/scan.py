@@ -0,0 +1,101 @@
+"""Unicast subnet sweep for Gree units on other LAN segments.
+
+Broadcast discovery stops at the router, which is why units elsewhere have
+to be added by IP. async_scan_network() sends the scan packet to every host
+of a CIDR range instead, from one socket, with a bounded number of hosts in
+flight and a short deadline per host, so a /22 is covered in a few seconds.
+Replies are decrypted with the generic ECB or GCM key, which also tells
+which cipher the unit will want for binding.
+"""
+import asyncio
+from ipaddress import IPv4Network, ip_address
+import json
+import logging
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+try:
+    from greeclimate.device import DeviceInfo
+except ImportError as e:
+    _LOGGER.critical("Scan: Failed to import from greeclimate: %s. Check library installation.", e)
+    DeviceInfo = None
+
+from .const import CIPHER_ECB, CIPHER_GCM, DEFAULT_PORT, SCAN_CONCURRENCY, SCAN_HOST_TIMEOUT
+from .transport import decrypt_pack, generic_key
+
+IPAddr = Tuple[str, int]
+
+SCAN_PACKET = json.dumps({"t": "scan"}).encode()
+
+
+class GreeScanResult(NamedTuple):
+    """A unit that answered the sweep."""
+    device_info: "DeviceInfo"
+    cipher: str
+
+
+def parse_scan_reply(data: bytes, addr: IPAddr) -> Optional[GreeScanResult]:
+    """Decode a scan reply, or None if it isn't one."""
+    try:
+        obj = json.loads(data)
+        cipher = CIPHER_GCM if obj.get("tag") else CIPHER_ECB
+        pack = decrypt_pack(obj["pack"], generic_key(cipher), cipher, obj.get("tag"))
+    except (ValueError, KeyError, TypeError, UnicodeDecodeError):
+        return None
+    mac = pack.get("mac") or pack.get("cid")
+    if pack.get("t") != "dev" or not mac:
+        return None
+    return GreeScanResult(
+        DeviceInfo(addr[0], addr[1], mac, pack.get("name") or mac, pack.get("brand"), pack.get("model"), pack.get("ver")),
+        cipher,
+    )
+
+
+class _ScanProtocol(asyncio.DatagramProtocol):
+    def __init__(self) -> None:
+        self.waiters: Dict[str, asyncio.Future] = {}
+        self.results: Dict[str, GreeScanResult] = {}
+
+    def datagram_received(self, data: bytes, addr: IPAddr) -> None:
+        result = parse_scan_reply(data, addr)
+        if result is None:
+            return
+        self.results[result.device_info.mac] = result
+        waiter = self.waiters.get(addr[0])
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def error_received(self, exc: Exception) -> None:
+        _LOGGER.debug("Scan socket reported an error: %s", exc) # e.g. host unreachable
+
+
+async def async_scan_network(
+    network: IPv4Network, port: int = DEFAULT_PORT,
+    timeout: float = SCAN_HOST_TIMEOUT, concurrency: int = SCAN_CONCURRENCY,
+) -> List[GreeScanResult]:
+    """Send a scan to every host of network; returns the units that answered, by IP."""
+    hosts = [str(host) for host in network.hosts()] or [str(network.network_address)]
+    loop = asyncio.get_running_loop()
+    transport, protocol = await loop.create_datagram_endpoint(_ScanProtocol, local_addr=("0.0.0.0", 0))
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def probe(host: str) -> None:
+        async with semaphore:
+            waiter = protocol.waiters[host] = loop.create_future()
+            transport.sendto(SCAN_PACKET, (host, port))
+            try:
+                await asyncio.wait_for(waiter, timeout)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                protocol.waiters.pop(host, None)
+
+    _LOGGER.debug("Scanning %d host(s) of %s", len(hosts), network)
+    try:
+        await asyncio.gather(*(probe(host) for host in hosts))
+    finally:
+        transport.close()
+    results = sorted(protocol.results.values(), key=lambda result: ip_address(result.device_info.ip))
+    _LOGGER.debug("Scan of %s found %d unit(s)", network, len(results))
+    return results
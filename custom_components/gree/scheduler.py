@@ -0,0 +1,190 @@
+"""Request scheduling for the Gree integration.
+
+Fleet-wide: every coordinator polls on its own timer, and entries set up
+together at startup end up firing on the same tick. GreePollScheduler gives
+each device a fixed phase within its poll interval, derived from its
+position among the registered MACs, so polls are spread evenly instead of
+bursting. It also caps how many polls may be in flight at once across all
+devices.
+
+Per device: DeviceRequestQueue runs one request at a time, commands first.
+A command arriving while a poll is on the wire cancels the poll rather than
+waiting out its timeout.
+"""
+import asyncio
+from contextlib import asynccontextmanager
+import heapq
+import itertools
+import logging
+from typing import AsyncIterator, Awaitable, Dict, List, Optional, Tuple
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, DATA_POLL_SCHEDULER, MAX_CONCURRENT_POLLS
+
+_LOGGER = logging.getLogger(__name__)
+
+PRIORITY_COMMAND = 0
+PRIORITY_POLL = 1
+
+
+class GreePollScheduler:
+    """Assigns poll phases to devices and limits concurrent polls."""
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_POLLS) -> None:
+        self._macs: List[str] = []
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._max_concurrent = max(1, max_concurrent)
+        self.users = 0
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Semaphore to hold while a poll is in flight."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrent)
+        return self._semaphore
+
+    def register(self, mac: str) -> None:
+        if mac not in self._macs:
+            self._macs.append(mac)
+            self._macs.sort()
+
+    def unregister(self, mac: str) -> None:
+        if mac in self._macs:
+            self._macs.remove(mac)
+
+    def phase(self, mac: str) -> float:
+        """Fraction of the interval (0 <= phase < 1) at which the device polls."""
+        if mac not in self._macs:
+            return 0.0
+        return self._macs.index(mac) / len(self._macs)
+
+    def next_delay(self, mac: str, interval: float, now: float) -> float:
+        """Delay from now until the device's next slot on its phase grid.
+
+        Slots sit at k * interval + phase * interval on the loop clock. The
+        delay is kept between half and one and a half intervals, so moving a
+        device onto its phase never polls it much sooner or later than asked.
+        """
+        if interval <= 0:
+            return interval
+        delay = (self.phase(mac) * interval - now) % interval
+        if delay < interval / 2:
+            delay += interval
+        return delay
+
+
+@callback
+def async_acquire_poll_scheduler(hass: HomeAssistant, mac: str) -> GreePollScheduler:
+    """Register a device with the integration-wide scheduler, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    scheduler: Optional[GreePollScheduler] = domain_data.get(DATA_POLL_SCHEDULER)
+    if scheduler is None:
+        scheduler = domain_data[DATA_POLL_SCHEDULER] = GreePollScheduler()
+        _LOGGER.debug("Created shared Gree poll scheduler")
+    scheduler.register(mac)
+    scheduler.users += 1
+    return scheduler
+
+
+@callback
+def async_release_poll_scheduler(hass: HomeAssistant, mac: str) -> None:
+    """Unregister a device and drop the scheduler when nobody is left."""
+    domain_data = hass.data.get(DOMAIN, {})
+    scheduler: Optional[GreePollScheduler] = domain_data.get(DATA_POLL_SCHEDULER)
+    if scheduler is None:
+        return
+    scheduler.unregister(mac)
+    scheduler.users -= 1
+    if scheduler.users <= 0:
+        domain_data.pop(DATA_POLL_SCHEDULER)
+        _LOGGER.debug("Dropped shared Gree poll scheduler")
+
+
+class DeviceRequestQueue:
+    """Serializes the requests of one device, commands before polls.
+
+    Work run through run_preemptible() while holding a poll slot is cancelled
+    when a command asks for the device; the poll then gives up its slot.
+    """
+
+    def __init__(self) -> None:
+        self._active: Optional[int] = None # Priority of the slot holder
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._preemptible: Optional[asyncio.Task] = None
+        self._preempted = False
+        self.last_wait: Dict[int, float] = {PRIORITY_COMMAND: 0.0, PRIORITY_POLL: 0.0}
+        self.preempted_polls = 0
+
+    @property
+    def busy(self) -> bool:
+        return self._active is not None
+
+    @asynccontextmanager
+    async def slot(self, priority: int) -> AsyncIterator[float]:
+        """Hold the device for one request, yields the time spent queueing."""
+        waited = await self._async_acquire(priority)
+        try:
+            yield waited
+        finally:
+            self._release()
+
+    async def _async_acquire(self, priority: int) -> float:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        if self._active is None and not self._waiters:
+            self._active = priority
+            self.last_wait[priority] = 0.0
+            return 0.0
+        if priority == PRIORITY_COMMAND and self._active == PRIORITY_POLL:
+            self._preempt()
+        future = loop.create_future()
+        entry = (priority, next(self._seq), future)
+        heapq.heappush(self._waiters, entry)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release() # Granted just as we were cancelled
+            elif entry in self._waiters:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            raise
+        waited = loop.time() - start
+        self.last_wait[priority] = waited
+        return waited
+
+    def _release(self) -> None:
+        self._active = None
+        self._preemptible = None
+        while self._waiters:
+            priority, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                self._active = priority
+                future.set_result(None)
+                return
+
+    def _preempt(self) -> None:
+        task = self._preemptible
+        if task is not None and not task.done():
+            _LOGGER.debug("Preempting in-flight poll for a command")
+            self._preempted = True
+            self.preempted_polls += 1
+            task.cancel()
+
+    async def run_preemptible(self, work: Awaitable) -> bool:
+        """Run a poll's network work; returns False if a command cancelled it."""
+        task = asyncio.ensure_future(work)
+        self._preemptible = task
+        self._preempted = False
+        try:
+            await task
+        except asyncio.CancelledError:
+            if self._preempted and task.cancelled():
+                return False
+            raise
+        finally:
+            self._preemptible = None
+            self._preempted = False
+        return True
@@ -0,0 +1,113 @@
+"""Diagnostic telemetry sensors for Gree Climate integration."""
+from dataclasses import dataclass
+import logging
+from typing import Callable, Optional
+
+from homeassistant.components.sensor import (
+    SensorEntity, SensorEntityDescription, SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .coordinator import GreeClimateUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+def _rounded(value: Optional[float]) -> Optional[float]:
+    return round(value, 1) if value is not None else None
+
+@dataclass(frozen=True, kw_only=True)
+class GreeSensorEntityDescription(SensorEntityDescription):
+    """Describes a Gree telemetry sensor and how to read it from the coordinator."""
+    value_fn: Callable[[GreeClimateUpdateCoordinator], Optional[float]]
+
+# Diagnostic and disabled by default: enable them on the units worth watching
+SENSOR_DESCRIPTIONS: tuple[GreeSensorEntityDescription, ...] = (
+    GreeSensorEntityDescription(
+        key="poll_rtt", name="Poll round trip", translation_key="poll_rtt",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS, state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: _rounded(coordinator.telemetry.poll_rtt.last),
+    ),
+    GreeSensorEntityDescription(
+        key="poll_rtt_average", name="Poll round trip average", translation_key="poll_rtt_average",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS, state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: _rounded(coordinator.telemetry.poll_rtt.ewma),
+    ),
+    GreeSensorEntityDescription(
+        key="poll_rtt_p95", name="Poll round trip 95th percentile", translation_key="poll_rtt_p95",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS, state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.telemetry.poll_rtt.p95,
+    ),
+    GreeSensorEntityDescription(
+        key="timeout_rate", name="Poll timeout rate", translation_key="timeout_rate",
+        native_unit_of_measurement=PERCENTAGE, state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: coordinator.telemetry.timeout_rate,
+    ),
+    GreeSensorEntityDescription(
+        key="bind_count", name="Binds", translation_key="bind_count",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.telemetry.binds,
+    ),
+    GreeSensorEntityDescription(
+        key="command_ack_latency", name="Command acknowledgement latency", translation_key="command_ack_latency",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS, state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: _rounded(coordinator.telemetry.command_ack.ewma),
+    ),
+    GreeSensorEntityDescription(
+        key="request_wait", name="Request queue wait", translation_key="request_wait",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS, state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda coordinator: _rounded(coordinator.telemetry.request_wait.ewma),
+    ),
+    GreeSensorEntityDescription(
+        key="suppressed_updates", name="Suppressed updates", translation_key="suppressed_updates",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.suppressed_updates,
+    ),
+)
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Gree telemetry sensors from a config entry."""
+    coordinator: GreeClimateUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(GreeTelemetrySensor(coordinator, description) for description in SENSOR_DESCRIPTIONS)
+
+class GreeTelemetrySensor(SensorEntity):
+    """Network statistic of one device.
+
+    Fed by the coordinator's telemetry rather than its data updates, so the
+    figures keep moving while the device state doesn't, or the device is
+    unreachable, and reading them never widens what gets polled.
+    """
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    entity_description: GreeSensorEntityDescription
+
+    def __init__(self, coordinator: GreeClimateUpdateCoordinator, description: GreeSensorEntityDescription):
+        self.coordinator = coordinator
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.device_mac_display}_{description.key}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, coordinator.device_mac_display)},
+            "name": coordinator.device_name,
+            "manufacturer": "Gree",
+        }
+        self._update_attrs()
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.telemetry.async_add_listener(self._handle_telemetry_update))
+
+    @callback
+    def _update_attrs(self) -> None:
+        self._attr_native_value = self.entity_description.value_fn(self.coordinator)
+
+    @callback
+    def _handle_telemetry_update(self) -> None:
+        self._update_attrs()
+        self.async_write_ha_state()
@@ -0,0 +1,256 @@
+"""Local simulator of Gree units speaking the real UDP protocol.
+
+The unit tests replace greeclimate's Device with a Mock, so nothing there
+exercises sockets, encryption, binding or timeouts. GreeSimulator runs any
+number of virtual units on localhost, one UDP socket each, that answer scan,
+bind, status and cmd packets encrypted with ECB or GCM like real firmware.
+Latency, jitter, packet loss and a few known firmware quirks can be injected
+so the coordinator and transport can be tested and benchmarked offline:
+
+    async with GreeSimulator(100, latency=0.02, loss=0.01) as simulator:
+        for unit in simulator.units:
+            ...  # point a device at unit.host, unit.port, unit.mac
+
+It can also be run on its own (python -m custom_components.gree.simulator)
+to point a development Home Assistant at.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+import string
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .const import CIPHER_ECB, CIPHER_GCM
+from .transport import decrypt_pack, encrypt_pack, generic_key
+
+_LOGGER = logging.getLogger(__name__)
+
+IPAddr = Tuple[str, int]
+
+# Replies carry no "cid", so they can only be routed by sender address
+QUIRK_NO_CID = "no_cid"
+# cmd replies only echo "p", without "val"
+QUIRK_P_ONLY_ACK = "p_only_ack"
+# cmd replies echo the values from before the command although it was applied
+QUIRK_STALE_ACK = "stale_ack"
+# Every bind hands out a new key and the previous one stops working
+QUIRK_REKEY_ON_BIND = "rekey_on_bind"
+# status replies ignore "cols" and carry every property the unit knows
+QUIRK_FULL_STATUS = "full_status"
+QUIRKS = (QUIRK_NO_CID, QUIRK_P_ONLY_ACK, QUIRK_STALE_ACK, QUIRK_REKEY_ON_BIND, QUIRK_FULL_STATUS)
+
+# Power on, cooling to 24°C with 25°C in the room (TemSen carries a +40 offset)
+DEFAULT_PROPERTIES: Dict[str, Any] = {
+    "Pow": 1, "Mod": 1, "SetTem": 24, "TemSen": 65, "TemUn": 0, "TemRec": 0,
+    "WdSpd": 0, "Air": 0, "Blo": 0, "Health": 0, "SwhSlp": 0, "SlpMod": 0,
+    "Lig": 1, "SwingLfRig": 0, "SwUpDn": 0, "Quiet": 0, "Tur": 0, "StHt": 0,
+    "HeatCoolType": 0, "SvSt": 0, "time": "2020-01-01 00:00:00",
+    "hid": "362001000762+U-CS532AE(LT)V3.31.bin",
+}
+
+
+def _random_key(rng: random.Random) -> str:
+    return "".join(rng.choice(string.ascii_letters + string.digits) for _ in range(16))
+
+
+class SimulatedGreeUnit(asyncio.DatagramProtocol):
+    """One virtual unit on its own UDP socket."""
+
+    def __init__(
+        self, mac: str, name: str, cipher: str = CIPHER_ECB, quirks: Iterable[str] = (),
+        latency: float = 0.0, jitter: float = 0.0, loss: float = 0.0,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self.mac = mac
+        self.name = name
+        self.cipher = cipher
+        self.quirks = frozenset(quirks)
+        self.latency = latency # Seconds before answering
+        self.jitter = jitter # Up to this much is added to or taken off the latency
+        self.loss = loss # Chance that a request is dropped without an answer
+        self._rng = rng or random.Random()
+        self.key = _random_key(self._rng)
+        self.properties: Dict[str, Any] = dict(DEFAULT_PROPERTIES)
+        self.host = "127.0.0.1"
+        self.port = 0
+        self.requests = 0
+        self.dropped = 0
+        self.binds = 0
+        self.cpu_time = 0.0 # Process CPU seconds spent answering, for benchmarks to discount
+        self._transport: Optional[asyncio.DatagramTransport] = None
+
+    def connection_made(self, transport: asyncio.DatagramTransport) -> None:
+        self._transport = transport
+        self.host, self.port = transport.get_extra_info("sockname")[:2]
+
+    def close(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    def datagram_received(self, data: bytes, addr: IPAddr) -> None:
+        started = time.process_time()
+        try:
+            self._answer(data, addr)
+        finally:
+            self.cpu_time += time.process_time() - started
+
+    def _answer(self, data: bytes, addr: IPAddr) -> None:
+        self.requests += 1
+        if self.loss and self._rng.random() < self.loss:
+            self.dropped += 1
+            return
+        try:
+            reply = self._handle(json.loads(data))
+        except (ValueError, KeyError, UnicodeDecodeError) as e:
+            _LOGGER.debug("%s: Ignoring packet it cannot handle: %s", self.mac, e)
+            return # Real units stay silent on packets they cannot decrypt
+        if reply is None:
+            return
+        delay = self.latency
+        if self.jitter:
+            delay = max(0.0, delay + self._rng.uniform(-self.jitter, self.jitter))
+        packet = json.dumps(reply).encode()
+        if delay:
+            asyncio.get_running_loop().call_later(delay, self._send_later, packet, addr)
+        else:
+            self._send(packet, addr)
+
+    def _send(self, packet: bytes, addr: IPAddr) -> None:
+        if self._transport is not None:
+            self._transport.sendto(packet, addr)
+
+    def _send_later(self, packet: bytes, addr: IPAddr) -> None:
+        started = time.process_time()
+        self._send(packet, addr)
+        self.cpu_time += time.process_time() - started
+
+    def _handle(self, obj: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Reply to a request, or None to stay silent."""
+        if obj.get("t") == "scan":
+            return self._packet(self._device_info(), generic_key(self.cipher), generic=True)
+        if obj.get("t") != "pack":
+            return None
+        generic = obj.get("i") == 1
+        key = generic_key(self.cipher) if generic else self.key
+        pack = decrypt_pack(obj["pack"], key, self.cipher, obj.get("tag"))
+        if pack["t"] == "bind":
+            if not generic:
+                return None
+            self.binds += 1
+            if QUIRK_REKEY_ON_BIND in self.quirks and self.binds > 1:
+                self.key = _random_key(self._rng)
+            return self._packet({"t": "bindok", "mac": self.mac, "key": self.key, "r": 200}, key, generic=True)
+        if generic:
+            return None # Status and cmd need the device key
+        if pack["t"] == "status":
+            cols = list(self.properties) if QUIRK_FULL_STATUS in self.quirks else pack["cols"]
+            values = [self.properties.get(col, 0) for col in cols]
+            return self._packet({"t": "dat", "mac": self.mac, "r": 200, "cols": cols, "dat": values}, key)
+        if pack["t"] == "cmd":
+            before = [self.properties.get(name, 0) for name in pack["opt"]]
+            self.properties.update(zip(pack["opt"], pack["p"]))
+            echoed = before if QUIRK_STALE_ACK in self.quirks else pack["p"]
+            reply = {"t": "res", "mac": self.mac, "r": 200, "opt": pack["opt"], "p": echoed}
+            if QUIRK_P_ONLY_ACK not in self.quirks:
+                reply["val"] = echoed
+            return self._packet(reply, key)
+        return None
+
+    def _device_info(self) -> Dict[str, Any]:
+        return {
+            "t": "dev", "cid": self.mac, "mac": self.mac, "name": self.name,
+            "bc": "gree", "brand": "gree", "catalog": "gree", "mid": "10001",
+            "model": "gree", "ver": "V1.1.13", "lock": 0,
+        }
+
+    def _packet(self, pack: Dict[str, Any], key: str, generic: bool = False) -> Dict[str, Any]:
+        cid = "" if QUIRK_NO_CID in self.quirks else self.mac
+        packet = {"t": "pack", "i": 1 if generic else 0, "uid": 0, "cid": cid, "tcid": ""}
+        packet["pack"], tag = encrypt_pack(pack, key, self.cipher)
+        if tag:
+            packet["tag"] = tag
+        return packet
+
+
+class GreeSimulator:
+    """A fleet of simulated units, started and stopped together."""
+
+    def __init__(
+        self, count: int = 1, cipher: str = CIPHER_ECB, quirks: Iterable[str] = (),
+        latency: float = 0.0, jitter: float = 0.0, loss: float = 0.0,
+        seed: Optional[int] = None, host: str = "127.0.0.1",
+    ) -> None:
+        rng = random.Random(seed)
+        self.host = host
+        self.units: List[SimulatedGreeUnit] = [
+            SimulatedGreeUnit(
+                f"f4911e{index:06x}", f"Simulated unit {index}", cipher, quirks,
+                latency, jitter, loss, random.Random(rng.random()),
+            )
+            for index in range(count)
+        ]
+
+    async def async_start(self) -> None:
+        """Open a socket per unit on a free port of host."""
+        loop = asyncio.get_running_loop()
+        for unit in self.units:
+            await loop.create_datagram_endpoint(lambda unit=unit: unit, local_addr=(self.host, 0))
+        _LOGGER.debug("Started %d simulated Gree units", len(self.units))
+
+    def close(self) -> None:
+        for unit in self.units:
+            unit.close()
+
+    async def __aenter__(self) -> "GreeSimulator":
+        await self.async_start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def requests(self) -> int:
+        return sum(unit.requests for unit in self.units)
+
+    @property
+    def dropped(self) -> int:
+        return sum(unit.dropped for unit in self.units)
+
+    @property
+    def cpu_time(self) -> float:
+        return sum(unit.cpu_time for unit in self.units)
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    simulator = GreeSimulator(
+        args.count, args.cipher, args.quirk, args.latency, args.jitter, args.loss, args.seed, args.host,
+    )
+    async with simulator:
+        for unit in simulator.units:
+            print(f"{unit.mac} {unit.host}:{unit.port} {unit.cipher}")
+        await asyncio.Event().wait() # Serve until interrupted
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run simulated Gree units on this host.")
+    parser.add_argument("--count", type=int, default=1)
+    parser.add_argument("--cipher", choices=(CIPHER_ECB, CIPHER_GCM), default=CIPHER_ECB)
+    parser.add_argument("--quirk", action="append", choices=QUIRKS, default=[])
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--loss", type=float, default=0.0, help="0..1")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--host", default="127.0.0.1")
+    args = parser.parse_args()
+    try:
+        asyncio.run(_async_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Immutable, decoded snapshot of a Gree device's state.
+
+The coordinator decodes each poll once into a GreeState, so entities read
+ready-made HA values instead of looking raw Gree integers up in the mapping
+tables on every state write. The raw values of the exposed properties are
+kept alongside for change detection and persistence, and the snapshot still
+answers get()/[] by Gree property key.
+"""
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+from homeassistant.components.climate.const import HVACMode
+
+from .const import (
+    GREE_EXPOSED_PROPERTIES, GREE_POWER_ON,
+    GREE_PROPERTY_POWER, GREE_PROPERTY_MODE, GREE_PROPERTY_TARGET_TEMPERATURE,
+    GREE_PROPERTY_CURRENT_TEMPERATURE, GREE_PROPERTY_FAN_SPEED,
+    GREE_PROPERTY_HORIZONTAL_SWING, GREE_PROPERTY_VERTICAL_SWING,
+    GREE_PROPERTY_LIGHT, GREE_PROPERTY_QUIET,
+    GREE_MODE_INT_TO_HA_HVACMODE, GREE_FANSPEED_INT_TO_HA_FANMODE_STR,
+    GREE_TO_HA_VERTICAL_SWING_MAP, GREE_TO_HA_H_SWING_MAP,
+    SUPPORTED_FAN_MODES_LIST, AVAILABLE_VERTICAL_SWING_MODES, SUPPORTED_HORIZONTAL_SWING_MODES,
+)
+
+_EXPOSED = frozenset(GREE_EXPOSED_PROPERTIES)
+# Unknown raw values fall back to the first mode offered in the UI
+DEFAULT_FAN_MODE = SUPPORTED_FAN_MODES_LIST[0]
+DEFAULT_SWING_MODE = AVAILABLE_VERTICAL_SWING_MODES[0]
+DEFAULT_SWING_HORIZONTAL_MODE = SUPPORTED_HORIZONTAL_SWING_MODES[0]
+
+
+def _as_float(value: Any) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+class GreeState:
+    """Decoded state of one device; never modified once built."""
+
+    __slots__ = (
+        "_raw", "power", "hvac_mode", "current_temperature", "target_temperature",
+        "fan_mode", "swing_mode", "swing_horizontal_mode", "light", "quiet",
+    )
+
+    def __init__(self, raw: Mapping[str, Any]) -> None:
+        """Build a snapshot from raw Gree values; keys that are not exposed are ignored."""
+        raw = {key: value for key, value in raw.items() if key in _EXPOSED}
+        power = raw.get(GREE_PROPERTY_POWER) == GREE_POWER_ON
+        init = object.__setattr__
+        init(self, "_raw", raw)
+        init(self, "power", power)
+        init(self, "hvac_mode", GREE_MODE_INT_TO_HA_HVACMODE.get(raw.get(GREE_PROPERTY_MODE), HVACMode.OFF) if power else HVACMode.OFF)
+        init(self, "current_temperature", _as_float(raw.get(GREE_PROPERTY_CURRENT_TEMPERATURE)))
+        init(self, "target_temperature", _as_float(raw.get(GREE_PROPERTY_TARGET_TEMPERATURE)))
+        init(self, "fan_mode", GREE_FANSPEED_INT_TO_HA_FANMODE_STR.get(raw.get(GREE_PROPERTY_FAN_SPEED), DEFAULT_FAN_MODE))
+        init(self, "swing_mode", GREE_TO_HA_VERTICAL_SWING_MAP.get(raw.get(GREE_PROPERTY_VERTICAL_SWING), DEFAULT_SWING_MODE))
+        init(self, "swing_horizontal_mode", GREE_TO_HA_H_SWING_MAP.get(raw.get(GREE_PROPERTY_HORIZONTAL_SWING), DEFAULT_SWING_HORIZONTAL_MODE))
+        init(self, "light", raw.get(GREE_PROPERTY_LIGHT) == GREE_POWER_ON)
+        init(self, "quiet", raw.get(GREE_PROPERTY_QUIET) == GREE_POWER_ON)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def merge(self, updates: Mapping[str, Any]) -> "GreeState":
+        """Return a snapshot with updates applied, or self if nothing changes."""
+        if all(self._raw.get(key) == value for key, value in updates.items() if key in _EXPOSED):
+            return self
+        return GreeState({**self._raw, **updates})
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Copy of the raw exposed property values."""
+        return dict(self._raw)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Raw value of a Gree property."""
+        return self._raw.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._raw[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._raw
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, GreeState):
+            return self._raw == other._raw
+        if isinstance(other, Mapping):
+            return self._raw == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"GreeState({self._raw!r})"
+
+
+# Snapshot of a device nothing is known about yet; entities show its values
+EMPTY_STATE = GreeState({})
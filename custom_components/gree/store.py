@@ -0,0 +1,93 @@
+"""Persistent per-device storage for the Gree integration.
+
+Two stores are kept, both by cleaned (lowercase, no separators) MAC:
+
+* device keys: binding costs a round trip per device on every start. The key
+  a device hands out stays valid until it is reset, so it is kept along with
+  the cipher the device uses and tried before binding again.
+* last state: with fast start, entities are created from the state seen
+  before the restart while the first poll runs in the background.
+
+Both live in HA storage rather than in the config entry because updating an
+entry reloads it.
+"""
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, DATA_KEY_STORE, DATA_STATE_STORE
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+KEY_STORAGE_KEY = f"{DOMAIN}.device_keys"
+KEY_SAVE_DELAY = 1 # Seconds; HA writes pending saves on shutdown as well
+STATE_STORAGE_KEY = f"{DOMAIN}.last_state"
+STATE_SAVE_DELAY = 60 # State changes often, batch the writes
+
+
+class GreeDeviceStore:
+    """A dict of values by device MAC, saved to HA storage with a delay."""
+
+    def __init__(self, hass: HomeAssistant, key: str, save_delay: float) -> None:
+        self._store: Store = Store(hass, STORAGE_VERSION, key)
+        self._save_delay = save_delay
+        self._data: Optional[Dict[str, Any]] = None
+        self._load_lock = asyncio.Lock()
+
+    async def _async_load(self) -> Dict[str, Any]:
+        # Callers racing the first load wait for it rather than loading again
+        # and replacing values set in the meantime
+        if self._data is None:
+            async with self._load_lock:
+                if self._data is None:
+                    self._data = await self._store.async_load() or {}
+        return self._data
+
+    async def async_get(self, mac: str) -> Optional[Any]:
+        """Return the stored value for the device, if any."""
+        return (await self._async_load()).get(mac)
+
+    async def async_set(self, mac: str, value: Any) -> None:
+        data = await self._async_load()
+        if data.get(mac) == value:
+            return
+        data[mac] = value
+        self._store.async_delay_save(lambda: self._data, self._save_delay)
+
+    async def async_remove(self, mac: str) -> None:
+        data = await self._async_load()
+        if data.pop(mac, None) is not None:
+            self._store.async_delay_save(lambda: self._data, self._save_delay)
+
+
+class GreeKeyStore(GreeDeviceStore):
+    """Device keys and ciphers, stored as {"key": ..., "cipher": ...}."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        super().__init__(hass, KEY_STORAGE_KEY, KEY_SAVE_DELAY)
+
+    async def async_set_key(self, mac: str, key: str, cipher: str) -> None:
+        _LOGGER.debug("Storing %s key for %s", cipher, mac)
+        await self.async_set(mac, {"key": key, "cipher": cipher})
+
+
+@callback
+def async_get_key_store(hass: HomeAssistant) -> GreeKeyStore:
+    """Return the integration-wide key store, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_KEY_STORE not in domain_data:
+        domain_data[DATA_KEY_STORE] = GreeKeyStore(hass)
+    return domain_data[DATA_KEY_STORE]
+
+
+@callback
+def async_get_state_store(hass: HomeAssistant) -> GreeDeviceStore:
+    """Return the integration-wide last-state store, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_STATE_STORE not in domain_data:
+        domain_data[DATA_STATE_STORE] = GreeDeviceStore(hass, STATE_STORAGE_KEY, STATE_SAVE_DELAY)
+    return domain_data[DATA_STATE_STORE]
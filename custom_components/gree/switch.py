@@ -1,29 +1,44 @@
 """Switch entities for Gree Climate integration."""
+from dataclasses import dataclass
 import logging
-from typing import Any, Optional
+from typing import Any, Callable, Coroutine
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN, SWITCH_TYPE_LIGHT, SWITCH_TYPE_QUIET,
-    GREE_PROPERTY_LIGHT, GREE_PROPERTY_QUIET, GREE_POWER_ON
+    GREE_PROPERTY_LIGHT, GREE_PROPERTY_QUIET,
 )
 from .coordinator import GreeClimateUpdateCoordinator
+from .state import GreeState
 
 _LOGGER = logging.getLogger(__name__)
 
-SWITCH_DESCRIPTIONS: tuple[SwitchEntityDescription, ...] = (
-    SwitchEntityDescription(
+@dataclass(frozen=True, kw_only=True)
+class GreeSwitchEntityDescription(SwitchEntityDescription):
+    """Describes a Gree switch: the property behind it and how to read and set it."""
+    gree_property: str # Coordinator context, so the switch only wakes when it changes
+    value_fn: Callable[[GreeState], bool]
+    set_fn: Callable[[GreeClimateUpdateCoordinator, bool], Coroutine[Any, Any, None]]
+
+SWITCH_DESCRIPTIONS: tuple[GreeSwitchEntityDescription, ...] = (
+    GreeSwitchEntityDescription(
         key=SWITCH_TYPE_LIGHT, name="Panel Light", icon="mdi:lightbulb",
         translation_key=SWITCH_TYPE_LIGHT,
+        gree_property=GREE_PROPERTY_LIGHT,
+        value_fn=lambda state: state.light,
+        set_fn=lambda coordinator, on: coordinator.async_set_light(on),
     ),
-    SwitchEntityDescription(
+    GreeSwitchEntityDescription(
         key=SWITCH_TYPE_QUIET, name="Quiet Mode", icon="mdi:volume-mute",
         translation_key=SWITCH_TYPE_QUIET,
+        gree_property=GREE_PROPERTY_QUIET,
+        value_fn=lambda state: state.quiet,
+        set_fn=lambda coordinator, on: coordinator.async_set_quiet_mode(on),
     ),
 )
 
@@ -37,9 +52,10 @@ async def async_setup_entry(
 
 class GreeSwitch(CoordinatorEntity[GreeClimateUpdateCoordinator], SwitchEntity):
     _attr_has_entity_name = True
+    entity_description: GreeSwitchEntityDescription
 
-    def __init__(self, coordinator: GreeClimateUpdateCoordinator, description: SwitchEntityDescription):
-        super().__init__(coordinator)
+    def __init__(self, coordinator: GreeClimateUpdateCoordinator, description: GreeSwitchEntityDescription):
+        super().__init__(coordinator, context=frozenset({description.gree_property}))
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.device_mac_display}_{description.key}"
         self._attr_device_info = {
@@ -47,28 +63,24 @@ class GreeSwitch(CoordinatorEntity[GreeClimateUpdateCoordinator], SwitchEntity):
             "name": coordinator.device_name,
             "manufacturer": "Gree",
         }
+        self._update_attrs()
 
     @property
     def available(self) -> bool:
         return super().available and self.coordinator.device is not None
 
-    @property
-    def is_on(self) -> Optional[bool]:
-        if not self.coordinator.data: return None # No data from coordinator yet
-        if self.entity_description.key == SWITCH_TYPE_LIGHT:
-            return self.coordinator.data.get(GREE_PROPERTY_LIGHT) == GREE_POWER_ON
-        if self.entity_description.key == SWITCH_TYPE_QUIET:
-            return self.coordinator.data.get(GREE_PROPERTY_QUIET) == GREE_POWER_ON
-        return None
+    @callback
+    def _update_attrs(self) -> None:
+        data = self.coordinator.data
+        self._attr_is_on = self.entity_description.value_fn(data) if data else None # None until the first poll
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._update_attrs()
+        super()._handle_coordinator_update()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        if self.entity_description.key == SWITCH_TYPE_LIGHT:
-            await self.coordinator.async_set_light(True)
-        elif self.entity_description.key == SWITCH_TYPE_QUIET:
-            await self.coordinator.async_set_quiet_mode(True)
+        await self.entity_description.set_fn(self.coordinator, True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        if self.entity_description.key == SWITCH_TYPE_LIGHT:
-            await self.coordinator.async_set_light(False)
-        elif self.entity_description.key == SWITCH_TYPE_QUIET:
-            await self.coordinator.async_set_quiet_mode(False)
+        await self.entity_description.set_fn(self.coordinator, False)
@@ -0,0 +1,184 @@
+"""Per-device network telemetry for the Gree integration.
+
+Everything is updated incrementally as requests complete and kept in
+constant memory: an exponentially weighted moving average for the typical
+value and a fixed-bucket histogram for the 95th percentile, so a coordinator
+can run for months without its statistics growing. The last few requests
+are also kept in a fixed-size ring buffer for the diagnostics download. The
+diagnostic sensors read these figures to point out slow or flapping Wi-Fi
+modules.
+"""
+import bisect
+from collections import deque
+import time
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .const import TELEMETRY_EWMA_ALPHA, TELEMETRY_LATENCY_BUCKETS, TELEMETRY_RECENT_REQUESTS
+
+REQUEST_BIND = "bind"
+REQUEST_STATUS = "status"
+REQUEST_PUSH = "push"
+
+RESULT_OK = "ok"
+RESULT_TIMEOUT = "timeout"
+RESULT_ERROR = "error"
+RESULT_PREEMPTED = "preempted"
+
+
+class LatencyStats:
+    """Last value, EWMA and histogram percentile of a latency, in milliseconds."""
+
+    __slots__ = ("last", "ewma", "count", "_buckets")
+
+    def __init__(self) -> None:
+        self.last: Optional[float] = None
+        self.ewma: Optional[float] = None
+        self.count = 0
+        # One counter per bucket upper bound plus one for everything above
+        self._buckets: List[int] = [0] * (len(TELEMETRY_LATENCY_BUCKETS) + 1)
+
+    def add(self, value_ms: float) -> None:
+        self.last = value_ms
+        self.ewma = value_ms if self.ewma is None else self.ewma + TELEMETRY_EWMA_ALPHA * (value_ms - self.ewma)
+        self.count += 1
+        self._buckets[bisect.bisect_left(TELEMETRY_LATENCY_BUCKETS, value_ms)] += 1
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Upper bound of the bucket holding the given fraction of samples.
+
+        Samples above the largest bucket report the largest value seen last,
+        which is the best the histogram can say about them.
+        """
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for bound, hits in zip(TELEMETRY_LATENCY_BUCKETS, self._buckets):
+            seen += hits
+            if seen >= rank:
+                return float(bound)
+        return max(self.last, float(TELEMETRY_LATENCY_BUCKETS[-1]))
+
+    @property
+    def p95(self) -> Optional[float]:
+        return self.percentile(0.95)
+
+    def histogram(self) -> Dict[str, int]:
+        """Sample counts keyed by bucket, e.g. "<=50" and ">5000" (ms)."""
+        counts = {f"<={bound}": hits for bound, hits in zip(TELEMETRY_LATENCY_BUCKETS, self._buckets)}
+        counts[f">{TELEMETRY_LATENCY_BUCKETS[-1]}"] = self._buckets[-1]
+        return counts
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count, "last": self.last, "ewma": self.ewma,
+            "p95": self.p95, "histogram": self.histogram(),
+        }
+
+
+class GreeDeviceTelemetry:
+    """Request statistics of one device, fed by its coordinator."""
+
+    def __init__(self) -> None:
+        self.poll_rtt = LatencyStats()
+        self.command_ack = LatencyStats()
+        self.request_wait = LatencyStats() # Time spent queueing for the device
+        self.polls = 0
+        self.timeouts = 0
+        self.timeout_ewma = 0.0 # Recent share of polls that timed out
+        self.binds = 0
+        # (wall time, kind, duration ms, result, properties) of the latest requests
+        self.recent: Deque[Tuple[float, str, float, str, Tuple[str, ...]]] = deque(maxlen=TELEMETRY_RECENT_REQUESTS)
+        self._listeners: List[CALLBACK_TYPE] = []
+
+    @property
+    def timeout_rate(self) -> float:
+        """Recent poll timeout rate in percent."""
+        return round(self.timeout_ewma * 100, 1)
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call update_callback whenever the figures change; returns the remover."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_notify(self) -> None:
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    def _count_poll(self, timed_out: bool) -> None:
+        self.polls += 1
+        self.timeout_ewma += TELEMETRY_EWMA_ALPHA * ((1.0 if timed_out else 0.0) - self.timeout_ewma)
+
+    def _log_request(self, kind: str, duration: float, result: str, properties: Iterable[str]) -> None:
+        self.recent.append((time.time(), kind, round(duration * 1000, 1), result, tuple(properties)))
+
+    @callback
+    def record_poll(self, rtt: float, properties: Iterable[str] = ()) -> None:
+        """A poll of properties answered after rtt seconds."""
+        self.poll_rtt.add(rtt * 1000)
+        self._count_poll(False)
+        self._log_request(REQUEST_STATUS, rtt, RESULT_OK, properties)
+        self._async_notify()
+
+    @callback
+    def record_timeout(self, duration: float, properties: Iterable[str] = ()) -> None:
+        self.timeouts += 1
+        self._count_poll(True)
+        self._log_request(REQUEST_STATUS, duration, RESULT_TIMEOUT, properties)
+        self._async_notify()
+
+    @callback
+    def record_preempted(self, duration: float, properties: Iterable[str] = ()) -> None:
+        """A poll was cancelled for a command; it says nothing about the device."""
+        self._log_request(REQUEST_STATUS, duration, RESULT_PREEMPTED, properties)
+
+    @callback
+    def record_command(self, latency: float, properties: Iterable[str] = ()) -> None:
+        """A command push was acknowledged after latency seconds."""
+        self.command_ack.add(latency * 1000)
+        self._log_request(REQUEST_PUSH, latency, RESULT_OK, properties)
+        self._async_notify()
+
+    @callback
+    def record_command_failure(self, duration: float, result: str, properties: Iterable[str] = ()) -> None:
+        self._log_request(REQUEST_PUSH, duration, result, properties)
+
+    @callback
+    def record_wait(self, waited: float) -> None:
+        """A request waited this many seconds for the device."""
+        self.request_wait.add(waited * 1000)
+
+    @callback
+    def record_bind(self, duration: float, result: str = RESULT_OK) -> None:
+        if result == RESULT_OK:
+            self.binds += 1
+        self._log_request(REQUEST_BIND, duration, result, ())
+        self._async_notify()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Everything collected so far, for the diagnostics download."""
+        return {
+            "polls": self.polls,
+            "timeouts": self.timeouts,
+            "timeout_rate": self.timeout_rate,
+            "binds": self.binds,
+            "poll_rtt_ms": self.poll_rtt.as_dict(),
+            "command_ack_ms": self.command_ack.as_dict(),
+            "request_wait_ms": self.request_wait.as_dict(),
+            "recent_requests": [
+                {
+                    "at": at, "kind": kind, "duration_ms": duration,
+                    "result": result, "properties": list(properties),
+                }
+                for at, kind, duration, result, properties in self.recent
+            ],
+        }
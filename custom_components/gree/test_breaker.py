@@ -0,0 +1,38 @@
+"""Tests for the Gree device circuit breaker."""
+from .breaker import STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN, GreeCircuitBreaker
+
+
+def test_opens_after_threshold_and_backs_off_exponentially() -> None:
+    """Test the breaker opens after consecutive failures and doubles its backoff."""
+    breaker = GreeCircuitBreaker(failure_threshold=3, base_backoff=10, max_backoff=35)
+
+    assert not breaker.record_failure(0)
+    assert not breaker.record_failure(1)
+    assert breaker.record_failure(2)
+    assert breaker.state == STATE_OPEN
+    assert not breaker.allow_request(11)
+    assert breaker.retry_in(11) == 1
+
+    assert breaker.allow_request(12)
+    assert breaker.state == STATE_HALF_OPEN
+    assert breaker.record_failure(12) # A failed probe opens it again right away
+    assert breaker.backoff == 20
+
+    breaker.allow_request(32)
+    breaker.record_failure(32)
+    assert breaker.backoff == 35 # Capped
+
+
+def test_success_closes_and_resets() -> None:
+    """Test an answer from the device closes the breaker and forgets the failures."""
+    breaker = GreeCircuitBreaker(failure_threshold=1, base_backoff=10)
+    breaker.record_failure(0)
+    assert breaker.is_open(5)
+
+    breaker.allow_request(10)
+    breaker.record_success()
+
+    assert breaker.state == STATE_CLOSED
+    assert breaker.failures == 0
+    assert breaker.backoff == 0
+    assert not breaker.is_open(10)
@@ -2,14 +2,20 @@
 from datetime import timedelta
 
 from freezegun.api import FrozenDateTimeFactory
+from greeclimate.exceptions import DeviceTimeoutError
 import pytest
 
+from homeassistant.components.bridge import DiscoveryService
 from homeassistant.components.climate import DOMAIN
-from homeassistant.components.const import COORDINATORS, DOMAIN as GREE
+from homeassistant.components.const import (
+    COORDINATORS,
+    DISCOVERY_BIND_RETRY,
+    DOMAIN as GREE,
+)
 from homeassistant.core import HomeAssistant
 import homeassistant.util.dt as dt_util
 
-from .common import async_setup_gree, build_device_mock
+from .common import async_setup_gree, build_device_info_mock, build_device_mock
 
 from tests.common import async_fire_time_changed
 
@@ -68,3 +74,63 @@ async def test_discovery_after_setup(
     device_infos = [x.device.device_info for x in hass.data[GREE][COORDINATORS]]
     assert device_infos[0].ip == "1.1.1.2"
     assert device_infos[1].ip == "2.2.2.1"
+
+
+async def test_rediscovery_is_deduplicated(
+    hass: HomeAssistant, discovery, device
+) -> None:
+    """Test a device found again by MAC is updated, not added twice."""
+    mock_device_1 = build_device_mock(
+        name="fake-device-1", ipAddress="1.1.1.1", mac="aabbcc112233"
+    )
+    mock_device_2 = build_device_mock(
+        name="fake-device-2", ipAddress="2.2.2.2", mac="bbccdd223344"
+    )
+    device.side_effect = [mock_device_1, mock_device_2]
+    hass.data.setdefault(GREE, {})
+
+    service = DiscoveryService(hass)
+    await service.device_found(mock_device_1.device_info)
+    await service.device_found(mock_device_2.device_info)
+    await hass.async_block_till_done()
+
+    # Found again with a new address, e.g. by a fresh discovery object
+    rediscovered = build_device_info_mock(
+        name="fake-device-1", ipAddress="1.1.1.2", mac="aabbcc112233"
+    )
+    await service.device_found(rediscovered)
+    await service.device_update(mock_device_2.device_info)
+    await hass.async_block_till_done()
+
+    assert len(hass.data[GREE][COORDINATORS]) == 2
+    assert device.call_count == 2
+    assert mock_device_1.device_info.ip == "1.1.1.2"
+    assert mock_device_1.update_state.await_count == 2
+    assert mock_device_2.update_state.await_count == 2
+
+
+async def test_bind_failure_is_retried(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory, discovery, device, mock_now
+) -> None:
+    """Test a device that fails to bind is registered once a later bind succeeds."""
+    mock_device_1 = build_device_mock(
+        name="fake-device-1", ipAddress="1.1.1.1", mac="aabbcc112233"
+    )
+    mock_device_1.bind.side_effect = [DeviceTimeoutError, None]
+    device.return_value = mock_device_1
+    device.side_effect = None
+    hass.data.setdefault(GREE, {})
+
+    service = DiscoveryService(hass)
+    await service.device_found(mock_device_1.device_info)
+    await hass.async_block_till_done()
+
+    assert hass.data[GREE][COORDINATORS] == []
+
+    next_update = mock_now + timedelta(seconds=DISCOVERY_BIND_RETRY + 1)
+    freezer.move_to(next_update)
+    async_fire_time_changed(hass, next_update)
+    await hass.async_block_till_done()
+
+    assert len(hass.data[GREE][COORDINATORS]) == 1
+    assert mock_device_1.bind.await_count == 2
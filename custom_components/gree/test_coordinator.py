@@ -0,0 +1,638 @@
+"""Tests for the Gree climate update coordinator."""
+import asyncio
+from unittest.mock import ANY, AsyncMock, Mock, patch
+
+from greeclimate.exceptions import DeviceTimeoutError
+import pytest
+
+from homeassistant.components.climate import FAN_HIGH, HVACMode
+from homeassistant.const import CONF_HOST, CONF_MAC, CONF_NAME, CONF_PORT
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .const import (
+    CIPHER_GCM,
+    CONF_COALESCE_WINDOW,
+    CONF_FAST_START,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_UPDATE_INTERVAL,
+    CONVERGE_MAX_TIME,
+    CONVERGE_STALL_TIME,
+    DOMAIN,
+    GREE_POWER_OFF,
+    GREE_POWER_ON,
+    GREE_PROPERTY_LIGHT,
+    GREE_PROPERTY_CURRENT_TEMPERATURE,
+    GREE_PROPERTY_MODE,
+    GREE_PROPERTY_POWER,
+    GREE_REQUIRED_PROPERTIES,
+    HA_HVACMODE_TO_GREE_MODE_INT,
+    GREE_PROPERTY_TARGET_TEMPERATURE,
+    VS_FULL,
+)
+from .coordinator import GreeClimateUpdateCoordinator
+from .onboarding import async_hand_over
+from .state import GreeState
+from .store import async_get_key_store, async_get_state_store
+from .transport import DeviceKeyRejectedError
+
+from tests.common import MockConfigEntry
+
+ENTRY_DATA = {
+    CONF_NAME: "Living Room",
+    CONF_HOST: "1.1.1.1",
+    CONF_PORT: 7000,
+    CONF_MAC: "aa:bb:cc:11:22:33",
+}
+
+
+def build_coordinator(hass: HomeAssistant, **options) -> GreeClimateUpdateCoordinator:
+    """Build a coordinator whose device is a mock."""
+    entry = MockConfigEntry(domain=DOMAIN, title="Living Room", data=ENTRY_DATA, options=options)
+    entry.add_to_hass(hass)
+    coordinator = GreeClimateUpdateCoordinator(hass, entry)
+    coordinator.device = Mock(
+        device_key="0123456789abcdef",
+        push_state_update=AsyncMock(return_value=None),
+        update_state=AsyncMock(),
+        probe=AsyncMock(),
+        _properties={GREE_PROPERTY_POWER: GREE_POWER_ON},
+        _dirty=[],
+        current_temperature=24,
+    )
+    coordinator.data = GreeState({GREE_PROPERTY_POWER: GREE_POWER_ON})
+    return coordinator
+
+
+async def test_rapid_commands_share_one_push(hass: HomeAssistant) -> None:
+    """Test set_* calls within the coalescing window are sent as one push."""
+    coordinator = build_coordinator(hass, **{CONF_COALESCE_WINDOW: 50})
+
+    await asyncio.gather(
+        coordinator.async_set_target_temperature(22),
+        coordinator.async_set_fan_mode(FAN_HIGH),
+        coordinator.async_set_vertical_swing(VS_FULL),
+    )
+
+    coordinator.device.push_state_update.assert_awaited_once()
+    assert coordinator.device.target_temperature == 22
+    assert coordinator.device.fan_speed == 5
+    coordinator.device.set_property.assert_called_once_with(ANY, 1)
+    await coordinator.async_shutdown()
+
+
+async def test_last_write_wins_within_window(hass: HomeAssistant) -> None:
+    """Test repeated writes to one property only send the latest value."""
+    coordinator = build_coordinator(hass, **{CONF_COALESCE_WINDOW: 50})
+
+    await asyncio.gather(
+        coordinator.async_set_target_temperature(20),
+        coordinator.async_set_target_temperature(21),
+        coordinator.async_set_target_temperature(23),
+    )
+
+    coordinator.device.push_state_update.assert_awaited_once()
+    assert coordinator.device.target_temperature == 23
+    await coordinator.async_shutdown()
+
+
+async def test_hvac_mode_from_off_is_one_packet(hass: HomeAssistant) -> None:
+    """Test switching on into a mode sends Pow and Mod together."""
+    coordinator = build_coordinator(hass)
+    coordinator.data = GreeState({GREE_PROPERTY_POWER: GREE_POWER_OFF})
+
+    await coordinator.async_set_hvac_mode(HVACMode.COOL)
+
+    coordinator.device.push_state_update.assert_awaited_once()
+    assert coordinator.device.power is True
+    assert coordinator.device.mode == 1
+    await coordinator.async_shutdown()
+
+
+async def test_confirmed_ack_skips_refresh(hass: HomeAssistant) -> None:
+    """Test no poll follows a command whose ack echoes the sent values."""
+    coordinator = build_coordinator(hass)
+    coordinator.device._dirty = [GREE_PROPERTY_TARGET_TEMPERATURE]
+    coordinator.device._properties[GREE_PROPERTY_TARGET_TEMPERATURE] = 22
+    coordinator.device.push_state_update.return_value = {GREE_PROPERTY_TARGET_TEMPERATURE: 22}
+
+    await coordinator.async_set_target_temperature(22)
+    await hass.async_block_till_done()
+
+    coordinator.device.update_state.assert_not_awaited()
+    assert coordinator.data[GREE_PROPERTY_TARGET_TEMPERATURE] == 22
+    await coordinator.async_shutdown()
+
+
+async def test_ack_matching_optimistic_state_writes_once(hass: HomeAssistant) -> None:
+    """Test an ack that only confirms the optimistic values doesn't notify listeners again."""
+    coordinator = build_coordinator(hass)
+    coordinator.last_update_success = True
+    listener = Mock()
+    unsub = coordinator.async_add_property_listener(listener, [GREE_PROPERTY_LIGHT])
+    coordinator.device.push_state_update.return_value = {GREE_PROPERTY_LIGHT: GREE_POWER_ON}
+
+    await coordinator.async_set_light(True)
+    await hass.async_block_till_done()
+
+    assert listener.call_count == 1 # The optimistic update only
+    unsub()
+    await coordinator.async_shutdown()
+
+
+async def test_mismatched_ack_falls_back_to_refresh(hass: HomeAssistant) -> None:
+    """Test a command is followed by a poll when the ack disagrees."""
+    coordinator = build_coordinator(hass)
+    coordinator.device._dirty = [GREE_PROPERTY_TARGET_TEMPERATURE]
+    coordinator.device._properties[GREE_PROPERTY_TARGET_TEMPERATURE] = 22
+    coordinator.device.push_state_update.return_value = {GREE_PROPERTY_TARGET_TEMPERATURE: 25}
+
+    await coordinator.async_set_target_temperature(22)
+    await hass.async_block_till_done()
+
+    coordinator.device.update_state.assert_awaited_once()
+    await coordinator.async_shutdown()
+
+
+async def test_unchanged_poll_does_not_wake_listeners(hass: HomeAssistant) -> None:
+    """Test polls that change no exposed property are suppressed."""
+    coordinator = build_coordinator(hass)
+    coordinator.data = None
+    listener = Mock()
+    unsub = coordinator.async_add_listener(listener)
+
+    await coordinator.async_refresh()
+    assert listener.call_count == 1
+
+    coordinator.device._properties["hid"] = "362001000762+U-CS532AE(LT)V3.31.bin"
+    await coordinator.async_refresh()
+    assert listener.call_count == 1
+    assert coordinator.suppressed_updates == 1
+    assert "hid" not in coordinator.data # Only exposed properties are kept
+
+    coordinator.device._properties[GREE_PROPERTY_POWER] = GREE_POWER_OFF
+    await coordinator.async_refresh()
+    assert listener.call_count == 2
+
+    unsub()
+    await coordinator.async_shutdown()
+
+
+async def test_property_listeners_only_get_their_changes(hass: HomeAssistant) -> None:
+    """Test listeners subscribed to property keys skip unrelated changes."""
+    coordinator = build_coordinator(hass)
+    coordinator.data = None
+    light_listener = Mock()
+    power_listener = Mock()
+    unsub_light = coordinator.async_add_property_listener(light_listener, [GREE_PROPERTY_LIGHT])
+    unsub_power = coordinator.async_add_property_listener(power_listener, [GREE_PROPERTY_POWER])
+
+    await coordinator.async_refresh()
+    assert light_listener.call_count == 1
+    assert power_listener.call_count == 1
+
+    coordinator.device._properties[GREE_PROPERTY_POWER] = GREE_POWER_OFF
+    await coordinator.async_refresh()
+    assert light_listener.call_count == 1
+    assert power_listener.call_count == 2
+
+    unsub_light()
+    unsub_power()
+    await coordinator.async_shutdown()
+
+
+async def test_poll_interval_adapts_to_activity(hass: HomeAssistant) -> None:
+    """Test polling speeds up after commands and slows down while idle."""
+    coordinator = build_coordinator(
+        hass, **{CONF_UPDATE_INTERVAL: 30, CONF_MIN_UPDATE_INTERVAL: 5, CONF_MAX_UPDATE_INTERVAL: 300}
+    )
+    coordinator.data = None
+    coordinator.device._properties = {GREE_PROPERTY_POWER: GREE_POWER_OFF}
+
+    for _ in range(4):
+        await coordinator.async_refresh()
+    assert coordinator.poll_interval == 300
+
+    await coordinator.async_set_power(True)
+    assert coordinator.poll_interval == 5
+
+    coordinator._fast_poll_until = 0
+    coordinator.device._properties = {
+        GREE_PROPERTY_POWER: GREE_POWER_ON,
+        GREE_PROPERTY_MODE: HA_HVACMODE_TO_GREE_MODE_INT[HVACMode.COOL],
+        GREE_PROPERTY_TARGET_TEMPERATURE: 22,
+        GREE_PROPERTY_CURRENT_TEMPERATURE: 27,
+    }
+    coordinator.device.current_temperature = 27
+    await coordinator.async_refresh()
+    assert coordinator.poll_interval == 5
+
+    coordinator.device._properties[GREE_PROPERTY_CURRENT_TEMPERATURE] = 22
+    coordinator.device.current_temperature = 22
+    await coordinator.async_refresh()
+    assert coordinator.poll_interval == 30
+    await coordinator.async_shutdown()
+
+
+async def test_fast_polling_needs_a_shrinking_gap(hass: HomeAssistant) -> None:
+    """Test units that stall off the setpoint, or have none to reach, poll at the regular rate."""
+    coordinator = build_coordinator(
+        hass, **{CONF_UPDATE_INTERVAL: 30, CONF_MIN_UPDATE_INTERVAL: 5, CONF_MAX_UPDATE_INTERVAL: 300}
+    )
+    coordinator.data = None
+    coordinator.device._properties = {
+        GREE_PROPERTY_POWER: GREE_POWER_ON,
+        GREE_PROPERTY_MODE: HA_HVACMODE_TO_GREE_MODE_INT[HVACMode.FAN_ONLY],
+        GREE_PROPERTY_TARGET_TEMPERATURE: 22,
+        GREE_PROPERTY_CURRENT_TEMPERATURE: 27,
+    }
+    coordinator.device.current_temperature = 27
+    await coordinator.async_refresh()
+    assert coordinator.poll_interval == 30 # Fan only has nothing to converge on
+
+    coordinator.device._properties[GREE_PROPERTY_MODE] = HA_HVACMODE_TO_GREE_MODE_INT[HVACMode.COOL]
+    await coordinator.async_refresh()
+    assert coordinator.poll_interval == 5
+
+    # Settles two degrees off the setpoint and stays there
+    coordinator.device._properties[GREE_PROPERTY_CURRENT_TEMPERATURE] = 24
+    coordinator.device.current_temperature = 24
+    await coordinator.async_refresh()
+    assert coordinator.poll_interval == 5
+    coordinator._gap_shrunk_at -= CONVERGE_STALL_TIME
+    await coordinator.async_refresh()
+    assert coordinator.poll_interval == 30
+
+    # Still improving, but for too long
+    coordinator.device._properties[GREE_PROPERTY_CURRENT_TEMPERATURE] = 23
+    coordinator.device.current_temperature = 23
+    coordinator._converging_since -= CONVERGE_MAX_TIME
+    await coordinator.async_refresh()
+    assert coordinator.poll_interval == 30
+    await coordinator.async_shutdown()
+
+
+async def test_stored_key_skips_bind(hass: HomeAssistant) -> None:
+    """Test a stored key is used without binding the device again."""
+    await async_get_key_store(hass).async_set_key("aabbcc112233", "fedcba9876543210", CIPHER_GCM)
+    coordinator = build_coordinator(hass)
+    coordinator.device.device_key = None
+    coordinator.device.bind = AsyncMock()
+
+    await coordinator.async_refresh()
+
+    coordinator.device.bind.assert_awaited_once_with(key="fedcba9876543210", cipher=CIPHER_GCM)
+    await coordinator.async_shutdown()
+
+
+async def test_rejected_stored_key_rebinds(hass: HomeAssistant) -> None:
+    """Test the device is bound again when it answers in a key other than the stored one."""
+    store = async_get_key_store(hass)
+    await store.async_set_key("aabbcc112233", "fedcba9876543210", CIPHER_GCM)
+    coordinator = build_coordinator(hass)
+    coordinator.device.device_key = None
+    coordinator.device.cipher = "ecb"
+
+    async def bind(key=None, cipher=None):
+        coordinator.device.device_key = key or "0123456789abcdef"
+
+    coordinator.device.bind = AsyncMock(side_effect=bind)
+    coordinator.device.update_state.side_effect = [DeviceKeyRejectedError, None]
+
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.device.bind.await_count == 2
+    assert await store.async_get("aabbcc112233") == {"key": "0123456789abcdef", "cipher": "ecb"}
+    await coordinator.async_shutdown()
+
+
+async def test_key_store_loads_once(hass: HomeAssistant) -> None:
+    """Test callers racing the first load share it and keep each other's keys."""
+    store = async_get_key_store(hass)
+
+    async def slow_load():
+        await asyncio.sleep(0.01)
+        return {"ddeeff445566": {"key": "fedcba9876543210", "cipher": CIPHER_GCM}}
+
+    load = AsyncMock(side_effect=slow_load)
+
+    with patch.object(store._store, "async_load", load):
+        await asyncio.gather(
+            store.async_set_key("aabbcc112233", "0123456789abcdef", CIPHER_GCM),
+            store.async_get("ddeeff445566"),
+        )
+
+    load.assert_awaited_once()
+    assert await store.async_get("aabbcc112233") == {"key": "0123456789abcdef", "cipher": CIPHER_GCM}
+
+
+async def test_offline_unit_keeps_stored_key(hass: HomeAssistant) -> None:
+    """Test a timeout with a stored key neither rebinds nor forgets the key."""
+    store = async_get_key_store(hass)
+    await store.async_set_key("aabbcc112233", "fedcba9876543210", CIPHER_GCM)
+    coordinator = build_coordinator(hass)
+    coordinator.device.device_key = None
+    coordinator.device.bind = AsyncMock()
+    coordinator.device.update_state.side_effect = DeviceTimeoutError
+
+    await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+    coordinator.device.bind.assert_awaited_once_with(key="fedcba9876543210", cipher=CIPHER_GCM)
+    assert await store.async_get("aabbcc112233") == {"key": "fedcba9876543210", "cipher": CIPHER_GCM}
+    await coordinator.async_shutdown()
+
+
+async def test_config_flow_handshake_is_adopted(hass: HomeAssistant) -> None:
+    """Test the entry's first setup reuses the config flow's bind and poll."""
+    flow_device = Mock(
+        device_info=Mock(mac="aabbcc112233"), device_key="fedcba9876543210", cipher=CIPHER_GCM,
+        _properties={GREE_PROPERTY_POWER: GREE_POWER_ON, GREE_PROPERTY_LIGHT: GREE_POWER_OFF},
+        hid="362001000762+U-CS532AE(LT)V3.31.bin", version="3.31",
+    )
+    async_hand_over(hass, flow_device)
+    coordinator = build_coordinator(hass)
+    coordinator.data = None
+    coordinator.device.bind = AsyncMock()
+
+    assert coordinator.async_adopt_handshake()
+
+    assert coordinator.last_update_success
+    assert coordinator.data.light is False
+    assert coordinator.device.device_key == "fedcba9876543210"
+    assert coordinator.device.cipher == CIPHER_GCM
+    coordinator.device.bind.assert_not_awaited()
+    coordinator.device.update_state.assert_not_awaited()
+    assert not coordinator.async_adopt_handshake() # Used up
+    await coordinator.async_shutdown()
+
+
+async def test_fast_start_restores_state_and_meets_deadline(hass: HomeAssistant) -> None:
+    """Test fast start comes up from the stored state and gives up on a silent unit."""
+    await async_get_state_store(hass).async_set("aabbcc112233", {GREE_PROPERTY_POWER: GREE_POWER_ON})
+    coordinator = build_coordinator(hass, **{CONF_FAST_START: True})
+
+    await coordinator.async_restore_last_state()
+    assert coordinator.data == {GREE_PROPERTY_POWER: GREE_POWER_ON}
+    assert not coordinator.last_update_success
+
+    async def silent_unit(properties):
+        await asyncio.sleep(10)
+
+    coordinator.device.update_state.side_effect = silent_unit
+    with patch("custom_components.gree.coordinator.FAST_START_DEADLINE", 0.05):
+        await asyncio.wait_for(coordinator.async_background_first_refresh(), 1)
+
+    assert not coordinator.last_update_success
+    assert coordinator.data == {GREE_PROPERTY_POWER: GREE_POWER_ON}
+    await coordinator.async_shutdown()
+
+
+async def test_shutdown_ends_background_first_refresh(hass: HomeAssistant) -> None:
+    """Test shutdown cancels the fast start poll."""
+    coordinator = build_coordinator(hass, **{CONF_FAST_START: True})
+    polling = asyncio.Event()
+
+    async def silent_unit(properties):
+        polling.set()
+        await asyncio.sleep(10)
+
+    coordinator.device.update_state.side_effect = silent_unit
+    first_refresh = asyncio.create_task(coordinator.async_background_first_refresh())
+    await polling.wait()
+    await coordinator.async_shutdown()
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(first_refresh, 1)
+
+
+async def test_poll_in_flight_at_shutdown_fails_cleanly(hass: HomeAssistant) -> None:
+    """Test a poll still binding when the coordinator shuts down fails without reaching the device."""
+    coordinator = build_coordinator(hass)
+    coordinator.device.device_key = None
+    binding = asyncio.Event()
+    release = asyncio.Event()
+
+    async def bind(key=None, cipher=None):
+        binding.set()
+        await release.wait()
+        coordinator.device.device_key = "0123456789abcdef"
+
+    coordinator.device.bind = AsyncMock(side_effect=bind)
+    refresh = asyncio.create_task(coordinator.async_refresh())
+    await binding.wait()
+    await coordinator.async_shutdown()
+    release.set()
+    await asyncio.wait_for(refresh, 1)
+
+    assert not coordinator.last_update_success
+    assert isinstance(coordinator.last_exception, UpdateFailed)
+    assert "shut down" in str(coordinator.last_exception)
+    coordinator.device.update_state.assert_not_awaited()
+
+
+async def test_unreachable_device_opens_breaker(hass: HomeAssistant) -> None:
+    """Test repeated timeouts stop polls and fail commands without device traffic."""
+    coordinator = build_coordinator(hass)
+    coordinator.device.update_state.side_effect = DeviceTimeoutError
+
+    for _ in range(3):
+        await coordinator.async_refresh()
+    assert coordinator.device.update_state.await_count == 3
+    # The wake-up HA schedules from the whole second is not refused
+    wake_up = int(hass.loop.time()) + coordinator.update_interval.total_seconds()
+    assert not coordinator.circuit_breaker.is_open(wake_up)
+
+    await coordinator.async_refresh()
+    assert coordinator.device.update_state.await_count == 3
+    with pytest.raises(HomeAssistantError):
+        await coordinator.async_set_light(True)
+    coordinator.device.push_state_update.assert_not_awaited()
+
+    # Once the backoff is over a probe runs first and closes the breaker
+    coordinator.device.update_state.side_effect = None
+    coordinator.circuit_breaker._retry_at = hass.loop.time()
+    await coordinator.async_refresh()
+    coordinator.device.probe.assert_awaited_once()
+    assert coordinator.last_update_success
+    assert coordinator.circuit_breaker.failures == 0
+    await coordinator.async_shutdown()
+
+
+async def test_probe_with_rejected_stored_key_rebinds(hass: HomeAssistant) -> None:
+    """Test a breaker probe answered in another key binds again instead of reopening the breaker."""
+    store = async_get_key_store(hass)
+    await store.async_set_key("aabbcc112233", "fedcba9876543210", CIPHER_GCM)
+    coordinator = build_coordinator(hass)
+    coordinator.device.device_key = None
+    coordinator.device.cipher = "ecb"
+
+    async def bind(key=None, cipher=None):
+        coordinator.device.device_key = key or "0123456789abcdef"
+
+    coordinator.device.bind = AsyncMock(side_effect=bind)
+    coordinator.device.update_state.side_effect = DeviceTimeoutError
+    for _ in range(3):
+        await coordinator.async_refresh()
+    assert coordinator.device.bind.await_count == 1 # Stored key only
+
+    coordinator.device.update_state.side_effect = None
+    coordinator.device.probe.side_effect = [DeviceKeyRejectedError, None]
+    coordinator.circuit_breaker._retry_at = hass.loop.time()
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.circuit_breaker.failures == 0
+    assert coordinator.device.bind.await_count == 2
+    assert await store.async_get("aabbcc112233") == {"key": "0123456789abcdef", "cipher": "ecb"}
+    await coordinator.async_shutdown()
+
+
+async def test_silent_unit_does_not_stall_fleet_polls(hass: HomeAssistant) -> None:
+    """Test a unit that doesn't answer only holds a fleet-wide poll slot until the poll deadline."""
+    silent = build_coordinator(hass)
+    healthy = build_coordinator(hass)
+    silent._poll_scheduler._semaphore = asyncio.Semaphore(1)
+
+    async def no_answer(properties):
+        await asyncio.sleep(10)
+
+    silent.device.update_state.side_effect = no_answer
+    with patch("custom_components.gree.coordinator.POLL_DEADLINE", 0.05):
+        await asyncio.wait_for(asyncio.gather(silent.async_refresh(), healthy.async_refresh()), 1)
+
+    assert not silent.last_update_success
+    assert healthy.last_update_success
+    await silent.async_shutdown()
+    await healthy.async_shutdown()
+
+
+async def test_command_preempts_stuck_poll(hass: HomeAssistant) -> None:
+    """Test a command does not wait for a poll that is timing out."""
+    coordinator = build_coordinator(hass, **{CONF_COALESCE_WINDOW: 0})
+    poll_started = asyncio.Event()
+
+    async def stuck_poll(properties):
+        poll_started.set()
+        await asyncio.sleep(10)
+
+    coordinator.device.update_state.side_effect = stuck_poll
+    refresh = asyncio.create_task(coordinator.async_refresh())
+    await poll_started.wait()
+
+    await asyncio.wait_for(coordinator.async_set_light(True), 1)
+    await refresh
+
+    coordinator.device.push_state_update.assert_awaited_once()
+    assert coordinator.preempted_polls == 1
+    assert coordinator.command_queue_wait < 1
+    await coordinator.async_shutdown()
+
+
+async def test_stale_poll_keeps_optimistic_value(hass: HomeAssistant) -> None:
+    """Test a poll that read the device before a write was sent does not revert it."""
+    coordinator = build_coordinator(hass, **{CONF_COALESCE_WINDOW: 200})
+    coordinator.device._properties = {GREE_PROPERTY_POWER: GREE_POWER_ON, GREE_PROPERTY_LIGHT: GREE_POWER_OFF}
+    coordinator.data = GreeState({GREE_PROPERTY_POWER: GREE_POWER_ON, GREE_PROPERTY_LIGHT: GREE_POWER_OFF})
+    listener = Mock()
+    unsub = coordinator.async_add_property_listener(listener, [GREE_PROPERTY_LIGHT])
+
+    command = asyncio.create_task(coordinator.async_set_light(True))
+    await asyncio.sleep(0)
+    assert coordinator.data[GREE_PROPERTY_LIGHT] == GREE_POWER_ON
+    assert listener.call_count == 1
+
+    await coordinator.async_refresh() # Device still reports the light off
+    assert coordinator.data[GREE_PROPERTY_LIGHT] == GREE_POWER_ON
+    assert listener.call_count == 1
+
+    await command
+    coordinator.device._properties[GREE_PROPERTY_LIGHT] = GREE_POWER_ON
+    await coordinator.async_refresh()
+    assert coordinator.data[GREE_PROPERTY_LIGHT] == GREE_POWER_ON
+    assert listener.call_count == 1
+    assert not coordinator._unconfirmed
+
+    unsub()
+    await coordinator.async_shutdown()
+
+
+async def test_failed_push_reverts_optimistic_value(hass: HomeAssistant) -> None:
+    """Test values of a write that never reached the device are rolled back."""
+    coordinator = build_coordinator(hass)
+    coordinator.data = GreeState({GREE_PROPERTY_POWER: GREE_POWER_ON, GREE_PROPERTY_LIGHT: GREE_POWER_OFF})
+    coordinator.device.push_state_update.side_effect = DeviceTimeoutError
+
+    await coordinator.async_set_light(True)
+
+    assert coordinator.data[GREE_PROPERTY_LIGHT] == GREE_POWER_OFF
+    assert not coordinator._unconfirmed
+    await coordinator.async_shutdown()
+
+
+async def test_poll_requests_only_listened_properties(hass: HomeAssistant) -> None:
+    """Test the status request covers the listening entities' keys and the required ones."""
+    coordinator = build_coordinator(hass)
+
+    await coordinator.async_refresh()
+    assert GREE_PROPERTY_LIGHT in coordinator.device.update_state.await_args.args[0]
+
+    unsub = coordinator.async_add_property_listener(Mock(), [GREE_PROPERTY_LIGHT])
+    await coordinator.async_refresh()
+    assert set(coordinator.device.update_state.await_args.args[0]) == {
+        GREE_PROPERTY_LIGHT, *GREE_REQUIRED_PROPERTIES
+    }
+
+    unsub()
+    await coordinator.async_shutdown()
+
+
+async def test_poll_is_decoded_into_snapshot(hass: HomeAssistant) -> None:
+    """Test entities get HA values from the snapshot and writes yield new snapshots."""
+    coordinator = build_coordinator(hass)
+    coordinator.data = None
+    coordinator.device._properties = {
+        GREE_PROPERTY_POWER: GREE_POWER_ON, "Mod": 1, "WdSpd": 5, "SwUpDn": 1, "hid": "x",
+    }
+
+    await coordinator.async_refresh()
+    snapshot = coordinator.data
+    assert snapshot.hvac_mode == HVACMode.COOL
+    assert snapshot.fan_mode == FAN_HIGH
+    assert snapshot.swing_mode == VS_FULL
+    assert snapshot.current_temperature == 24.0
+    with pytest.raises(AttributeError):
+        snapshot.power = False
+
+    await coordinator.async_set_light(True)
+    assert coordinator.data is not snapshot
+    assert coordinator.data.light
+    assert not snapshot.light
+    await coordinator.async_shutdown()
+
+
+async def test_requests_feed_telemetry(hass: HomeAssistant) -> None:
+    """Test polls, timeouts and command acks are counted for the diagnostic sensors."""
+    coordinator = build_coordinator(hass, **{CONF_COALESCE_WINDOW: 0})
+    updates = Mock()
+    coordinator.telemetry.async_add_listener(updates)
+
+    await coordinator.async_refresh()
+    coordinator.device.update_state.side_effect = DeviceTimeoutError
+    await coordinator.async_refresh()
+    coordinator.device.update_state.side_effect = None
+    await coordinator.async_set_light(True)
+
+    telemetry = coordinator.telemetry
+    assert telemetry.polls == 2
+    assert telemetry.timeouts == 1
+    assert telemetry.poll_rtt.count == 1
+    assert 0 < telemetry.timeout_rate < 100
+    assert telemetry.command_ack.count == 1
+    assert updates.call_count >= 3
+    assert [(request["kind"], request["result"]) for request in telemetry.as_dict()["recent_requests"]] == [
+        ("status", "ok"), ("status", "timeout"), ("push", "ok"),
+    ]
+    await coordinator.async_shutdown()
@@ -0,0 +1,23 @@
+"""Tests for the Gree diagnostics."""
+from homeassistant.const import CONF_HOST, CONF_MAC
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .diagnostics import async_get_config_entry_diagnostics
+from .test_coordinator import build_coordinator
+
+
+async def test_diagnostics_redact_identity(hass: HomeAssistant) -> None:
+    """Test the dump carries the request log but no MAC, host or key."""
+    coordinator = build_coordinator(hass)
+    hass.data.setdefault(DOMAIN, {})[coordinator.entry.entry_id] = coordinator
+    await coordinator.async_refresh()
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, coordinator.entry)
+
+    assert diagnostics["entry"]["data"][CONF_MAC] == "**REDACTED**"
+    assert diagnostics["entry"]["data"][CONF_HOST] == "**REDACTED**"
+    assert diagnostics["device"]["device_key"] == "**REDACTED**"
+    assert diagnostics["telemetry"]["recent_requests"][0]["kind"] == "status"
+    assert sum(diagnostics["telemetry"]["poll_rtt_ms"]["histogram"].values()) == 1
+    await coordinator.async_shutdown()
@@ -0,0 +1,83 @@
+"""Tests for validating new Gree units in bulk."""
+import pytest
+
+from homeassistant.const import CONF_HOST, CONF_MAC, CONF_NAME, CONF_PORT
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_HANDOFF, DOMAIN, HANDOFF_MAX_AGE
+from .onboarding import (
+    async_hand_over,
+    async_take_handoff,
+    async_validate_devices,
+    dedupe_candidates,
+    parse_device_list,
+)
+from .simulator import GreeSimulator
+from .transport import GreeTransportPool
+
+
+def test_parse_csv_and_yaml() -> None:
+    """Test both list formats give the same candidates."""
+    csv_text = "host,name,mac\n10.20.0.5, Office, AA:BB:CC:00:11:22\n# spare\n10.20.0.6\n"
+    yaml_text = "- host: 10.20.0.5\n  name: Office\n  mac: AA-BB-CC-00-11-22\n- 10.20.0.6\n"
+
+    expected = [
+        {CONF_HOST: "10.20.0.5", CONF_NAME: "Office", CONF_PORT: 7000, CONF_MAC: "aabbcc001122"},
+        {CONF_HOST: "10.20.0.6", CONF_NAME: None, CONF_PORT: 7000, CONF_MAC: None},
+    ]
+    assert parse_device_list(csv_text) == expected
+    assert parse_device_list(yaml_text) == expected
+    with pytest.raises(ValueError):
+        parse_device_list("kitchen-ac\n")
+
+
+async def test_units_are_validated_concurrently() -> None:
+    """Test each unit gets its own result, with MACs found by asking the unit."""
+    pool = GreeTransportPool(size=1)
+    async with GreeSimulator(3, seed=3) as simulator:
+        known, unknown, silent = simulator.units
+        silent.loss = 1.0
+        candidates = [
+            {CONF_HOST: "127.0.0.1", CONF_NAME: "Known", CONF_PORT: known.port, CONF_MAC: known.mac},
+            {CONF_HOST: "127.0.0.1", CONF_NAME: None, CONF_PORT: unknown.port, CONF_MAC: None},
+            {CONF_HOST: "127.0.0.1", CONF_NAME: None, CONF_PORT: silent.port, CONF_MAC: None},
+        ]
+
+        results = await async_validate_devices(pool, candidates)
+
+    assert [result.error for result in results] == [None, None, "cannot_connect"]
+    assert results[0].device.device_key == known.key
+    assert results[1].device_info.mac == unknown.mac
+    assert results[1].device_info.name == unknown.name
+    pool.close()
+
+
+def test_dedupe_keeps_units_sharing_an_address() -> None:
+    """Test units are deduplicated by MAC, or by host and port without one."""
+    candidates = parse_device_list(
+        "host,port,mac\n10.20.0.5,7000,\n10.20.0.5,7001,\n10.20.0.5,7001,\n"
+        "10.20.0.6,7000,aabbcc001122\n10.20.0.7,7000,AA:BB:CC:00:11:22\n"
+    )
+
+    assert [(c[CONF_HOST], c[CONF_PORT]) for c in dedupe_candidates(candidates)] == [
+        ("10.20.0.5", 7000), ("10.20.0.5", 7001), ("10.20.0.7", 7000),
+    ]
+
+
+async def test_stale_handoffs_are_pruned(hass: HomeAssistant) -> None:
+    """Test handoffs nobody took are dropped once stale, when the next one is added."""
+    pool = GreeTransportPool(size=1)
+    async with GreeSimulator(2, seed=4) as simulator:
+        first, second = simulator.units
+        results = await async_validate_devices(pool, [
+            {CONF_HOST: unit.host, CONF_NAME: None, CONF_PORT: unit.port, CONF_MAC: unit.mac}
+            for unit in simulator.units
+        ])
+    pool.close()
+
+    async_hand_over(hass, results[0].device)
+    hass.data[DOMAIN][DATA_HANDOFF][first.mac]["at"] -= HANDOFF_MAX_AGE + 1 # Its import aborted
+    async_hand_over(hass, results[1].device)
+
+    assert list(hass.data[DOMAIN][DATA_HANDOFF]) == [second.mac]
+    assert async_take_handoff(hass, second.mac)["key"] == second.key
@@ -0,0 +1,27 @@
+"""Tests for the Gree subnet sweep."""
+import asyncio
+from ipaddress import ip_network
+
+from .const import CIPHER_ECB, CIPHER_GCM
+from .scan import async_scan_network
+from .simulator import SimulatedGreeUnit
+
+
+async def test_sweep_finds_units_across_ciphers() -> None:
+    """Test every answering host is returned with its cipher, silent ones time out."""
+    loop = asyncio.get_running_loop()
+    ecb_unit = SimulatedGreeUnit("f4911e000001", "Office")
+    gcm_unit = SimulatedGreeUnit("f4911e000002", "Lab", CIPHER_GCM)
+    first, _ = await loop.create_datagram_endpoint(lambda: ecb_unit, local_addr=("127.0.0.2", 0))
+    second, _ = await loop.create_datagram_endpoint(lambda: gcm_unit, local_addr=("127.0.0.3", ecb_unit.port))
+
+    results = await async_scan_network(ip_network("127.0.0.0/29"), ecb_unit.port, timeout=0.2, concurrency=2)
+    first.close()
+    second.close()
+
+    assert [(result.device_info.ip, result.device_info.mac, result.cipher) for result in results] == [
+        ("127.0.0.2", "f4911e000001", CIPHER_ECB),
+        ("127.0.0.3", "f4911e000002", CIPHER_GCM),
+    ]
+    assert results[0].device_info.name == "Office"
+    assert results[0].device_info.version == "V1.1.13"
@@ -0,0 +1,91 @@
+"""Tests for the Gree request scheduling."""
+import asyncio
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_POLL_SCHEDULER, DOMAIN
+from .scheduler import (
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    DeviceRequestQueue,
+    GreePollScheduler,
+    async_acquire_poll_scheduler,
+    async_release_poll_scheduler,
+)
+
+
+def test_phases_are_spread_evenly() -> None:
+    """Test devices get distinct, evenly spaced slots in the interval."""
+    scheduler = GreePollScheduler()
+    macs = [f"aabbcc0000{i:02x}" for i in range(40)]
+    for mac in reversed(macs):
+        scheduler.register(mac)
+
+    fire_times = sorted((100 + scheduler.next_delay(mac, 30, 100)) % 30 for mac in macs)
+
+    assert fire_times == [i * 30 / 40 for i in range(40)]
+
+
+def test_delay_stays_near_interval() -> None:
+    """Test aligning to the phase never more than halves or adds half an interval."""
+    scheduler = GreePollScheduler()
+    scheduler.register("aabbcc000001")
+    scheduler.register("aabbcc000002")
+
+    for now in range(0, 120, 7):
+        delay = scheduler.next_delay("aabbcc000002", 30, now)
+        assert 15 <= delay < 45
+        assert (now + delay) % 30 == 15
+
+
+async def test_scheduler_is_shared_and_released(hass: HomeAssistant) -> None:
+    """Test all devices share one scheduler that goes away with the last one."""
+    first = async_acquire_poll_scheduler(hass, "aabbcc000001")
+    second = async_acquire_poll_scheduler(hass, "aabbcc000002")
+    assert first is second
+    assert first.phase("aabbcc000002") == 0.5
+
+    async_release_poll_scheduler(hass, "aabbcc000001")
+    assert first.phase("aabbcc000002") == 0.0
+
+    async_release_poll_scheduler(hass, "aabbcc000002")
+    assert DATA_POLL_SCHEDULER not in hass.data[DOMAIN]
+
+
+async def test_commands_are_served_before_polls() -> None:
+    """Test a waiting command gets the device before a poll queued earlier."""
+    queue = DeviceRequestQueue()
+    order = []
+
+    async def request(priority, name):
+        async with queue.slot(priority):
+            order.append(name)
+            await asyncio.sleep(0)
+
+    async with queue.slot(PRIORITY_COMMAND):
+        tasks = [
+            asyncio.create_task(request(PRIORITY_POLL, "poll")),
+            asyncio.create_task(request(PRIORITY_COMMAND, "command")),
+        ]
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+
+    assert order == ["command", "poll"]
+
+
+async def test_command_preempts_in_flight_poll() -> None:
+    """Test a command cancels a poll stuck on the network instead of waiting."""
+    queue = DeviceRequestQueue()
+
+    async def poll():
+        async with queue.slot(PRIORITY_POLL):
+            return await queue.run_preemptible(asyncio.sleep(10))
+
+    poll_task = asyncio.create_task(poll())
+    await asyncio.sleep(0)
+    async with queue.slot(PRIORITY_COMMAND) as waited:
+        assert waited < 1
+
+    assert await poll_task is False
+    assert queue.preempted_polls == 1
+    assert not queue.busy
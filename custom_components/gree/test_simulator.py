@@ -0,0 +1,74 @@
+"""Tests for the Gree protocol simulator."""
+import asyncio
+import json
+
+from greeclimate.device import DeviceInfo
+from greeclimate.exceptions import DeviceTimeoutError
+import pytest
+
+from .const import CIPHER_GCM, GREE_PROPERTY_LIGHT
+from .simulator import QUIRK_NO_CID, QUIRK_REKEY_ON_BIND, GreeSimulator
+from .transport import GreeTransportPool, PooledGreeDevice, decrypt_pack, generic_key
+
+
+def _device(unit, pool: GreeTransportPool) -> PooledGreeDevice:
+    return PooledGreeDevice(DeviceInfo(unit.host, unit.port, unit.mac, unit.name), pool)
+
+
+async def test_fleet_binds_polls_and_commands() -> None:
+    """Test ECB and GCM units bind, report and apply commands over real UDP."""
+    pool = GreeTransportPool(size=1)
+    async with GreeSimulator(4, seed=1) as simulator:
+        simulator.units[1].cipher = CIPHER_GCM
+        simulator.units[2].quirks = frozenset({QUIRK_NO_CID})
+        devices = [_device(unit, pool) for unit in simulator.units]
+        devices[1].cipher = CIPHER_GCM
+
+        await asyncio.gather(*(device.update_state() for device in devices))
+        assert [device.device_key for device in devices] == [unit.key for unit in simulator.units]
+        assert all(device.power for device in devices)
+
+        devices[2].light = False
+        ack = await devices[2].push_state_update()
+        assert ack == {GREE_PROPERTY_LIGHT: 0}
+        assert simulator.units[2].properties[GREE_PROPERTY_LIGHT] == 0
+    pool.close()
+
+
+async def test_scan_reply() -> None:
+    """Test a unit answers a plain scan with its encrypted device info."""
+    async with GreeSimulator(1, cipher=CIPHER_GCM) as simulator:
+        unit = simulator.units[0]
+        loop = asyncio.get_running_loop()
+        reply = loop.create_future()
+
+        class Client(asyncio.DatagramProtocol):
+            def datagram_received(self, data, addr):
+                reply.set_result(json.loads(data))
+
+        transport, _ = await loop.create_datagram_endpoint(Client, remote_addr=(unit.host, unit.port))
+        transport.sendto(json.dumps({"t": "scan"}).encode())
+        packet = await asyncio.wait_for(reply, 1)
+        transport.close()
+
+    pack = decrypt_pack(packet["pack"], generic_key(CIPHER_GCM), CIPHER_GCM, packet["tag"])
+    assert pack["mac"] == unit.mac
+
+
+async def test_loss_and_rekey() -> None:
+    """Test dropped requests time out and a rebind invalidates the old key."""
+    pool = GreeTransportPool(size=1)
+    async with GreeSimulator(1, quirks=[QUIRK_REKEY_ON_BIND], seed=2) as simulator:
+        unit = simulator.units[0]
+        device = _device(unit, pool)
+        await device.bind()
+        old_key = device.device_key
+
+        await pool.async_bind(device.device_info, timeout=1) # Someone else binds
+        assert unit.key != old_key
+
+        unit.loss = 1.0
+        with pytest.raises(DeviceTimeoutError):
+            await device.probe(0.1)
+        assert unit.dropped == 1
+    pool.close()
@@ -0,0 +1,33 @@
+"""Tests for the Gree device telemetry."""
+from .telemetry import GreeDeviceTelemetry, LatencyStats
+
+
+def test_latency_stats_track_average_and_p95() -> None:
+    """Test the moving average follows new samples and p95 comes from the histogram."""
+    stats = LatencyStats()
+    assert stats.p95 is None
+
+    for _ in range(95):
+        stats.add(40)
+    for _ in range(5):
+        stats.add(900)
+
+    assert stats.last == 900
+    assert 40 < stats.ewma < 900
+    assert stats.p95 == 50
+    stats.add(900)
+    assert stats.p95 == 1000
+
+
+def test_timeout_rate_recovers() -> None:
+    """Test the timeout rate reflects recent polls rather than the whole history."""
+    telemetry = GreeDeviceTelemetry()
+    for _ in range(10):
+        telemetry.record_timeout(10.0)
+    assert telemetry.timeout_rate > 80
+
+    for _ in range(30):
+        telemetry.record_poll(0.05)
+    assert telemetry.timeout_rate < 1
+    assert telemetry.timeouts == 10
+    assert telemetry.polls == 40
@@ -0,0 +1,241 @@
+"""Tests for the shared Gree UDP transport."""
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+from greeclimate.device import DeviceInfo
+from greeclimate.exceptions import DeviceTimeoutError
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from .const import CIPHER_ECB, CIPHER_GCM, DATA_TRANSPORT_POOL, DOMAIN
+from .simulator import GreeSimulator
+from .transport import (
+    DeviceKeyRejectedError,
+    GreeTransportPool,
+    PooledGreeDevice,
+    async_acquire_transport_pool,
+    async_release_transport_pool,
+    decrypt_pack,
+    encrypt_pack,
+    generic_key,
+)
+
+DEVICE_KEY = "0123456789abcdef"
+
+
+class FakeUnit(asyncio.DatagramProtocol):
+    """Minimal Gree unit answering bind, status and cmd packets."""
+
+    def __init__(self, mac: str, cipher: str = CIPHER_ECB) -> None:
+        """Initialize the fake unit."""
+        self.mac = mac
+        self.cipher = cipher
+        self.transport = None
+
+    def connection_made(self, transport) -> None:
+        """Store the transport."""
+        self.transport = transport
+
+    def datagram_received(self, data, addr) -> None:
+        """Answer a request encrypted with the matching key."""
+        obj = json.loads(data)
+        key = generic_key(self.cipher) if obj.get("i") == 1 else DEVICE_KEY
+        try:
+            pack = decrypt_pack(obj["pack"], key, self.cipher, obj.get("tag"))
+        except ValueError:
+            return # Real units ignore packets they cannot decrypt
+        if pack["t"] == "bind":
+            reply = {"t": "bindok", "mac": self.mac, "key": DEVICE_KEY}
+        elif pack["t"] == "status":
+            values = ["362001000762+U-CS532AE(LT)V3.31.bin" if c == "hid" else 1 for c in pack["cols"]]
+            reply = {"t": "dat", "cols": pack["cols"], "dat": values}
+        else:
+            reply = {"t": "res", "opt": pack["opt"], "p": pack["p"], "val": pack["p"]}
+        packet = {"t": "pack", "i": obj.get("i", 0), "uid": 0, "cid": self.mac, "tcid": ""}
+        packet["pack"], tag = encrypt_pack(reply, key, self.cipher)
+        if tag:
+            packet["tag"] = tag
+        self.transport.sendto(json.dumps(packet).encode(), addr)
+
+
+async def _start_unit(mac: str, cipher: str = CIPHER_ECB) -> tuple:
+    transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+        lambda: FakeUnit(mac, cipher), local_addr=("127.0.0.1", 0)
+    )
+    return transport, transport.get_extra_info("sockname")[1]
+
+
+async def test_devices_share_one_socket() -> None:
+    """Test many devices are multiplexed over a single endpoint."""
+    pool = GreeTransportPool(size=1)
+    units = [await _start_unit(f"aabbcc0000{i:02x}") for i in range(10)]
+    devices = [
+        PooledGreeDevice(DeviceInfo("127.0.0.1", port, f"aabbcc0000{i:02x}", f"unit {i}"), pool)
+        for i, (_, port) in enumerate(units)
+    ]
+
+    await asyncio.gather(*(device.update_state() for device in devices))
+
+    assert all(device.device_key == DEVICE_KEY for device in devices)
+    assert all(device.power for device in devices)
+    assert pool.endpoint_for("aabbcc000000").pending_count == 0
+
+    pool.close()
+    for transport, _ in units:
+        transport.close()
+
+
+async def test_timeout_releases_pending_request() -> None:
+    """Test a silent device times out without leaving a pending request."""
+    pool = GreeTransportPool(size=1)
+    device_info = DeviceInfo("127.0.0.1", 9, "ffffffffffff", "silent")
+
+    with pytest.raises(asyncio.TimeoutError):
+        await pool.async_bind(device_info, timeout=0.1)
+
+    assert pool.endpoint_for("ffffffffffff").pending_count == 0
+    pool.close()
+
+
+async def test_bind_detects_gcm_device() -> None:
+    """Test binding falls back to GCM and later requests keep using it."""
+    pool = GreeTransportPool(size=1)
+    transport, port = await _start_unit("aabbcc000001", CIPHER_GCM)
+    device = PooledGreeDevice(DeviceInfo("127.0.0.1", port, "aabbcc000001", "gcm unit"), pool)
+    pool_bind = pool.async_bind
+
+    async def short_bind(device_info, timeout=None, cipher=CIPHER_ECB):
+        return await pool_bind(device_info, timeout=0.2, cipher=cipher) # ECB attempt times out fast
+
+    pool.async_bind = short_bind
+    await device.update_state()
+
+    assert device.cipher == CIPHER_GCM
+    assert device.device_key == DEVICE_KEY
+    assert device.power
+
+    pool.close()
+    transport.close()
+
+
+async def test_pool_is_shared_and_released(hass: HomeAssistant) -> None:
+    """Test all users get the same pool and the last release closes it."""
+    first = async_acquire_transport_pool(hass)
+    second = async_acquire_transport_pool(hass)
+    assert first is second
+    assert first.users == 2
+
+    async_release_transport_pool(hass)
+    assert hass.data[DOMAIN][DATA_TRANSPORT_POOL] is first
+
+    async_release_transport_pool(hass)
+    assert DATA_TRANSPORT_POOL not in hass.data[DOMAIN]
+
+
+async def test_partial_poll_keeps_other_properties() -> None:
+    """Test polling a subset of keys merges into the known properties."""
+    pool = GreeTransportPool(size=1)
+    transport, port = await _start_unit("aabbcc000001")
+    device = PooledGreeDevice(DeviceInfo("127.0.0.1", port, "aabbcc000001", "unit"), pool)
+
+    await device.update_state()
+    device._properties["Lig"] = 0
+    await device.update_state(["Pow", "SetTem"])
+
+    assert device._properties["Lig"] == 0
+    assert device._properties["Pow"] == 1
+
+    pool.close()
+    transport.close()
+
+
+async def test_late_reply_of_cancelled_request_is_dropped() -> None:
+    """Test a cancelled poll's late reply is not taken for the next command's ack."""
+    pool = GreeTransportPool(size=1)
+    async with GreeSimulator(1, latency=0.2) as simulator:
+        unit = simulator.units[0]
+        device = PooledGreeDevice(DeviceInfo(unit.host, unit.port, unit.mac, unit.name), pool)
+        device.device_key = unit.key
+        device._properties = dict(unit.properties)
+
+        poll = asyncio.ensure_future(device.update_state(["Pow", "Lig"]))
+        await asyncio.sleep(0.05)
+        poll.cancel() # Preempted: the status request is already on the wire
+        device.light = False
+        ack = await device.push_state_update()
+
+        assert ack == {"Lig": 0}
+        assert unit.properties["Lig"] == 0
+        await asyncio.sleep(0.3) # The command's own reply is long gone too
+        assert pool.endpoint_for(unit.mac).pending_count == 0
+    pool.close()
+
+
+
+async def test_reply_in_another_key_is_reported() -> None:
+    """Test a unit answering in a key other than the request's raises DeviceKeyRejectedError."""
+
+    class RekeyedUnit(FakeUnit):
+        def datagram_received(self, data, addr) -> None:
+            reply = {"t": "dat", "cols": ["Pow"], "dat": [1]}
+            packet = {"t": "pack", "i": 0, "uid": 0, "cid": self.mac, "tcid": ""}
+            packet["pack"], _ = encrypt_pack(reply, "fedcba9876543210", self.cipher)
+            self.transport.sendto(json.dumps(packet).encode(), addr)
+
+    pool = GreeTransportPool(size=1)
+    transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+        lambda: RekeyedUnit("aabbcc000001"), local_addr=("127.0.0.1", 0)
+    )
+    info = DeviceInfo("127.0.0.1", transport.get_extra_info("sockname")[1], "aabbcc000001", "unit")
+
+    with pytest.raises(DeviceKeyRejectedError):
+        await pool.async_request_state(["Pow"], info, DEVICE_KEY, timeout=0.2)
+    transport.close()
+    pool.close()
+
+
+async def test_non_object_json_is_dropped() -> None:
+    """Test packets and packs that decode to something other than an object are ignored."""
+
+    class BrokenUnit(FakeUnit):
+        def datagram_received(self, data, addr) -> None:
+            self.transport.sendto(b"[1, 2]", addr)
+            packet = {"t": "pack", "i": 0, "uid": 0, "cid": self.mac, "tcid": ""}
+            packet["pack"], packet["tag"] = encrypt_pack(["Pow", 1], DEVICE_KEY, self.cipher)
+            self.transport.sendto(json.dumps(packet).encode(), addr)
+
+    loop = asyncio.get_running_loop()
+    errors = []
+    loop.set_exception_handler(lambda _, context: errors.append(context))
+    pool = GreeTransportPool(size=1)
+    transport, _ = await loop.create_datagram_endpoint(
+        lambda: BrokenUnit("aabbcc000001", CIPHER_GCM), local_addr=("127.0.0.1", 0)
+    )
+    info = DeviceInfo("127.0.0.1", transport.get_extra_info("sockname")[1], "aabbcc000001", "unit")
+
+    with pytest.raises(asyncio.TimeoutError):
+        await pool.async_request_state(["Pow"], info, DEVICE_KEY, timeout=0.2, cipher=CIPHER_GCM)
+    assert not errors # Nothing raised in the protocol callback
+    loop.set_exception_handler(None)
+    transport.close()
+    pool.close()
+
+
+async def test_known_cipher_is_not_swapped_on_timeout() -> None:
+    """Test a bind timeout only falls back to the other cipher while the cipher is unknown."""
+    pool = GreeTransportPool(size=1)
+    pool.async_bind = AsyncMock(side_effect=asyncio.TimeoutError)
+    device = PooledGreeDevice(DeviceInfo("127.0.0.1", 7000, "aabbcc000001", "unit"), pool)
+
+    with pytest.raises(DeviceTimeoutError):
+        await device.bind()
+    assert pool.async_bind.await_count == 2
+
+    pool.async_bind.reset_mock()
+    device.cipher_known = True
+    with pytest.raises(DeviceTimeoutError):
+        await device.bind()
+    assert pool.async_bind.await_count == 1
+    assert device.cipher == CIPHER_ECB
@@ -0,0 +1,447 @@
+"""Shared UDP transport for all Gree devices of the integration.
+
+greeclimate opens a fresh datagram endpoint for every bind, status and cmd
+request. With many indoor units that means many sockets and reader callbacks,
+so all coordinators share one small pool of sockets instead. Requests are
+multiplexed on a socket and replies are routed back by the device MAC (the
+plain-text "cid" of the reply) or, failing that, by the sender address.
+
+Packets are encrypted with AES-ECB like greeclimate does, or with AES-GCM
+for newer firmware that greeclimate 1.x cannot talk to.
+"""
+import asyncio
+import base64
+from collections import deque
+import json
+import logging
+import re
+import zlib
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+try:
+    from greeclimate.device import (
+        Device as GreeClimateLibDevice,
+        Props as GreePropsEnum,
+        TEMP_OFFSET,
+    )
+    from greeclimate.exceptions import DeviceTimeoutError, DeviceNotBoundError
+    from greeclimate.network import DatagramStream, GENERIC_KEY
+    from Crypto.Cipher import AES # pycryptodome, a greeclimate requirement
+except ImportError as e:
+    _LOGGER.critical("Transport: Failed to import from greeclimate: %s. Check library installation.", e)
+    GreeClimateLibDevice = object # Dummy base class to prevent further import errors
+    GreePropsEnum = None
+    TEMP_OFFSET = 40
+    DatagramStream = None
+    GENERIC_KEY = None
+    AES = None
+    DeviceTimeoutError = type("DeviceTimeoutError", (Exception,), {})
+    DeviceNotBoundError = type("DeviceNotBoundError", (Exception,), {})
+
+from .const import (
+    DOMAIN, DATA_TRANSPORT_POOL, TRANSPORT_POOL_SIZE, REQUEST_TIMEOUT,
+    CIPHER_ECB, CIPHER_GCM,
+)
+
+
+class DeviceKeyRejectedError(DeviceNotBoundError):
+    """The device answered, but not with the key it was addressed with."""
+
+IPAddr = Tuple[str, int]
+
+# AES-GCM parameters used by the official app for newer firmware
+GCM_GENERIC_KEY = "{yxAHAY_Lm6pbC/<"
+_GCM_NONCE = b"\x54\x40\x78\x44\x49\x67\x5a\x51\x6c\x5e\x63\x13"
+_GCM_AAD = b"qualcomm-test"
+
+
+def generic_key(cipher: str) -> str:
+    """Key used for bind and scan packets before the device key is known."""
+    return GCM_GENERIC_KEY if cipher == CIPHER_GCM else GENERIC_KEY
+
+
+def encrypt_pack(pack: Dict[str, Any], key: str, cipher: str = CIPHER_ECB) -> Tuple[str, Optional[str]]:
+    """Encrypt a pack, returns (pack, tag); the tag is None for ECB."""
+    if cipher != CIPHER_GCM:
+        return DatagramStream.encrypt_payload(pack, key), None
+    aes = AES.new(key.encode(), AES.MODE_GCM, nonce=_GCM_NONCE)
+    aes.update(_GCM_AAD)
+    encrypted, tag = aes.encrypt_and_digest(json.dumps(pack).encode())
+    return base64.b64encode(encrypted).decode(), base64.b64encode(tag).decode()
+
+
+def decrypt_pack(data: str, key: str, cipher: str = CIPHER_ECB, tag: Optional[str] = None) -> Dict[str, Any]:
+    """Decrypt a pack. Raises ValueError if it was not encrypted with key."""
+    if cipher != CIPHER_GCM:
+        return DatagramStream.decrypt_payload(data, key)
+    aes = AES.new(key.encode(), AES.MODE_GCM, nonce=_GCM_NONCE)
+    aes.update(_GCM_AAD)
+    if tag:
+        decrypted = aes.decrypt_and_verify(base64.b64decode(data), base64.b64decode(tag))
+    else:
+        decrypted = aes.decrypt(base64.b64decode(data))
+    return json.loads(decrypted)
+
+
+# Pack type of the reply each request type expects
+REPLY_BIND = "bindok"
+REPLY_STATUS = "dat"
+REPLY_CMD = "res"
+
+
+class _PendingRequest:
+    """A request waiting for its reply on a shared endpoint."""
+
+    __slots__ = ("future", "key", "cipher", "reply", "garbled")
+
+    def __init__(self, future: asyncio.Future, key: str, cipher: str, reply: Optional[str]) -> None:
+        self.future = future
+        self.key = key
+        self.cipher = cipher
+        self.reply = reply # Expected pack type, None for any
+        self.garbled = False # The device sent something this key cannot decrypt
+
+
+class GreeUdpEndpoint(asyncio.DatagramProtocol):
+    """One UDP socket carrying the traffic of many devices."""
+
+    def __init__(self) -> None:
+        self._transport: Optional[asyncio.DatagramTransport] = None
+        self._start_lock: Optional[asyncio.Lock] = None
+        self._pending: Dict[Any, Deque[_PendingRequest]] = {}
+        self._mac_by_addr: Dict[IPAddr, str] = {}
+
+    @property
+    def pending_count(self) -> int:
+        """Number of requests currently waiting for a reply."""
+        return sum(len(queue) for queue in self._pending.values())
+
+    async def _async_ensure_started(self) -> None:
+        """Open the socket on first use."""
+        if self._transport is not None:
+            return
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._transport is None:
+                loop = asyncio.get_running_loop()
+                await loop.create_datagram_endpoint(lambda: self, local_addr=("0.0.0.0", 0))
+
+    def connection_made(self, transport: asyncio.DatagramTransport) -> None:
+        self._transport = transport
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        if exc is not None:
+            _LOGGER.warning("Shared Gree UDP socket closed unexpectedly: %s", exc)
+        self._transport = None
+        for queue in self._pending.values():
+            for request in queue:
+                if not request.future.done():
+                    request.future.set_exception(exc or ConnectionError("Gree UDP socket closed"))
+        self._pending.clear()
+
+    def error_received(self, exc: Exception) -> None:
+        # ICMP errors (e.g. port unreachable) cannot be tied to a request; the
+        # affected request simply times out like it would with greeclimate.
+        _LOGGER.debug("Shared Gree UDP socket reported an error: %s", exc)
+
+    def datagram_received(self, data: bytes, addr: IPAddr) -> None:
+        if not data:
+            return
+        try:
+            obj = json.loads(data)
+        except ValueError:
+            _LOGGER.debug("Dropping malformed packet from %s", addr[0])
+            return
+        if not isinstance(obj, dict):
+            _LOGGER.debug("Dropping malformed packet from %s", addr[0])
+            return
+
+        route = None
+        cid = obj.get("cid")
+        if cid and cid.lower() in self._pending:
+            route = cid.lower()
+        elif addr[:2] in self._pending:
+            route = addr[:2]
+        elif self._mac_by_addr.get(addr[:2]) in self._pending:
+            route = self._mac_by_addr[addr[:2]]
+        if route is None:
+            _LOGGER.debug("Dropping unsolicited packet from %s (cid: %s)", addr[0], cid)
+            return
+
+        # A request that was cancelled (preempted poll, deadline) may still get
+        # its reply late. Only hand a reply to a request expecting that pack
+        # type, so it cannot be taken for the answer to the next request.
+        queue = self._pending[route]
+        packed = obj.get("pack")
+        decrypted: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+        failed: List[_PendingRequest] = []
+        for request in queue:
+            if packed:
+                key = generic_key(request.cipher) if obj.get("i") == 1 else request.key
+                if (key, request.cipher) not in decrypted:
+                    try:
+                        decrypted[key, request.cipher] = decrypt_pack(packed, key, request.cipher, obj.get("tag"))
+                    except (ValueError, UnicodeDecodeError) as e:
+                        _LOGGER.debug("Packet from %s does not decrypt with %s key: %s", addr[0], request.cipher, e)
+                        decrypted[key, request.cipher] = None
+                pack = decrypted[key, request.cipher]
+                if pack is None:
+                    failed.append(request)
+                    continue
+                if not isinstance(pack, dict):
+                    _LOGGER.debug("Dropping packet from %s with a malformed pack", addr[0])
+                    return
+                if request.reply is not None and pack.get("t") != request.reply:
+                    continue
+                obj["pack"] = pack
+            break
+        else:
+            _LOGGER.debug("Dropping stale or undecryptable packet from %s", addr[0])
+            for request in failed:
+                request.garbled = True
+            return
+
+        queue.remove(request)
+        if not queue:
+            del self._pending[route]
+        if not request.future.done():
+            request.future.set_result(obj)
+
+    async def async_request(
+        self, addr: IPAddr, payload: Dict[str, Any], key: str,
+        mac: Optional[str] = None, timeout: float = REQUEST_TIMEOUT, cipher: str = CIPHER_ECB,
+        reply: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Send a packet and wait for the reply routed back to it.
+
+        Raises asyncio.TimeoutError if the device does not answer in time. A
+        reply that is not of the pack type given by reply is treated like no
+        reply. If the device answered only with packets that do not decrypt
+        with the key, DeviceKeyRejectedError is raised instead of the timeout.
+        """
+        await self._async_ensure_started()
+
+        route = mac.lower() if mac else addr
+        if mac:
+            self._mac_by_addr[addr] = route
+        request = _PendingRequest(asyncio.get_running_loop().create_future(), key, cipher, reply)
+        self._pending.setdefault(route, deque()).append(request)
+
+        packet = dict(payload)
+        if packet.get("pack"):
+            packet["pack"], tag = encrypt_pack(packet["pack"], key, cipher)
+            if tag:
+                packet["tag"] = tag
+        try:
+            self._transport.sendto(json.dumps(packet).encode(), addr)
+            return await asyncio.wait_for(request.future, timeout)
+        except asyncio.TimeoutError:
+            if request.garbled:
+                raise DeviceKeyRejectedError(f"Reply from {addr[0]} does not decrypt with the {cipher} key") from None
+            raise
+        finally:
+            queue = self._pending.get(route)
+            if queue and request in queue:
+                queue.remove(request)
+                if not queue:
+                    del self._pending[route]
+
+    def close(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+
+class GreeTransportPool:
+    """A few shared UDP endpoints; each device sticks to one of them by MAC."""
+
+    def __init__(self, size: int = TRANSPORT_POOL_SIZE) -> None:
+        self._endpoints: List[GreeUdpEndpoint] = [GreeUdpEndpoint() for _ in range(max(1, size))]
+        self.users = 0
+
+    def endpoint_for(self, mac: str) -> GreeUdpEndpoint:
+        return self._endpoints[zlib.crc32(mac.lower().encode()) % len(self._endpoints)]
+
+    async def async_bind(
+        self, device_info, timeout: float = REQUEST_TIMEOUT, cipher: str = CIPHER_ECB,
+    ) -> Optional[str]:
+        """Negotiate the device key (same packet as greeclimate's bind_device)."""
+        pack = {"mac": device_info.mac, "t": "bind", "uid": 0}
+        if cipher == CIPHER_GCM:
+            pack["cid"] = device_info.mac
+        payload = {"cid": "app", "i": 1, "t": "pack", "uid": 0, "tcid": device_info.mac, "pack": pack}
+        reply = await self.endpoint_for(device_info.mac).async_request(
+            (device_info.ip, device_info.port), payload, generic_key(cipher), device_info.mac, timeout, cipher, REPLY_BIND
+        )
+        return reply["pack"].get("key")
+
+    async def async_request_state(
+        self, properties: List[str], device_info, key: str,
+        timeout: float = REQUEST_TIMEOUT, cipher: str = CIPHER_ECB,
+    ) -> Dict[str, Any]:
+        """Request the given properties, returns {property: value}."""
+        payload = {
+            "cid": "app", "i": 0, "t": "pack", "uid": 0, "tcid": device_info.mac,
+            "pack": {"mac": device_info.mac, "t": "status", "cols": list(properties)},
+        }
+        reply = await self.endpoint_for(device_info.mac).async_request(
+            (device_info.ip, device_info.port), payload, key, device_info.mac, timeout, cipher, REPLY_STATUS
+        )
+        return dict(zip(reply["pack"]["cols"], reply["pack"]["dat"]))
+
+    async def async_send_state(
+        self, property_values: Dict[str, Any], device_info, key: str,
+        timeout: float = REQUEST_TIMEOUT, cipher: str = CIPHER_ECB,
+    ) -> Dict[str, Any]:
+        """Send a cmd packet, returns the values acknowledged by the device."""
+        payload = {
+            "cid": "app", "i": 0, "t": "pack", "uid": 0, "tcid": device_info.mac,
+            "pack": {"opt": list(property_values.keys()), "p": list(property_values.values()), "t": "cmd"},
+        }
+        reply = await self.endpoint_for(device_info.mac).async_request(
+            (device_info.ip, device_info.port), payload, key, device_info.mac, timeout, cipher, REPLY_CMD
+        )
+        # Some devices only return "p" and not both "p" and "val"
+        values = reply["pack"].get("val") or reply["pack"].get("p")
+        return dict(zip(reply["pack"]["opt"], values))
+
+    def close(self) -> None:
+        for endpoint in self._endpoints:
+            endpoint.close()
+
+
+@callback
+def async_acquire_transport_pool(hass: HomeAssistant) -> GreeTransportPool:
+    """Return the integration-wide transport pool, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    pool: Optional[GreeTransportPool] = domain_data.get(DATA_TRANSPORT_POOL)
+    if pool is None:
+        pool = domain_data[DATA_TRANSPORT_POOL] = GreeTransportPool()
+        _LOGGER.debug("Created shared Gree transport pool")
+    pool.users += 1
+    return pool
+
+
+@callback
+def async_release_transport_pool(hass: HomeAssistant) -> None:
+    """Drop one user of the pool and close its sockets when nobody is left."""
+    domain_data = hass.data.get(DOMAIN, {})
+    pool: Optional[GreeTransportPool] = domain_data.get(DATA_TRANSPORT_POOL)
+    if pool is None:
+        return
+    pool.users -= 1
+    if pool.users <= 0:
+        pool.close()
+        domain_data.pop(DATA_TRANSPORT_POOL)
+        _LOGGER.debug("Closed shared Gree transport pool")
+
+
+class PooledGreeDevice(GreeClimateLibDevice):
+    """greeclimate Device whose bind/status/cmd packets go through the pool.
+
+    Property handling (dirty tracking, temperature conversion) is left to the
+    library; only the network calls are replaced. Unlike the library,
+    push_state_update() returns the values acknowledged by the device, and
+    bind() also finds out whether the device speaks ECB or GCM.
+    """
+
+    def __init__(self, device_info, pool: GreeTransportPool) -> None:
+        super().__init__(device_info)
+        self._pool = pool
+        self.cipher = CIPHER_ECB
+        self.cipher_known = False # Set once a bind or the caller settled it
+
+    async def bind(self, key=None, cipher=None):
+        """Use the given key, or negotiate one.
+
+        The other cipher is only tried while the device's cipher is not known
+        yet; once it is, a timeout just means the device did not answer.
+        """
+        if not self.device_info:
+            raise DeviceNotBoundError
+        if cipher:
+            self.cipher = cipher
+            self.cipher_known = True
+        if key:
+            self.device_key = key
+            return
+        other = CIPHER_GCM if self.cipher == CIPHER_ECB else CIPHER_ECB
+        for attempt in (self.cipher,) if self.cipher_known else (self.cipher, other):
+            try:
+                self.device_key = await self._pool.async_bind(self.device_info, cipher=attempt)
+            except asyncio.TimeoutError:
+                _LOGGER.debug("%s: No %s bind reply", self.device_info.mac, attempt)
+                continue
+            self.cipher = attempt
+            self.cipher_known = True
+            break
+        else:
+            raise DeviceTimeoutError
+        if not self.device_key:
+            raise DeviceNotBoundError
+
+    async def probe(self, timeout: float) -> None:
+        """Single-shot reachability check: one status request with the current key."""
+        if not self.device_key:
+            raise DeviceNotBoundError
+        try:
+            await self._pool.async_request_state(
+                [GreePropsEnum.POWER.value], self.device_info, self.device_key, timeout, self.cipher
+            )
+        except asyncio.TimeoutError as e:
+            raise DeviceTimeoutError from e
+
+    async def request_version(self) -> None:
+        ret = await self._pool.async_request_state(
+            ["hid"], self.device_info, self.device_key, cipher=self.cipher
+        )
+        self.hid = ret.get("hid")
+        # Ex: hid = 362001000762+U-CS532AE(LT)V3.31.bin
+        if self.hid:
+            match = re.search(r"(?<=V)([\d.]+)\.bin$", self.hid)
+            self.version = match and match.group(1)
+
+    async def update_state(self, properties: Optional[List[str]] = None):
+        """Poll the device. With properties, only those are requested and merged in."""
+        if not self.device_key:
+            await self.bind()
+        props = list(properties) if properties else [x.value for x in GreePropsEnum]
+        try:
+            state = await self._pool.async_request_state(
+                props, self.device_info, self.device_key, cipher=self.cipher
+            )
+            if properties and self._properties:
+                self._properties.update(state)
+            else:
+                self._properties = state
+            if not self.hid:
+                await self.request_version()
+            temp = self.get_property(GreePropsEnum.TEMP_SENSOR)
+            if temp and temp <= TEMP_OFFSET:
+                self.version = "4.0"
+        except asyncio.TimeoutError as e:
+            raise DeviceTimeoutError from e
+
+    async def push_state_update(self):
+        if not self._dirty:
+            return
+        if not self.device_key:
+            await self.bind()
+
+        props = {}
+        for name in self._dirty:
+            props[name] = self._properties.get(name)
+            if name == GreePropsEnum.TEMP_SET.value:
+                props[GreePropsEnum.TEMP_BIT.value] = self._properties.get(GreePropsEnum.TEMP_BIT.value)
+                props[GreePropsEnum.TEMP_UNIT.value] = self._properties.get(GreePropsEnum.TEMP_UNIT.value)
+        self._dirty.clear()
+
+        try:
+            return await self._pool.async_send_state(props, self.device_info, self.device_key, cipher=self.cipher)
+        except asyncio.TimeoutError as e:
+            raise DeviceTimeoutError from e
@@ -0,0 +1 @@
+"""Development scripts for the Gree integration, not shipped with it."""
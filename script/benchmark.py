@@ -0,0 +1,176 @@
+"""Scale benchmark: many coordinators and their entities in one event loop.
+
+Each run starts N simulated units (custom_components/gree/simulator.py), one
+coordinator per unit with its climate and switch entities on mock entity
+platforms, and then measures:
+
+- event loop CPU per poll cycle, i.e. one refresh of every coordinator,
+  without the CPU the in-process simulator spends answering (reported
+  separately),
+- state writes per second and per cycle,
+- bytes allocated per poll (tracemalloc peak over one extra cycle, the
+  simulator's share included),
+- command latency while a poll cycle is running.
+
+Between cycles a third of the units change their room temperature, so the
+numbers cover both changed and suppressed updates. Results are printed as
+JSON to compare across commits. Needs the Home Assistant test helpers
+(tests.common), like the unit tests:
+
+    python -m script.benchmark --devices 10 100 500 --output bench.json
+
+It lives outside the integration so the shipped package doesn't depend on
+the test helpers.
+"""
+import argparse
+import asyncio
+import json
+import platform
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+from homeassistant.const import CONF_HOST, CONF_MAC, CONF_NAME, CONF_PORT
+from homeassistant.core import HomeAssistant
+
+from custom_components.gree.climate import GreeClimateEntity
+from custom_components.gree.const import DOMAIN, GREE_PROPERTY_CURRENT_TEMPERATURE, GREE_PROPERTY_LIGHT
+from custom_components.gree.coordinator import GreeClimateUpdateCoordinator
+from custom_components.gree.simulator import GreeSimulator
+from custom_components.gree.switch import SWITCH_DESCRIPTIONS, GreeSwitch
+
+from tests.common import MockConfigEntry, MockEntityPlatform
+
+DEFAULT_DEVICE_COUNTS = (10, 100, 500)
+DEFAULT_CYCLES = 5
+COMMAND_SHARE = 0.1 # Fraction of the units commanded during the loaded cycle
+
+
+def _percentile(values: List[float], fraction: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 3)
+
+
+async def async_run_benchmark(
+    hass: HomeAssistant, count: int, cycles: int = DEFAULT_CYCLES, latency: float = 0.0,
+) -> Dict[str, Any]:
+    """Benchmark count coordinators against simulated units; returns the figures."""
+    simulator = GreeSimulator(count, latency=latency, seed=count)
+    await simulator.async_start()
+    coordinators: List[GreeClimateUpdateCoordinator] = []
+    writes = 0
+
+    def counting(write):
+        def write_ha_state() -> None:
+            nonlocal writes
+            writes += 1
+            write()
+        return write_ha_state
+
+    try:
+        climate_platform = MockEntityPlatform(hass, domain="climate", platform_name=DOMAIN)
+        switch_platform = MockEntityPlatform(hass, domain="switch", platform_name=DOMAIN)
+        for unit in simulator.units:
+            entry = MockConfigEntry(domain=DOMAIN, title=unit.name, data={
+                CONF_NAME: unit.name, CONF_HOST: unit.host, CONF_PORT: unit.port, CONF_MAC: unit.mac,
+            })
+            entry.add_to_hass(hass)
+            coordinator = GreeClimateUpdateCoordinator(hass, entry)
+            await coordinator.async_refresh() # First data, entities are created from it
+            coordinators.append(coordinator)
+            climate = [GreeClimateEntity(coordinator)]
+            switches = [GreeSwitch(coordinator, description) for description in SWITCH_DESCRIPTIONS]
+            for entity in climate + switches:
+                entity.async_write_ha_state = counting(entity.async_write_ha_state)
+            await climate_platform.async_add_entities(climate)
+            await switch_platform.async_add_entities(switches)
+        await hass.async_block_till_done()
+
+        async def poll_cycle(cycle: int) -> None:
+            for index, unit in enumerate(simulator.units):
+                if index % 3 == cycle % 3:
+                    unit.properties[GREE_PROPERTY_CURRENT_TEMPERATURE] += 1 if cycle % 2 else -1
+            await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+
+        writes = 0
+        simulator_cpu_start = simulator.cpu_time
+        cpu_start, wall_start = time.process_time(), time.perf_counter()
+        for cycle in range(cycles):
+            await poll_cycle(cycle)
+        simulator_cpu = simulator.cpu_time - simulator_cpu_start
+        cpu = time.process_time() - cpu_start - simulator_cpu # The units' crypto is not ours
+        wall = time.perf_counter() - wall_start
+        cycle_writes = writes
+
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        await poll_cycle(cycles)
+        _, alloc_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # Commands racing a full poll cycle
+        latencies: List[float] = []
+
+        async def command(coordinator: GreeClimateUpdateCoordinator) -> None:
+            started = time.perf_counter()
+            await coordinator.async_set_light(not coordinator.data.get(GREE_PROPERTY_LIGHT))
+            latencies.append((time.perf_counter() - started) * 1000)
+
+        commanded = coordinators[:: max(1, round(1 / COMMAND_SHARE))]
+        await asyncio.gather(poll_cycle(cycles + 1), *(command(coordinator) for coordinator in commanded))
+        await hass.async_block_till_done()
+    finally:
+        for coordinator in coordinators:
+            await coordinator.async_shutdown()
+        simulator.close()
+
+    return {
+        "devices": count,
+        "cycles": cycles,
+        "loop_cpu_ms_per_cycle": round(cpu / cycles * 1000, 3),
+        "loop_cpu_us_per_poll": round(cpu / (cycles * count) * 1e6, 1),
+        "simulator_cpu_ms_per_cycle": round(simulator_cpu / cycles * 1000, 3),
+        "wall_ms_per_cycle": round(wall / cycles * 1000, 3),
+        "state_writes_per_cycle": round(cycle_writes / cycles, 1),
+        "state_writes_per_second": round(cycle_writes / wall, 1) if wall else None,
+        "alloc_peak_bytes_per_poll": round(alloc_peak / count),
+        "command_latency_ms": {
+            "count": len(latencies),
+            "p50": _percentile(latencies, 0.5),
+            "p95": _percentile(latencies, 0.95),
+            "max": round(max(latencies), 3) if latencies else None,
+        },
+        "simulator_requests": simulator.requests,
+    }
+
+
+async def _async_main(args: argparse.Namespace) -> Dict[str, Any]:
+    from tests.common import async_test_home_assistant
+
+    results = []
+    for count in args.devices:
+        async with async_test_home_assistant() as hass:
+            results.append(await async_run_benchmark(hass, count, args.cycles, args.latency))
+            await hass.async_stop(force=True)
+    return {"python": platform.python_version(), "results": results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark many Gree coordinators in one event loop.")
+    parser.add_argument("--devices", type=int, nargs="+", default=list(DEFAULT_DEVICE_COUNTS))
+    parser.add_argument("--cycles", type=int, default=DEFAULT_CYCLES)
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated device latency, seconds")
+    parser.add_argument("--output", help="write the JSON here instead of stdout")
+    args = parser.parse_args()
+    report = json.dumps(asyncio.run(_async_main(args)), indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
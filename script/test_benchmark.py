@@ -0,0 +1,17 @@
+"""Smoke test for the Gree scale benchmark."""
+from homeassistant.core import HomeAssistant
+
+from .benchmark import async_run_benchmark
+
+
+async def test_benchmark_reports_figures(hass: HomeAssistant) -> None:
+    """Test a small run completes and reports every figure."""
+    result = await async_run_benchmark(hass, 3, cycles=2)
+
+    assert result["devices"] == 3
+    assert result["loop_cpu_ms_per_cycle"] > 0
+    assert result["simulator_cpu_ms_per_cycle"] > 0
+    assert result["state_writes_per_cycle"] > 0
+    assert result["alloc_peak_bytes_per_poll"] > 0
+    assert result["command_latency_ms"]["count"] == 1
+    assert result["simulator_requests"] > 3 * 4